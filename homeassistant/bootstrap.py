@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 import contextlib
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import logging.handlers
 import os
@@ -27,6 +28,7 @@ from .helpers import area_registry, device_registry, entity_registry
 from .helpers.dispatcher import async_dispatcher_send
 from .helpers.typing import ConfigType
 from .setup import (
+    DATA_IMPORT_TIME,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -36,7 +38,7 @@ from .setup import (
 from .util import dt as dt_util
 from .util.async_ import gather_with_concurrency
 from .util.logging import async_activate_log_queue_handler
-from .util.package import async_get_user_site, is_virtual_env
+from .util.package import async_get_user_site, is_installed, is_virtual_env
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -57,6 +59,8 @@ WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
+# Integrations imported in the executor at the same time before setup
+MAX_PRELOAD_CONCURRENTLY = 4
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = ("homeassistant", "persistent_notification")
@@ -445,6 +449,45 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_preload_integrations(
+    hass: core.HomeAssistant, integrations: Iterable[loader.Integration]
+) -> None:
+    """Import integrations and their config flows in the executor.
+
+    Integrations whose requirements are not installed yet are imported by
+    their setup instead, so an outdated version of a requirement does not
+    get imported before the right one is installed.
+    """
+    import_time: dict[str, timedelta] = hass.data.setdefault(DATA_IMPORT_TIME, {})
+    skip_pip = hass.config.skip_pip
+
+    def _preload(integration: loader.Integration) -> float | None:
+        """Import an integration and return how long it took."""
+        if not skip_pip and not all(
+            is_installed(requirement) for requirement in integration.requirements
+        ):
+            return None
+        start = monotonic()
+        # Setup reports the errors when it imports the integration again
+        with contextlib.suppress(ImportError):
+            integration.get_component()
+            if integration.config_flow:
+                integration.get_platform("config_flow")
+        return monotonic() - start
+
+    integrations = list(integrations)
+    results = await gather_with_concurrency(
+        MAX_PRELOAD_CONCURRENTLY,
+        *(
+            hass.async_add_executor_job(_preload, integration)
+            for integration in integrations
+        ),
+    )
+    for integration, seconds in zip(integrations, results):
+        if seconds is not None:
+            import_time[integration.domain] = timedelta(seconds=seconds)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -497,6 +540,10 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import everything ahead of setup, so imports do not block the event
+    # loop and run in parallel instead of one integration at a time
+    await _async_preload_integrations(hass, integration_cache.values())
+
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
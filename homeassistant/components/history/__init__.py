@@ -20,7 +20,13 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import (
+    COMPRESSED_STATE_LAST_UPDATED,
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
@@ -36,6 +42,8 @@ import homeassistant.util.dt as dt_util
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "history"
+HISTORY_FILTERS = "history_filters"
+HISTORY_USE_INCLUDE_ORDER = "history_use_include_order"
 CONF_ORDER = "use_include_order"
 
 GLOB_TO_SQL_CHARS = {
@@ -96,11 +104,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     filters = sqlalchemy_filter_from_include_exclude_conf(conf)
 
     use_include_order = conf.get(CONF_ORDER)
+    hass.data[HISTORY_FILTERS] = filters
+    hass.data[HISTORY_USE_INCLUDE_ORDER] = use_include_order
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_get_numeric_states_during_period)
 
     return True
 
@@ -172,6 +183,105 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/numeric_states_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("include_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_get_numeric_states_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle numeric states websocket command."""
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str := msg.get("end_time"):
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = start_time + timedelta(days=1)
+
+    entity_ids = msg.get("entity_ids")
+    result = await hass.async_add_executor_job(
+        _get_numeric_states,
+        hass,
+        hass.data[HISTORY_FILTERS],
+        hass.data[HISTORY_USE_INCLUDE_ORDER],
+        start_time,
+        end_time,
+        entity_ids and [entity_id.lower() for entity_id in entity_ids],
+        msg["include_start_time_state"],
+        msg["significant_changes_only"],
+        msg["include_attributes"],
+    )
+    connection.send_result(msg["id"], result)
+
+
+def _get_numeric_states(
+    hass,
+    filters,
+    use_include_order,
+    start_time,
+    end_time,
+    entity_ids,
+    include_start_time_state,
+    significant_changes_only,
+    include_attributes,
+):
+    """Fetch numeric states from the database in the configured order."""
+    timer_start = time.perf_counter()
+
+    with session_scope(hass=hass) as session:
+        result = history.get_numeric_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            include_attributes,
+        )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug(
+            "Extracted %d numeric states in %fs",
+            sum(
+                len(columns[COMPRESSED_STATE_LAST_UPDATED])
+                for columns in result.values()
+            ),
+            elapsed,
+        )
+
+    # Optionally reorder the result to respect the ordering given
+    # by any entities explicitly included in the configuration.
+    if filters and use_include_order:
+        sorted_result = {
+            order_entity: result.pop(order_entity)
+            for order_entity in filters.included_entities
+            if order_entity in result
+        }
+        sorted_result.update(result)
+        result = sorted_result
+
+    return result
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -220,6 +330,8 @@ class HistoryPeriodView(HomeAssistantView):
         )
 
         minimal_response = "minimal_response" in request.query
+        numeric_response = "numeric_response" in request.query
+        include_attributes = "include_attributes" in request.query
 
         hass = request.app["hass"]
 
@@ -228,7 +340,22 @@ class HistoryPeriodView(HomeAssistantView):
             and entity_ids
             and not _entities_may_have_state_changes_after(hass, entity_ids, start_time)
         ):
-            return self.json([])
+            return self.json({} if numeric_response else [])
+
+        if numeric_response:
+            return cast(
+                web.Response,
+                await hass.async_add_executor_job(
+                    self._numeric_states_json,
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    include_attributes,
+                ),
+            )
 
         return cast(
             web.Response,
@@ -290,6 +417,31 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    def _numeric_states_json(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        include_attributes,
+    ):
+        """Fetch numeric states from the database as json."""
+        return self.json(
+            _get_numeric_states(
+                hass,
+                self.filters,
+                self.use_include_order,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                include_attributes,
+            )
+        )
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf: ConfigType) -> Filters | None:
     """Build a sql filter from config."""
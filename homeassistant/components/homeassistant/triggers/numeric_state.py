@@ -20,12 +20,10 @@ from homeassistant.helpers import (
     entity_registry as er,
     template,
 )
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
 from homeassistant.helpers.typing import ConfigType
 
+from .state_dispatch import UNPARSED, StateChange, async_get_dispatcher
+
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
 
@@ -80,6 +78,32 @@ async def async_validate_trigger_config(
     return config
 
 
+def _compile_comparator(below, above):
+    """Return a function comparing a number with fixed thresholds.
+
+    Returns None when a threshold is an entity that has to be looked up.
+    """
+    if isinstance(below, str) or isinstance(above, str):
+        return None
+    if below is None:
+        return lambda number: number > above
+    if above is None:
+        return lambda number: number < below
+    return lambda number: above < number < below
+
+
+def _check_number(change: StateChange, comparator, attribute):
+    """Compare the new value of a state change with fixed thresholds.
+
+    Returns None when the numeric_state condition has to check the change.
+    """
+    if (number := change.number(attribute)) is None:
+        return False
+    if number is UNPARSED:
+        return None
+    return comparator(number)
+
+
 async def async_attach_trigger(
     hass, config, action, automation_info, *, platform_type="numeric_state"
 ) -> CALLBACK_TYPE:
@@ -95,6 +119,8 @@ async def async_attach_trigger(
     period: dict = {}
     attribute = config.get(CONF_ATTRIBUTE)
     job = HassJob(action)
+    dispatcher = async_get_dispatcher(hass)
+    comparator = None if value_template else _compile_comparator(below, above)
 
     trigger_data = automation_info["trigger_data"]
     _variables = automation_info["variables"] or {}
@@ -122,6 +148,16 @@ async def async_attach_trigger(
             hass, to_s, below, above, value_template, variables(entity_id), attribute
         )
 
+    @callback
+    def check_state_change(change: StateChange):
+        """Return whether the criteria are met, raise ConditionError if unknown."""
+        if (
+            comparator is not None
+            and (matching := _check_number(change, comparator, attribute)) is not None
+        ):
+            return matching
+        return check_numeric_state(change.entity_id, change.from_state, change.to_state)
+
     # Each entity that starts outside the range is already armed (ready to fire).
     for entity_id in entity_ids:
         try:
@@ -135,11 +171,11 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event):
+    def state_automation_listener(change: StateChange):
         """Listen for state changes and calls action."""
-        entity_id = event.data.get("entity_id")
-        from_s = event.data.get("old_state")
-        to_s = event.data.get("new_state")
+        entity_id = change.entity_id
+        from_s = change.from_state
+        to_s = change.to_state
 
         @callback
         def call_action():
@@ -163,18 +199,18 @@ async def async_attach_trigger(
             )
 
         @callback
-        def check_numeric_state_no_raise(entity_id, from_s, to_s):
+        def check_numeric_state_no_raise(change: StateChange):
             """Return True if the criteria are now met, False otherwise."""
             try:
-                return check_numeric_state(entity_id, from_s, to_s)
+                return check_state_change(change)
             except exceptions.ConditionError:
                 # This is an internal same-state listener so we just drop the
                 # error. The same error will be reached and logged by the
-                # primary async_track_state_change_event() listener.
+                # primary state change listener.
                 return False
 
         try:
-            matching = check_numeric_state(entity_id, from_s, to_s)
+            matching = check_state_change(change)
         except exceptions.ConditionError as ex:
             _LOGGER.warning("Error in '%s' trigger: %s", automation_info["name"], ex)
             return
@@ -197,17 +233,16 @@ async def async_attach_trigger(
                     )
                     return
 
-                unsub_track_same[entity_id] = async_track_same_state(
-                    hass,
+                unsub_track_same[entity_id] = dispatcher.async_track_same_state(
+                    entity_id,
                     period[entity_id],
                     call_action,
-                    entity_ids=entity_id,
-                    async_check_same_func=check_numeric_state_no_raise,
+                    check_numeric_state_no_raise,
                 )
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = dispatcher.async_listen(entity_ids, state_automation_listener)
 
     @callback
     def async_remove():
@@ -8,26 +8,17 @@ import voluptuous as vol
 
 from homeassistant import exceptions
 from homeassistant.const import CONF_ATTRIBUTE, CONF_FOR, CONF_PLATFORM, MATCH_ALL
-from homeassistant.core import (
-    CALLBACK_TYPE,
-    Event,
-    HassJob,
-    HomeAssistant,
-    State,
-    callback,
-)
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers import (
     config_validation as cv,
     entity_registry as er,
     template,
 )
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-    process_state_match,
-)
+from homeassistant.helpers.event import process_state_match
 from homeassistant.helpers.typing import ConfigType
 
+from .state_dispatch import StateChange, async_get_dispatcher
+
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
 
@@ -109,30 +100,19 @@ async def async_attach_trigger(
     match_to_state = process_state_match(to_state)
     attribute = config.get(CONF_ATTRIBUTE)
     job = HassJob(action)
+    dispatcher = async_get_dispatcher(hass)
 
     trigger_data = automation_info["trigger_data"]
     _variables = automation_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event):
+    def state_automation_listener(change: StateChange):
         """Listen for state changes and calls action."""
-        entity: str = event.data["entity_id"]
-        from_s: State | None = event.data.get("old_state")
-        to_s: State | None = event.data.get("new_state")
-
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
+        entity = change.entity_id
+        from_s = change.from_state
+        to_s = change.to_state
+        old_value = change.old_value(attribute)
+        new_value = change.new_value(attribute)
 
         # When we listen for state changes with `match_all`, we
         # will trigger even if just an attribute changes. When
@@ -165,7 +145,7 @@ async def async_attach_trigger(
                         "description": f"state of {entity}",
                     }
                 },
-                event.context,
+                change.event.context,
             )
 
         if not time_delta:
@@ -192,30 +172,25 @@ async def async_attach_trigger(
             )
             return
 
-        def _check_same_state(_, _2, new_st: State | None) -> bool:
-            if new_st is None:
+        def _check_same_state(same_change: StateChange) -> bool:
+            if same_change.to_state is None:
                 return False
 
-            cur_value: str | None
-            if attribute is None:
-                cur_value = new_st.state
-            else:
-                cur_value = new_st.attributes.get(attribute)
+            cur_value = same_change.new_value(attribute)
 
             if CONF_FROM in config and CONF_TO not in config:
                 return cur_value != old_value
 
             return cur_value == new_value
 
-        unsub_track_same[entity] = async_track_same_state(
-            hass,
+        unsub_track_same[entity] = dispatcher.async_track_same_state(
+            entity,
             period[entity],
             call_action,
             _check_same_state,
-            entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = dispatcher.async_listen(entity_ids, state_automation_listener)
 
     @callback
     def async_remove():
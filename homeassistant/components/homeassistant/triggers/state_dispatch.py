@@ -0,0 +1,208 @@
+"""Shared state change dispatch for state based triggers."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_TRIGGER_DISPATCHER = "state_trigger_dispatcher"
+
+# Returned by StateChange.number when the value must be checked the slow way
+UNPARSED = object()
+
+_MISSING = object()
+
+StateChangeListener = Callable[["StateChange"], Any]
+
+
+class StateChange:
+    """A state change shared by all triggers of an entity.
+
+    Values and numbers are extracted from the states once per attribute and
+    then reused by every trigger evaluating the change.
+    """
+
+    __slots__ = ("event", "entity_id", "from_state", "to_state", "_values")
+
+    def __init__(self, event: Event) -> None:
+        """Initialize the state change."""
+        self.event = event
+        self.entity_id: str = event.data["entity_id"]
+        self.from_state = event.data.get("old_state")
+        self.to_state = event.data.get("new_state")
+        self._values: dict[tuple[str, str | None], Any] = {}
+
+    def old_value(self, attribute: str | None) -> Any:
+        """Return the old state or attribute value."""
+        key = ("old", attribute)
+        if (value := self._values.get(key, _MISSING)) is _MISSING:
+            value = self._values[key] = _state_value(self.from_state, attribute)
+        return value
+
+    def new_value(self, attribute: str | None) -> Any:
+        """Return the new state or attribute value."""
+        key = ("new", attribute)
+        if (value := self._values.get(key, _MISSING)) is _MISSING:
+            value = self._values[key] = _state_value(self.to_state, attribute)
+        return value
+
+    def number(self, attribute: str | None) -> Any:
+        """Return the new state or attribute value as a float.
+
+        Returns None for values that never match a numeric comparison and
+        UNPARSED when the value has to be checked by the numeric_state
+        condition, which reports the error.
+        """
+        key = ("number", attribute)
+        if (number := self._values.get(key, _MISSING)) is not _MISSING:
+            return number
+
+        if (to_state := self.to_state) is None:
+            number = UNPARSED
+        elif attribute is not None and attribute not in to_state.attributes:
+            number = None
+        elif (value := self.new_value(attribute)) in (
+            None,
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        ):
+            number = None
+        else:
+            try:
+                number = float(value)
+            except (ValueError, TypeError):
+                number = UNPARSED
+
+        self._values[key] = number
+        return number
+
+
+def _state_value(state: Any, attribute: str | None) -> Any:
+    """Return the state or an attribute of a state."""
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
+class StateTriggerDispatcher:
+    """Dispatch state changes to the state based triggers grouped by entity.
+
+    There is a single state change listener per entity, however many triggers
+    watch it, and the same StateChange is passed to each of them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._listeners: dict[str, list[StateChangeListener]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_listen(
+        self, entity_ids: Iterable[str], listener: StateChangeListener
+    ) -> CALLBACK_TYPE:
+        """Listen for state changes of entities."""
+        entity_ids = list(entity_ids)
+        for entity_id in entity_ids:
+            if entity_id not in self._listeners:
+                self._listeners[entity_id] = []
+                self._unsubs[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_dispatch
+                )
+            self._listeners[entity_id].append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the state change listener."""
+            for entity_id in entity_ids:
+                listeners = self._listeners[entity_id]
+                listeners.remove(listener)
+                if not listeners:
+                    del self._listeners[entity_id]
+                    self._unsubs.pop(entity_id)()
+
+        return remove_listener
+
+    @callback
+    def async_track_same_state(
+        self,
+        entity_id: str,
+        period: timedelta,
+        action: Callable[[], Any],
+        async_check_same_func: Callable[[StateChange], bool],
+    ) -> CALLBACK_TYPE:
+        """Run an action when an entity keeps matching for a period.
+
+        Works like helpers.event.async_track_same_state but checks the state
+        changes from the shared dispatch. Timers of triggers that end at the
+        same moment share a loop timer.
+        """
+        remove_timer: CALLBACK_TYPE | None = None
+        remove_listener: CALLBACK_TYPE | None = None
+        job = HassJob(action)
+
+        @callback
+        def clear_listener() -> None:
+            """Clear the timer and the state change listener."""
+            nonlocal remove_timer, remove_listener
+            if remove_listener is not None:
+                remove_listener()
+                remove_listener = None
+            if remove_timer is not None:
+                remove_timer()
+                remove_timer = None
+
+        @callback
+        def state_for_listener(now: Any) -> None:
+            """Run the action once the period has passed."""
+            nonlocal remove_timer
+            remove_timer = None
+            clear_listener()
+            self.hass.async_run_hass_job(job)
+
+        @callback
+        def state_for_cancel_listener(change: StateChange) -> None:
+            """Cancel the timer when the entity stops matching."""
+            if not async_check_same_func(change):
+                clear_listener()
+
+        remove_timer = async_track_point_in_utc_time(
+            self.hass, state_for_listener, dt_util.utcnow() + period
+        )
+        remove_listener = self.async_listen([entity_id], state_for_cancel_listener)
+        return clear_listener
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Pass a state change to the triggers of the entity."""
+        change = StateChange(event)
+        for listener in self._listeners.get(change.entity_id, [])[:]:
+            try:
+                listener(change)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state change for %s", change.entity_id
+                )
+
+
+@callback
+def async_get_dispatcher(hass: HomeAssistant) -> StateTriggerDispatcher:
+    """Return the state trigger dispatcher."""
+    if (dispatcher := hass.data.get(DATA_STATE_TRIGGER_DISPATCHER)) is None:
+        dispatcher = hass.data[DATA_STATE_TRIGGER_DISPATCHER] = StateTriggerDispatcher(
+            hass
+        )
+    return dispatcher
@@ -1,23 +1,30 @@
 """Event parser and human readable log generator."""
+from __future__ import annotations
+
+import asyncio
 from contextlib import suppress
-from datetime import timedelta
+from dataclasses import dataclass
+from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 from itertools import groupby
 import json
 import re
 
+from aiohttp import web
 import sqlalchemy
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
-from homeassistant.components import frontend
+from homeassistant.components import frontend, websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -29,6 +36,8 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    CONTENT_TYPE_JSON,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -52,6 +61,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import json_bytes, json_dumps
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
@@ -68,9 +78,23 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+DATA_ENTITIES_FILTER = "logbook_entities_filter"
+
+# Number of entries returned per page by the stream view unless requested
+DEFAULT_PAGE_SIZE = 1000
+# Number of entries serialized before they are written to the stream
+STREAM_CHUNK_SIZE = 100
+# Number of recent contexts remembered to describe live entries
+LIVE_CONTEXT_LOOKUP_SIZE = 1024
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
+# States written before schema version 25 store their own attributes
+STATE_ATTRIBUTES_JSON = sqlalchemy.func.coalesce(
+    StateAttributes.shared_attrs, States.attributes
+)
+
 HA_DOMAIN_ENTITY_ID = f"{HA_DOMAIN}."
 
 CONFIG_SCHEMA = vol.Schema(
@@ -94,6 +118,7 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
     Events.time_fired,
@@ -166,7 +191,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         filters = None
         entities_filter = None
 
+    hass.data[DATA_ENTITIES_FILTER] = entities_filter
+
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    hass.http.register_view(LogbookStreamView(conf, filters, entities_filter))
+    websocket_api.async_register_command(hass, ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -239,6 +268,28 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTPStatus.BAD_REQUEST
             )
 
+        return await self._async_events_response(
+            request,
+            hass,
+            start_day,
+            end_day,
+            entity_ids,
+            entity_matches_only,
+            context_id,
+        )
+
+    async def _async_events_response(
+        self,
+        request,
+        hass,
+        start_day,
+        end_day,
+        entity_ids,
+        entity_matches_only,
+        context_id,
+    ):
+        """Return the logbook entries for the period."""
+
         def json_events():
             """Fetch events and generate JSON."""
             return self.json(
@@ -257,6 +308,180 @@ class LogbookView(HomeAssistantView):
         return await hass.async_add_executor_job(json_events)
 
 
+class LogbookStreamView(LogbookView):
+    """Handle paginated logbook requests streaming the entries.
+
+    Responds with {"events": [...], "next_cursor": ...}. When next_cursor is
+    not null, passing it as the cursor query parameter continues the listing
+    after the last event of the page. Sensor updates are only grouped within a
+    page.
+    """
+
+    url = "/api/logbook_stream"
+    name = "api:logbook:stream"
+    extra_urls = ["/api/logbook_stream/{datetime}"]
+
+    async def _async_events_response(
+        self,
+        request,
+        hass,
+        start_day,
+        end_day,
+        entity_ids,
+        entity_matches_only,
+        context_id,
+    ):
+        """Stream a page of logbook entries for the period."""
+        page = LogbookPage()
+        if cursor := request.query.get("cursor"):
+            cursor_time, _, cursor_event_id = cursor.partition(",")
+            if (
+                cursor_start := dt_util.parse_datetime(cursor_time)
+            ) is None or not cursor_event_id.isdigit():
+                return self.json_message("Invalid cursor", HTTPStatus.BAD_REQUEST)
+            start_day = dt_util.as_utc(cursor_start)
+            page.start_event_id = int(cursor_event_id)
+
+        try:
+            limit = int(request.query.get("limit", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return self.json_message("Invalid limit", HTTPStatus.BAD_REQUEST)
+
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_JSON
+        await response.prepare(request)
+
+        def write(chunk):
+            """Write a chunk to the response from the executor."""
+            asyncio.run_coroutine_threadsafe(
+                response.write(b"".join(chunk)), hass.loop
+            ).result()
+
+        def stream_events():
+            """Fetch events and write them to the response as they are read."""
+            chunk = [b'{"events":[']
+            for index, entry in enumerate(
+                _iter_events(
+                    hass,
+                    start_day,
+                    end_day,
+                    entity_ids,
+                    self.filters,
+                    self.entities_filter,
+                    entity_matches_only,
+                    context_id,
+                    limit,
+                    page,
+                )
+            ):
+                if index:
+                    chunk.append(b",")
+                chunk.append(json_bytes(entry))
+                if len(chunk) >= STREAM_CHUNK_SIZE * 2:
+                    write(chunk)
+                    chunk = []
+
+            next_cursor = None
+            if page.next_start is not None:
+                next_cursor = (
+                    f"{page.next_start.strftime('%Y-%m-%dT%H:%M:%S.%fZ')},"
+                    f"{page.next_event_id}"
+                )
+            chunk.append(b'],"next_cursor":' + json_bytes(next_cursor) + b"}")
+            write(chunk)
+
+        await hass.async_add_executor_job(stream_events)
+        await response.write_eof()
+        return response
+
+
+@dataclass
+class LogbookPage:
+    """Continuation state of a paginated logbook query.
+
+    Pages start after the event fired at start with start_event_id and end
+    after the event fired at next_start with next_event_id.
+    """
+
+    start_event_id: int | None = None
+    next_start: dt | None = None
+    next_event_id: int | None = None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+@callback
+def ws_event_stream(hass, connection, msg):
+    """Subscribe to logbook entries as events are fired.
+
+    Entries are described from the events themselves without querying the
+    database. Only contexts of recent events are available to describe them.
+    """
+    if entity_ids := msg.get("entity_ids"):
+        entities_filter = generate_filter([], entity_ids, [], [])
+    else:
+        entities_filter = hass.data[DATA_ENTITIES_FILTER]
+    external_events = hass.data[DOMAIN]
+    context_lookup = {}
+
+    @callback
+    def _forward_event(event):
+        """Send the logbook entry for an event."""
+        lazy_event = LazyEventPartialState(LiveEventRow(event))
+        if event.context.id not in context_lookup:
+            context_lookup[event.context.id] = lazy_event
+            if len(context_lookup) > LIVE_CONTEXT_LOOKUP_SIZE:
+                del context_lookup[next(iter(context_lookup))]
+
+        if event.event_type == EVENT_CALL_SERVICE:
+            return
+        if event.event_type == EVENT_STATE_CHANGED:
+            if not _keep_state_change(event) or (
+                entities_filter is not None
+                and not entities_filter(lazy_event.entity_id)
+            ):
+                return
+        elif not _keep_event(hass, lazy_event, entities_filter):
+            return
+
+        if entries := list(
+            humanify(hass, [lazy_event], EntityAttributeCache(hass), context_lookup)
+        ):
+            connection.send_message(websocket_api.event_message(msg["id"], entries))
+
+    unsubs = [
+        hass.bus.async_listen(event_type, _forward_event)
+        for event_type in (*ALL_EVENT_TYPES, *external_events)
+    ]
+
+    @callback
+    def _unsubscribe():
+        """Stop forwarding logbook entries."""
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    connection.send_result(msg["id"])
+
+
+def _keep_state_change(event):
+    """Return if a live state change is shown, like the database queries do."""
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+    if old_state is None or new_state is None or old_state.state == new_state.state:
+        return False
+    return (
+        new_state.domain not in CONTINUOUS_DOMAINS
+        or ATTR_UNIT_OF_MEASUREMENT not in new_state.attributes
+    )
+
+
 def humanify(hass, events, entity_attr_cache, context_lookup):
     """Generate a converted list of events into Entry objects.
 
@@ -421,16 +646,55 @@ def _get_events(
     context_id=None,
 ):
     """Get events for a period of time."""
+    return list(
+        _iter_events(
+            hass,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entities_filter,
+            entity_matches_only,
+            context_id,
+        )
+    )
+
+
+def _iter_events(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+    limit=None,
+    page=None,
+):
+    """Yield events for a period of time.
+
+    When a limit is passed, iteration stops after limit events and the last
+    event read is stored in page if there are more events.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
 
     entity_attr_cache = EntityAttributeCache(hass)
     context_lookup = {None: None}
+    start_event_id = page.start_event_id if page is not None else None
 
     def yield_events(query):
         """Yield Events that are not filtered away."""
+        kept = 0
+        last_row = None
         for row in query.yield_per(1000):
+            if limit is not None and kept >= limit:
+                page.next_start = process_timestamp(last_row.time_fired)
+                page.next_event_id = last_row.event_id
+                return
+            last_row = row
             event = LazyEventPartialState(row)
             context_lookup.setdefault(event.context_id, event)
             if event.event_type == EVENT_CALL_SERVICE:
@@ -438,6 +702,7 @@ def _get_events(
             if event.event_type == EVENT_STATE_CHANGED or _keep_event(
                 hass, event, entities_filter
             ):
+                kept += 1
                 yield event
 
     if entity_ids is not None:
@@ -448,7 +713,7 @@ def _get_events(
 
         if entity_ids is not None:
             query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
+            query = _apply_event_time_filter(query, start_day, end_day, start_event_id)
             query = _apply_event_types_filter(
                 hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
             )
@@ -459,12 +724,12 @@ def _get_events(
 
             query = query.union_all(
                 _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
+                    session, start_day, end_day, old_state, entity_ids, start_event_id
                 )
             )
         else:
             query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
+            query = _apply_event_time_filter(query, start_day, end_day, start_event_id)
             query = _apply_events_types_and_states_filter(
                 hass, query, old_state
             ).filter(
@@ -479,10 +744,10 @@ def _get_events(
             if context_id is not None:
                 query = query.filter(Events.context_id == context_id)
 
-        query = query.order_by(Events.time_fired)
+        query = query.order_by(Events.time_fired, Events.event_id)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        yield from humanify(
+            hass, yield_events(query), entity_attr_cache, context_lookup
         )
 
 
@@ -492,7 +757,7 @@ def _generate_events_query(session):
         States.state,
         States.entity_id,
         States.domain,
-        States.attributes,
+        STATE_ATTRIBUTES_JSON.label("attributes"),
     )
 
 
@@ -506,14 +771,24 @@ def _generate_events_query_without_states(session):
     )
 
 
-def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
+def _generate_states_query(
+    session, start_day, end_day, old_state, entity_ids, start_event_id=None
+):
+    after_start = States.last_updated > start_day
+    if start_event_id is not None:
+        after_start |= (States.last_updated == start_day) & (
+            States.event_id > start_event_id
+        )
     return (
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
+        .filter(after_start & (States.last_updated < end_day))
         .filter(
             (States.last_updated == States.last_changed)
             & States.entity_id.in_(entity_ids)
@@ -525,6 +800,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -554,14 +832,17 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(STATE_ATTRIBUTES_JSON.contains(UNIT_OF_MEASUREMENT_JSON)),
     )
 
 
-def _apply_event_time_filter(events_query, start_day, end_day):
-    return events_query.filter(
-        (Events.time_fired > start_day) & (Events.time_fired < end_day)
-    )
+def _apply_event_time_filter(events_query, start_day, end_day, start_event_id=None):
+    after_start = Events.time_fired > start_day
+    if start_event_id is not None:
+        after_start |= (Events.time_fired == start_day) & (
+            Events.event_id > start_event_id
+        )
+    return events_query.filter(after_start & (Events.time_fired < end_day))
 
 
 def _apply_event_types_filter(hass, query, event_types):
@@ -764,6 +1045,56 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class LiveEventRow:
+    """A database row like view of a fired event.
+
+    Allows describing live events with LazyEventPartialState. The JSON columns
+    are only generated when they are used.
+    """
+
+    __slots__ = [
+        "_event",
+        "event_type",
+        "time_fired",
+        "context_id",
+        "context_user_id",
+        "context_parent_id",
+        "state",
+        "entity_id",
+        "domain",
+    ]
+
+    def __init__(self, event):
+        """Init the row."""
+        self._event = event
+        self.event_type = event.event_type
+        self.time_fired = event.time_fired
+        self.context_id = event.context.id
+        self.context_user_id = event.context.user_id
+        self.context_parent_id = event.context.parent_id
+        self.state = self.entity_id = self.domain = None
+        if event.event_type == EVENT_STATE_CHANGED and (
+            new_state := event.data.get("new_state")
+        ):
+            self.state = new_state.state
+            self.entity_id = new_state.entity_id
+            self.domain = new_state.domain
+
+    @property
+    def event_data(self):
+        """Event data as stored by the recorder."""
+        if self.event_type == EVENT_STATE_CHANGED:
+            return EMPTY_JSON_OBJECT
+        return json_dumps(self._event.data)
+
+    @property
+    def attributes(self):
+        """State attributes as stored by the recorder."""
+        if self.entity_id is None:
+            return None
+        return json_dumps(dict(self._event.data["new_state"].attributes))
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
@@ -3,15 +3,17 @@ from __future__ import annotations
 
 from ast import literal_eval
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 import datetime as dt
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import Any, Union, cast
 import uuid
@@ -97,6 +99,7 @@ from .models import (
     ReceiveMessage,
     ReceivePayloadType,
 )
+from .trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -135,6 +138,9 @@ CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
 
+# Messages handled per loop callback, the rest are handled in the next one
+MAX_MESSAGES_PER_DRAIN = 1000
+
 PLATFORMS = [
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
@@ -578,6 +584,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_subscribe)
     websocket_api.async_register_command(hass, websocket_remove_device)
     websocket_api.async_register_command(hass, websocket_mqtt_info)
+    websocket_api.async_register_command(hass, websocket_message_stats)
 
     if conf is None:
         # If we have a config entry, setup is done by that config entry.
@@ -737,17 +744,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-@attr.s(slots=True, frozen=True)
+@attr.s(slots=True, frozen=True, eq=False)
 class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+@attr.s(slots=True)
+class MessageBatchStats:
+    """Class to hold statistics about received message batches."""
+
+    batches: int = attr.ib(default=0)
+    messages: int = attr.ib(default=0)
+    last_batch_size: int = attr.ib(default=0)
+    max_batch_size: int = attr.ib(default=0)
+    last_lag: float = attr.ib(default=0)
+    max_lag: float = attr.ib(default=0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            **attr.asdict(self),
+            "average_batch_size": self.messages / self.batches if self.batches else 0,
+        }
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -766,6 +791,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -774,6 +800,12 @@ class MQTT:
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
+        # Messages received by the paho thread waiting to be handled in the loop
+        self._pending_messages: deque[tuple[float, Any]] = deque()
+        self._pending_messages_lock = threading.Lock()
+        self._drain_scheduled = False
+        self.message_stats = MessageBatchStats()
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -939,11 +971,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -956,7 +986,7 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscription_trie.remove(topic, subscription)
 
             if any(other.topic == topic for other in self.subscriptions):
                 # Other subscriptions on topic remaining - don't unsubscribe.
@@ -1046,16 +1076,56 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        Messages are queued and the event loop is only woken up for the first
+        message of a batch, so a flood of retained messages on reconnect does
+        not schedule a loop callback per message.
+        """
+        with self._pending_messages_lock:
+            self._pending_messages.append((time.monotonic(), msg))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_drain_messages)
+
+    @callback
+    def _async_drain_messages(self) -> None:
+        """Handle the messages queued by the paho thread.
+
+        At most MAX_MESSAGES_PER_DRAIN messages are handled at once so other
+        loop callbacks can run in between while a large batch is handled.
+        """
+        with self._pending_messages_lock:
+            pending = self._pending_messages
+            if len(pending) <= MAX_MESSAGES_PER_DRAIN:
+                messages = pending
+                self._pending_messages = deque()
+                self._drain_scheduled = False
+            else:
+                messages = deque(
+                    pending.popleft() for _ in range(MAX_MESSAGES_PER_DRAIN)
+                )
+                self.hass.loop.call_soon(self._async_drain_messages)
+
+        if not messages:
+            return
+
+        stats = self.message_stats
+        lag = time.monotonic() - messages[0][0]
+        stats.batches += 1
+        stats.messages += len(messages)
+        stats.last_batch_size = len(messages)
+        stats.max_batch_size = max(stats.max_batch_size, len(messages))
+        stats.last_lag = lag
+        stats.max_lag = max(stats.max_lag, lag)
+
+        for _, msg in messages:
+            self._mqtt_handle_message(msg)
+
+    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        return self._subscription_trie.match(topic)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -1068,19 +1138,27 @@ class MQTT:
         timestamp = dt_util.utcnow()
 
         subscriptions = self._matching_subscriptions(msg.topic)
+        # Payloads decoded for this message, None if decoding failed
+        decoded: dict[str, SubscribePayloadType | None] = {}
 
         for subscription in subscriptions:
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            payload: SubscribePayloadType | None = msg.payload
+            if (encoding := subscription.encoding) is not None:
+                if encoding in decoded:
+                    payload = decoded[encoding]
+                else:
+                    try:
+                        payload = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        payload = None
+                    decoded[encoding] = payload
+                if payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
                         msg.topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.job,
                     )
                     continue
@@ -1167,16 +1245,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -1189,6 +1257,18 @@ async def websocket_mqtt_info(hass, connection, msg):
     connection.send_result(msg["id"], mqtt_info)
 
 
+@websocket_api.websocket_command({vol.Required("type"): "mqtt/message_stats"})
+@callback
+def websocket_message_stats(hass, connection, msg):
+    """Get statistics about the batches of received MQTT messages."""
+    if (mqtt_client := hass.data.get(DATA_MQTT)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "MQTT is not set up"
+        )
+        return
+    connection.send_result(msg["id"], mqtt_client.message_stats.as_dict())
+
+
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/remove", vol.Required("device_id"): str}
 )
@@ -0,0 +1,94 @@
+"""Topic trie used to match MQTT messages against subscriptions."""
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+
+
+class _TopicTrieNode(Generic[_T]):
+    """Node holding the values subscribed to a single topic filter level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie(Generic[_T]):
+    """Wildcard aware trie mapping MQTT topic filters to values.
+
+    Matching a topic walks the trie one topic level at a time, so the cost
+    depends on the depth of the topic and the wildcards on its path instead of
+    on the number of subscriptions. Values are returned in the order they were
+    added, the same order the subscriptions were made in.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._sequence = 0
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        self._sequence += 1
+        node.values[value] = self._sequence
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter and prune empty nodes."""
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise KeyError(topic_filter)
+            path.append((node, level))
+            node = child
+        del node.values[value]
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.values:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level do not match topics starting with $
+        wildcard_root = not topic.startswith("$")
+        matches: list[tuple[int, _T]] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            if (multi := children.get(MULTI_LEVEL_WILDCARD)) is not None and (
+                index or wildcard_root
+            ):
+                matches.extend((seq, value) for value, seq in multi.values.items())
+            if index == depth:
+                matches.extend((seq, value) for value, seq in node.values.items())
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if (single := children.get(SINGLE_LEVEL_WILDCARD)) is not None and (
+                index or wildcard_root
+            ):
+                stack.append((single, index + 1))
+        if len(matches) > 1:
+            matches.sort(key=_sequence_key)
+        return [value for _, value in matches]
+
+
+def _sequence_key(match: tuple[int, _T]) -> int:
+    """Return the sequence a matched value was added with."""
+    return match[0]
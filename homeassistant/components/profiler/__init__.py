@@ -8,16 +8,18 @@ import sys
 import threading
 import time
 import traceback
+from typing import Any
 
 from guppy import hpy
 import objgraph
 from pyprof2calltree import convert
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import instrumentation
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
@@ -31,6 +33,8 @@ SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_START_INSTRUMENTATION = "start_instrumentation"
+SERVICE_STOP_INSTRUMENTATION = "stop_instrumentation"
 
 
 SERVICES = (
@@ -41,13 +45,19 @@ SERVICES = (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_INSTRUMENTATION,
+    SERVICE_STOP_INSTRUMENTATION,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 CONF_SECONDS = "seconds"
+CONF_LIMIT = "limit"
+
+DEFAULT_INSTRUMENTATION_LIMIT = 10
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+INSTRUMENTATION_LOG_INTERVAL_SUB = "instrumentation_log_interval_subscription"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -103,6 +113,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             notification_id="profile_object_dump",
         )
 
+    @callback
+    def _async_cancel_instrumentation_log() -> None:
+        if INSTRUMENTATION_LOG_INTERVAL_SUB in domain_data:
+            domain_data.pop(INSTRUMENTATION_LOG_INTERVAL_SUB)()
+
+    async def _async_start_instrumentation(call: ServiceCall) -> None:
+        active = instrumentation.async_enable(hass)
+        _async_cancel_instrumentation_log()
+        if CONF_SCAN_INTERVAL not in call.data:
+            return
+
+        limit = call.data[CONF_LIMIT]
+
+        @callback
+        def _async_log_instrumentation(*_: Any) -> None:
+            _LOGGER.critical(active.async_summary(limit))
+
+        domain_data[INSTRUMENTATION_LOG_INTERVAL_SUB] = async_track_time_interval(
+            hass, _async_log_instrumentation, call.data[CONF_SCAN_INTERVAL]
+        )
+
+    async def _async_stop_instrumentation(call: ServiceCall) -> None:
+        _async_cancel_instrumentation_log()
+        instrumentation.async_disable(hass)
+
     async def _async_dump_thread_frames(call: ServiceCall) -> None:
         """Log all thread frames."""
         frames = sys._current_frames()  # pylint: disable=protected-access
@@ -194,6 +229,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_INSTRUMENTATION,
+        _async_start_instrumentation,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_SCAN_INTERVAL): cv.time_period,
+                vol.Optional(
+                    CONF_LIMIT, default=DEFAULT_INSTRUMENTATION_LIMIT
+                ): cv.positive_int,
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_INSTRUMENTATION,
+        _async_stop_instrumentation,
+    )
+
+    websocket_api.async_register_command(hass, websocket_instrumentation)
+
     return True
 
 
@@ -203,10 +262,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    if INSTRUMENTATION_LOG_INTERVAL_SUB in hass.data[DOMAIN]:
+        hass.data[DOMAIN][INSTRUMENTATION_LOG_INTERVAL_SUB]()
+    instrumentation.async_disable(hass)
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/instrumentation",
+        vol.Optional(CONF_LIMIT): cv.positive_int,
+    }
+)
+@callback
+def websocket_instrumentation(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the collected instrumentation or None if it is not running."""
+    if (active := instrumentation.async_get(hass)) is None:
+        connection.send_result(msg["id"], None)
+        return
+    connection.send_result(msg["id"], active.async_as_dict(msg.get(CONF_LIMIT)))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     start_time = int(time.time() * 1000000)
     persistent_notification.async_create(
@@ -5,7 +5,7 @@ import abc
 import asyncio
 from collections.abc import Callable, Iterable
 import concurrent.futures
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 import logging
 import queue
@@ -49,15 +49,19 @@ from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
 from homeassistant.helpers.service import async_extract_entity_ids
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics, websocket_api
+from .attributes import StateAttributesIds, find_shared_attributes_id
+from .bulk import SUPPORTED_DIALECTS as BULK_WRITE_DIALECTS, BulkWriter
 from .const import (
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
     DOMAIN,
+    MAX_PURGE_TASK_TIME,
     MAX_QUEUE_BACKLOG,
     SQLITE_URL_PREFIX,
 )
@@ -65,6 +69,7 @@ from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -122,10 +127,23 @@ DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
 KEEPALIVE_TIME = 30
 
+# Once this many tasks are waiting in the queue, commits are batched until
+# as many events are pending as there are tasks waiting, so the recorder
+# catches up with bursts instead of spending its time committing
+ADAPTIVE_COMMIT_MIN_BACKLOG = 100
+MAX_EVENTS_PER_COMMIT = 5000
+# Seconds an event may wait uncommitted while commits are being batched
+MAX_COMMIT_LATENCY = 10
+
 # Controls how often we clean up
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# Progress of an unfinished purge is stored so it resumes after a restart
+PURGE_STORAGE_KEY = f"{DOMAIN}.purge"
+PURGE_STORAGE_VERSION = 1
+PURGE_SAVE_DELAY = 10
+
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 1
 
@@ -137,6 +155,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_WRITE = "bulk_write"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -165,6 +184,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_WRITE, default=False): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -241,6 +261,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_write = conf[CONF_BULK_WRITE]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -258,6 +279,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         auto_purge=auto_purge,
         keep_days=keep_days,
         commit_interval=commit_interval,
+        bulk_write=bulk_write,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
@@ -265,6 +287,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         exclude_t=exclude_t,
     )
     instance.async_initialize()
+    await instance.async_load_purge_progress()
     instance.start()
     _async_register_services(hass, instance)
     history.async_setup(hass)
@@ -370,16 +393,44 @@ class PurgeTask(RecorderTask):
     apply_filter: bool
 
     def run(self, instance: Recorder) -> None:
-        """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
-            # We always need to do the db cleanups after a purge
-            # is finished to ensure the WAL checkpoint and other
-            # tasks happen after a vacuum.
-            perodic_db_cleanups(instance)
+        """Purge the database for up to MAX_PURGE_TASK_TIME seconds."""
+        # Pending states may refer to attributes that are only in use by
+        # states about to be purged, commit them so the purge sees them
+        instance._commit_event_session_or_retry()  # pylint: disable=protected-access
+        progress = instance.purge_progress
+        if progress is not None and progress.purge_before > self.purge_before:
+            # A purge of newer data is running, it also purges this data
             return
-        # Schedule a new purge task if this one didn't finish
+        if progress is None or progress.purge_before != self.purge_before:
+            progress = instance.purge_progress = purge.start_purge_progress(
+                instance, self.purge_before, self.repack, self.apply_filter
+            )
+
+        deadline = time.monotonic() + MAX_PURGE_TASK_TIME
+        while True:
+            start = time.monotonic()
+            finished = purge.purge_old_data(
+                instance,
+                self.purge_before,
+                self.repack,
+                self.apply_filter,
+                progress=progress,
+            )
+            now = time.monotonic()
+            progress.seconds += now - start
+            if finished:
+                instance.purge_progress = None
+                instance.save_purge_progress()
+                # We always need to do the db cleanups after a purge
+                # is finished to ensure the WAL checkpoint and other
+                # tasks happen after a vacuum.
+                perodic_db_cleanups(instance)
+                return
+            if now >= deadline:
+                break
+
+        # Schedule a new purge task so queued events are written first
+        instance.save_purge_progress()
         instance.queue.put(PurgeTask(self.purge_before, self.repack, self.apply_filter))
 
 
@@ -391,6 +442,7 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        instance._commit_event_session_or_retry()  # pylint: disable=protected-access
         if purge.purge_entity_data(instance, self.entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -420,6 +472,18 @@ class StatisticsTask(RecorderTask):
         instance.queue.put(StatisticsTask(self.start))
 
 
+@dataclass
+class StatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to summarize statistics per period."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollups task."""
+        if statistics.compile_rollups(instance):
+            return
+        # Schedule a new statistics rollups task if this one didn't finish
+        instance.queue.put(StatisticsRollupsTask())
+
+
 @dataclass
 class ExternalStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an external statistics task."""
@@ -466,6 +530,51 @@ class StopTask(RecorderTask):
         instance.stop_requested = True
 
 
+@dataclass
+class CommitStats:
+    """Statistics of the commits of the event session."""
+
+    commits: int = 0
+    deferred: int = 0
+    events: int = 0
+    last_events: int = 0
+    max_events: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    max_backlog: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            **asdict(self),
+            "average_events": self.events / self.commits if self.commits else 0.0,
+        }
+
+
+@dataclass
+class KeepAliveTask(RecorderTask):
+    """A keep alive to be sent."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._send_keep_alive()
+
+
+@dataclass
+class CommitTask(RecorderTask):
+    """Commit the event session."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable=[protected-access]
+        if instance._commit_due():
+            instance._commit_event_session_or_retry()
+        else:
+            instance.commit_stats.deferred += 1
+
+
 @dataclass
 class EventTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -489,6 +598,7 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         keep_days: int,
         commit_interval: int,
+        bulk_write: bool,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -518,18 +628,29 @@ class Recorder(threading.Thread):
 
         self._timechanges_seen = 0
         self._commits_without_expire = 0
+        self._pending_events = 0
+        self._first_pending_event = 0.0
+        self.commit_stats = CommitStats()
         self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
         self._pending_expunge: list[States] = []
+        self._state_attributes_ids = StateAttributesIds()
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._bulk_writer: BulkWriter | None = (
+            BulkWriter(self._state_attributes_ids) if bulk_write else None
+        )
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
+        self._tick_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
         self._db_supports_row_number = True
         self._database_lock_task: DatabaseLockTask | None = None
+        self.purge_progress: purge.PurgeProgress | None = None
+        self._purge_store = Store(hass, PURGE_STORAGE_VERSION, PURGE_STORAGE_KEY)
 
         self.enabled = True
 
@@ -543,6 +664,7 @@ class Recorder(threading.Thread):
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL, self.event_listener, event_filter=self._async_event_filter
         )
+        self._tick_listener = self.hass.bus.async_listen_tick(self._async_tick)
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
@@ -572,11 +694,27 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._tick_listener:
+            self._tick_listener()
+            self._tick_listener = None
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Queue keep alives and commits at their interval of timer ticks."""
+        self._keepalive_count += 1
+        if self._keepalive_count >= KEEPALIVE_TIME:
+            self._keepalive_count = 0
+            self.queue.put(KeepAliveTask())
+        if self.commit_interval:
+            self._timechanges_seen += 1
+            if self._timechanges_seen >= self.commit_interval:
+                self._timechanges_seen = 0
+                self.queue.put(CommitTask())
 
     @callback
     def _async_event_filter(self, event) -> bool:
         """Filter events."""
-        if event.event_type in self.exclude_t:
+        if event.event_type == EVENT_TIME_CHANGED or event.event_type in self.exclude_t:
             return False
 
         if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
@@ -603,6 +741,24 @@ class Recorder(threading.Thread):
         purge_before = dt_util.utcnow() - timedelta(days=keep_days)
         self.queue.put(PurgeTask(purge_before, repack, apply_filter))
 
+    async def async_load_purge_progress(self) -> None:
+        """Load the progress of a purge that did not finish before a restart."""
+        if data := await self._purge_store.async_load():
+            self.purge_progress = purge.PurgeProgress.from_dict(data)
+
+    def save_purge_progress(self) -> None:
+        """Store the purge progress, or remove it if there is no purge running."""
+        data = self.purge_progress.as_dict() if self.purge_progress else None
+        self.hass.add_job(self._async_save_purge_progress, data)
+
+    @callback
+    def _async_save_purge_progress(self, data: dict[str, Any] | None) -> None:
+        """Store the purge progress from the event loop."""
+        if data is None:
+            self.hass.async_create_task(self._purge_store.async_remove())
+        else:
+            self._purge_store.async_delay_save(lambda: data, PURGE_SAVE_DELAY)
+
     def do_adhoc_purge_entities(self, entity_ids, domains, entity_globs):
         """Trigger an adhoc purge of requested entities."""
         entity_filter = generate_filter(domains, entity_ids, [], [], entity_globs)
@@ -678,6 +834,11 @@ class Recorder(threading.Thread):
     def _async_recorder_ready(self):
         """Finish start and mark recorder ready."""
         self._async_setup_periodic_tasks()
+        if progress := self.purge_progress:
+            _LOGGER.debug("Resuming purge of data before %s", progress.purge_before)
+            self.queue.put(
+                PurgeTask(progress.purge_before, progress.repack, progress.apply_filter)
+            )
         self.async_recorder_ready.set()
 
     @callback
@@ -889,19 +1050,14 @@ class Recorder(threading.Thread):
         )
 
     def _process_one_event(self, event):
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
+        if not self.enabled:
             return
 
-        if not self.enabled:
+        if self._bulk_writer is not None:
+            self._bulk_writer.add(event, self.event_session)
+            self._event_pending()
+            if not self.commit_interval and self._commit_due():
+                self._commit_event_session_or_retry()
             return
 
         try:
@@ -914,10 +1070,12 @@ class Recorder(threading.Thread):
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
+        self._event_pending()
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
                 dbstate = States.from_event(event)
+                shared_attrs = StateAttributes.shared_attrs_from_event(event)
                 has_new_state = event.data.get("new_state")
                 if dbstate.entity_id in self._old_states:
                     old_state = self._old_states.pop(dbstate.entity_id)
@@ -929,6 +1087,7 @@ class Recorder(threading.Thread):
                     dbstate.state = None
                 dbstate.event = dbevent
                 dbstate.created = event.time_fired
+                self._set_state_attributes(dbstate, shared_attrs)
                 self.event_session.add(dbstate)
                 if has_new_state:
                     self._old_states[dbstate.entity_id] = dbstate
@@ -941,9 +1100,52 @@ class Recorder(threading.Thread):
 
         # If they do not have a commit interval
         # than we commit right away
-        if not self.commit_interval:
+        if not self.commit_interval and self._commit_due():
             self._commit_event_session_or_retry()
 
+    def _event_pending(self) -> None:
+        """Count an event added to the event session."""
+        if not self._pending_events:
+            self._first_pending_event = time.monotonic()
+        self._pending_events += 1
+
+    def _commit_due(self) -> bool:
+        """Return if the event session should be committed now.
+
+        While the queue is backed up, the number of events per commit grows
+        with the depth of the queue, up to MAX_EVENTS_PER_COMMIT. Pending
+        events are never held back longer than MAX_COMMIT_LATENCY. Purge tasks
+        always commit the pending events before they run.
+        """
+        if not self._pending_events:
+            return True
+        if (backlog := self.queue.qsize()) < ADAPTIVE_COMMIT_MIN_BACKLOG:
+            return True
+        if self._pending_events >= min(backlog, MAX_EVENTS_PER_COMMIT):
+            return True
+        return time.monotonic() - self._first_pending_event >= MAX_COMMIT_LATENCY
+
+    def _set_state_attributes(self, dbstate, shared_attrs):
+        """Link the state to its shared attributes, adding them if they are new."""
+        if (attributes_id := self._state_attributes_ids.get(shared_attrs)) is not None:
+            dbstate.attributes_id = attributes_id
+            return
+        if (pending := self._pending_state_attributes.get(shared_attrs)) is not None:
+            dbstate.state_attributes = pending
+            return
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        if (
+            attributes_id := find_shared_attributes_id(
+                self.event_session, attr_hash, shared_attrs
+            )
+        ) is not None:
+            self._state_attributes_ids.set(shared_attrs, attributes_id)
+            dbstate.attributes_id = attributes_id
+            return
+        dbstate_attributes = StateAttributes(hash=attr_hash, shared_attrs=shared_attrs)
+        dbstate.state_attributes = dbstate_attributes
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -956,12 +1158,18 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not (self._bulk_writer and self._bulk_writer.pending)
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
             try:
+                start = time.monotonic()
                 self._commit_event_session()
+                self._record_commit(time.monotonic() - start)
                 return
             except (exc.InternalError, exc.OperationalError) as err:
                 _LOGGER.error(
@@ -976,9 +1184,33 @@ class Recorder(threading.Thread):
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
+    def _record_commit(self, duration: float) -> None:
+        """Record the statistics of a successful commit."""
+        stats = self.commit_stats
+        stats.commits += 1
+        stats.events += self._pending_events
+        stats.last_events = self._pending_events
+        stats.max_events = max(stats.max_events, self._pending_events)
+        stats.last_duration = duration
+        stats.max_duration = max(stats.max_duration, duration)
+        stats.total_duration += duration
+        stats.max_backlog = max(stats.max_backlog, self.queue.qsize())
+        self._pending_events = 0
+
     def _commit_event_session(self):
         self._commits_without_expire += 1
 
+        if self._bulk_writer is not None and self._bulk_writer.pending:
+            try:
+                self._bulk_writer.write(self.event_session)
+                self.event_session.commit()
+            except (exc.InternalError, exc.OperationalError):
+                # Keep the buffered rows so they are written again on retry
+                self.event_session.rollback()
+                raise
+            self._bulk_writer.clear()
+            return
+
         if self._pending_expunge:
             self.event_session.flush()
             for dbstate in self._pending_expunge:
@@ -989,6 +1221,13 @@ class Recorder(threading.Thread):
             self._pending_expunge = []
         self.event_session.commit()
 
+        # The attributes have their ids now that they are committed
+        for shared_attrs, dbstate_attributes in self._pending_state_attributes.items():
+            self._state_attributes_ids.set(
+                shared_attrs, dbstate_attributes.attributes_id
+            )
+        self._pending_state_attributes = {}
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -1007,6 +1246,9 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids.clear()
+        self._pending_state_attributes = {}
+        self._pending_events = 0
 
         if not self.event_session:
             return
@@ -1028,6 +1270,8 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        if self._bulk_writer is not None:
+            self._bulk_writer.reset(self.event_session)
 
     def _send_keep_alive(self):
         """Send a keep alive to keep the db connection open."""
@@ -1132,6 +1376,16 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs)
 
+        if (
+            self._bulk_writer is not None
+            and self.engine.dialect.name not in BULK_WRITE_DIALECTS
+        ):
+            _LOGGER.warning(
+                "Bulk write mode is not supported with %s, falling back to the default write path",
+                self.engine.dialect.name,
+            )
+            self._bulk_writer = None
+
         sqlalchemy_event.listen(self.engine, "connect", setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
@@ -1183,6 +1437,9 @@ class Recorder(threading.Thread):
             self.queue.put(StatisticsTask(start))
             start = end
 
+        # Summarize the days and months which are not summarized yet
+        self.queue.put(StatisticsRollupsTask())
+
     def _end_session(self):
         """End the recorder session."""
         if self.event_session is None:
@@ -0,0 +1,62 @@
+"""Deduplication of state attributes for the recorder."""
+from __future__ import annotations
+
+from sqlalchemy.orm.session import Session
+
+from .models import StateAttributes
+
+# Number of distinct attributes whose attributes_id is kept in memory
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
+
+class StateAttributesIds:
+    """Bounded map of serialized attributes to their attributes_id.
+
+    Only attributes that have been committed to the database are added.
+    When the map is full the oldest entry is dropped, a later lookup of those
+    attributes falls back to find_shared_attributes_id.
+    """
+
+    def __init__(self, maxsize: int = STATE_ATTRIBUTES_ID_CACHE_SIZE) -> None:
+        """Initialize the map."""
+        self.maxsize = maxsize
+        self._ids: dict[str, int] = {}
+
+    def get(self, shared_attrs: str) -> int | None:
+        """Return the attributes_id of serialized attributes."""
+        return self._ids.get(shared_attrs)
+
+    def set(self, shared_attrs: str, attributes_id: int) -> None:
+        """Remember the attributes_id of serialized attributes."""
+        ids = self._ids
+        ids[shared_attrs] = attributes_id
+        if len(ids) > self.maxsize:
+            del ids[next(iter(ids))]
+
+    def evict(self, attributes_ids: set[int]) -> None:
+        """Forget purged attributes_ids."""
+        ids = self._ids
+        for shared_attrs in [
+            shared_attrs
+            for shared_attrs, attributes_id in ids.items()
+            if attributes_id in attributes_ids
+        ]:
+            del ids[shared_attrs]
+
+    def clear(self) -> None:
+        """Forget all attributes_ids."""
+        self._ids = {}
+
+
+def find_shared_attributes_id(
+    session: Session, attr_hash: int, shared_attrs: str
+) -> int | None:
+    """Find the attributes_id of serialized attributes in the database."""
+    with session.no_autoflush:
+        return (
+            session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.hash == attr_hash)
+            .filter(StateAttributes.shared_attrs == shared_attrs)
+            .limit(1)
+            .scalar()
+        )
@@ -0,0 +1,152 @@
+"""Buffered bulk writes of events and states for the recorder."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+
+from .attributes import StateAttributesIds, find_shared_attributes_id
+from .models import Events, StateAttributes, States
+
+_LOGGER = logging.getLogger(__name__)
+
+# Dialects that accept explicit values for the primary keys
+# and continue generating ids after the highest one inserted
+SUPPORTED_DIALECTS = {"sqlite", "mysql"}
+
+
+class BulkWriter:
+    """Buffer events and states between commits and insert them in bulk.
+
+    Rows are kept as plain dicts and written with one executemany insert per
+    table. Primary keys are assigned on the client so old_state_id and
+    attributes_id can be resolved without flushing to the database first.
+    """
+
+    def __init__(self, state_attributes_ids: StateAttributesIds) -> None:
+        """Initialize the bulk writer."""
+        self.old_state_ids: dict[str, int] = {}
+        self.state_attributes_ids = state_attributes_ids
+        self._events: list[dict[str, Any]] = []
+        self._states: list[dict[str, Any]] = []
+        self._state_attributes: list[dict[str, Any]] = []
+        self._pending_attributes_ids: dict[str, int] = {}
+        self._next_event_id = 1
+        self._next_state_id = 1
+        self._next_attributes_id = 1
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are buffered rows to write."""
+        return bool(self._events)
+
+    def reset(self, session: Session) -> None:
+        """Drop buffered rows and continue ids from the database."""
+        self.old_state_ids = {}
+        self._pending_attributes_ids = {}
+        self.clear()
+        self._next_event_id = (
+            session.query(func.max(Events.event_id)).scalar() or 0
+        ) + 1
+        self._next_state_id = (
+            session.query(func.max(States.state_id)).scalar() or 0
+        ) + 1
+        self._next_attributes_id = (
+            session.query(func.max(StateAttributes.attributes_id)).scalar() or 0
+        ) + 1
+
+    def clear(self) -> None:
+        """Drop buffered rows once they have been committed."""
+        for shared_attrs, attributes_id in self._pending_attributes_ids.items():
+            self.state_attributes_ids.set(shared_attrs, attributes_id)
+        self._pending_attributes_ids = {}
+        self._events = []
+        self._states = []
+        self._state_attributes = []
+
+    def add(self, event: Event, session: Session) -> None:
+        """Buffer an event and, for state_changed events, its new state."""
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                dbevent = Events.columns_from_event(event, event_data="{}")
+            else:
+                dbevent = Events.columns_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        event_id = dbevent["event_id"] = self._next_event_id
+        self._next_event_id += 1
+        dbevent["created"] = event.time_fired
+        self._events.append(dbevent)
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            dbstate = States.columns_from_event(event)
+            shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+
+        entity_id = dbstate["entity_id"]
+        has_new_state = event.data.get("new_state")
+        state_id = dbstate["state_id"] = self._next_state_id
+        self._next_state_id += 1
+        dbstate["old_state_id"] = self.old_state_ids.pop(entity_id, None)
+        if not has_new_state:
+            dbstate["state"] = None
+        dbstate["event_id"] = event_id
+        dbstate["created"] = event.time_fired
+        dbstate["attributes_id"] = self._attributes_id(session, shared_attrs)
+        self._states.append(dbstate)
+        if has_new_state:
+            self.old_state_ids[entity_id] = state_id
+
+    def _attributes_id(self, session: Session, shared_attrs: str) -> int:
+        """Return the attributes_id of the attributes, buffering them if new."""
+        if (attributes_id := self.state_attributes_ids.get(shared_attrs)) is not None:
+            return attributes_id
+        if (
+            attributes_id := self._pending_attributes_ids.get(shared_attrs)
+        ) is not None:
+            return attributes_id
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        if (
+            attributes_id := find_shared_attributes_id(session, attr_hash, shared_attrs)
+        ) is not None:
+            self.state_attributes_ids.set(shared_attrs, attributes_id)
+            return attributes_id
+        attributes_id = self._next_attributes_id
+        self._next_attributes_id += 1
+        self._state_attributes.append(
+            {
+                "attributes_id": attributes_id,
+                "hash": attr_hash,
+                "shared_attrs": shared_attrs,
+            }
+        )
+        self._pending_attributes_ids[shared_attrs] = attributes_id
+        return attributes_id
+
+    def buffered_attributes_ids(self) -> set[int]:
+        """Return the attributes_ids used by the buffered states."""
+        return {dbstate["attributes_id"] for dbstate in self._states}
+
+    def write(self, session: Session) -> None:
+        """Insert the buffered rows using the session's transaction."""
+        if self._state_attributes:
+            session.execute(StateAttributes.__table__.insert(), self._state_attributes)
+        if self._events:
+            session.execute(Events.__table__.insert(), self._events)
+        if self._states:
+            session.execute(States.__table__.insert(), self._states)
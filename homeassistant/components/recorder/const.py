@@ -15,3 +15,6 @@ MAX_QUEUE_BACKLOG = 30000
 # We can increase this back to 1000 once most
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
+
+# The time in seconds a purge task may run before it yields to other tasks
+MAX_PURGE_TASK_TIME = 1
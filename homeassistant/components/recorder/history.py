@@ -3,17 +3,29 @@ from __future__ import annotations
 
 from collections import defaultdict
 from itertools import groupby
+import json
 import logging
+import math
 import time
 
 from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
-from .models import LazyState, States, process_timestamp_to_utc_isoformat
+from .models import (
+    LazyState,
+    StateAttributes,
+    States,
+    process_timestamp_to_utc_isoformat,
+)
 from .util import execute, session_scope
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -39,18 +51,41 @@ NEED_ATTRIBUTE_DOMAINS = {
     "water_heater",
 }
 
+# States written before schema version 25 store their own attributes
+STATE_ATTRIBUTES_JSON = func.coalesce(
+    StateAttributes.shared_attrs, States.attributes
+).label("attributes")
+
 QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    STATE_ATTRIBUTES_JSON,
     States.last_changed,
     States.last_updated,
 ]
 
+QUERY_NUMERIC_STATES = [
+    States.entity_id,
+    States.state,
+    States.last_updated,
+]
+
+QUERY_NUMERIC_STATES_WITH_ATTRIBUTES = [*QUERY_NUMERIC_STATES, STATE_ATTRIBUTES_JSON]
+
+# Number of rows fetched from the database at once by get_numeric_states
+NUMERIC_STATES_CHUNK_SIZE = 10000
+
 HISTORY_BAKERY = "recorder_history_bakery"
 
 
+def _query_states(session, columns):
+    """Query states with their shared attributes joined in."""
+    return session.query(*columns).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def async_setup(hass):
     """Set up the history hooks."""
     hass.data[HISTORY_BAKERY] = baked.bakery()
@@ -88,9 +123,38 @@ def get_significant_states_with_session(
     timer_start = time.perf_counter()
 
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: _query_states(session, QUERY_STATES)
+    )
+    _bake_significant_states_filters(
+        baked_query, entity_ids, filters, significant_changes_only, end_time
+    )
+
+    states = execute(
+        baked_query(session).params(
+            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+        )
     )
 
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def _bake_significant_states_filters(
+    baked_query, entity_ids, filters, significant_changes_only, end_time
+):
+    """Add the filters and ordering of a significant states query."""
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -116,33 +180,139 @@ def get_significant_states_with_session(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+
+def get_numeric_states(hass, *args, **kwargs):
+    """Wrap get_numeric_states_with_session with an sql session."""
+    with session_scope(hass=hass) as session:
+        return get_numeric_states_with_session(hass, session, *args, **kwargs)
+
+
+def get_numeric_states_with_session(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    include_attributes=False,
+):
+    """
+    Return numeric state changes during UTC period start_time - end_time.
+
+    The rows are selected like get_significant_states_with_session but only
+    the state and last_updated columns are loaded and rows are streamed from
+    the database in chunks instead of being materialized as State objects.
+
+    The result is columnar: {entity_id: {"s": [...], "lu": [...]}} where "s"
+    holds the states as floats (None for states that are not numeric) and
+    "lu" the matching last_updated timestamps. When include_attributes is set
+    the decoded attributes are returned under "a".
+    """
+    timer_start = time.perf_counter()
+
+    if include_attributes:
+        baked_query = hass.data[HISTORY_BAKERY](
+            lambda session: _query_states(session, QUERY_NUMERIC_STATES_WITH_ATTRIBUTES)
+        )
+    else:
+        baked_query = hass.data[HISTORY_BAKERY](
+            lambda session: session.query(*QUERY_NUMERIC_STATES)
         )
+    _bake_significant_states_filters(
+        baked_query, entity_ids, filters, significant_changes_only, end_time
+    )
+    baked_query += lambda q: q.yield_per(NUMERIC_STATES_CHUNK_SIZE)
+
+    result = {}
+    # Set all entity IDs to empty columns in result set to maintain the order
+    if entity_ids is not None:
+        for ent_id in entity_ids:
+            result[ent_id] = _numeric_columns(include_attributes)
+
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        start_timestamp = start_time.timestamp()
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            if (columns := result.get(state.entity_id)) is None:
+                columns = result[state.entity_id] = _numeric_columns(include_attributes)
+            columns[COMPRESSED_STATE_STATE].append(_numeric_state(state.state))
+            columns[COMPRESSED_STATE_LAST_UPDATED].append(start_timestamp)
+            if include_attributes:
+                columns[COMPRESSED_STATE_ATTRIBUTES].append(dict(state.attributes))
+
+    rows = baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
+    # Called in a tight loop so cache the functions here
+    _isfinite = math.isfinite
+    _json_loads = json.loads
+    utc = dt_util.UTC
+    prev_entity_id = None
+    for row in rows:
+        if row.entity_id != prev_entity_id:
+            prev_entity_id = row.entity_id
+            if (columns := result.get(prev_entity_id)) is None:
+                columns = result[prev_entity_id] = _numeric_columns(include_attributes)
+            append_state = columns[COMPRESSED_STATE_STATE].append
+            append_last_updated = columns[COMPRESSED_STATE_LAST_UPDATED].append
+            if include_attributes:
+                append_attributes = columns[COMPRESSED_STATE_ATTRIBUTES].append
+
+        try:
+            value = float(row.state)
+        except (TypeError, ValueError):
+            append_state(None)
+        else:
+            append_state(value if _isfinite(value) else None)
+
+        last_updated = row.last_updated
+        if last_updated.tzinfo is None:
+            last_updated = last_updated.replace(tzinfo=utc)
+        append_last_updated(last_updated.timestamp())
+
+        if include_attributes:
+            append_attributes(_json_loads(row.attributes) if row.attributes else {})
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
+        _LOGGER.debug("get_numeric_states took %fs", elapsed)
+
+    # Filter out the empty columns if some entities had 0 results.
+    return {
+        key: val for key, val in result.items() if val[COMPRESSED_STATE_LAST_UPDATED]
+    }
+
+
+def _numeric_columns(include_attributes):
+    """Return empty columns for the numeric states of an entity."""
+    if include_attributes:
+        return {
+            COMPRESSED_STATE_STATE: [],
+            COMPRESSED_STATE_LAST_UPDATED: [],
+            COMPRESSED_STATE_ATTRIBUTES: [],
+        }
+    return {COMPRESSED_STATE_STATE: [], COMPRESSED_STATE_LAST_UPDATED: []}
 
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
-    )
+
+def _numeric_state(state):
+    """Convert a state to a finite float or None."""
+    try:
+        value = float(state)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: _query_states(session, QUERY_STATES)
         )
 
         baked_query += lambda q: q.filter(
@@ -156,7 +326,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -178,12 +350,14 @@ def get_last_state_changes(hass, number_of_states, entity_id):
 
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: _query_states(session, QUERY_STATES)
         )
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -243,7 +417,7 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session, QUERY_STATES)
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -309,7 +483,7 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: _query_states(session, QUERY_STATES)
     )
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
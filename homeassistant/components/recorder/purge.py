@@ -2,16 +2,24 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States, StatisticsRuns, StatisticsShortTerm
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -21,13 +29,96 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class PurgeProgress:
+    """Progress of a purge that runs over several purge tasks."""
+
+    purge_before: datetime
+    repack: bool
+    apply_filter: bool
+    rows_to_purge: int
+    rows_purged: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of events and states purged per second."""
+        if not self.seconds:
+            return None
+        return self.rows_purged / self.seconds
+
+    @property
+    def seconds_remaining(self) -> float | None:
+        """Return the estimated time until the purge has finished."""
+        if not (rows_per_second := self.rows_per_second):
+            return None
+        return max(self.rows_to_purge - self.rows_purged, 0) / rows_per_second
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict of the progress that can be stored."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+            "rows_to_purge": self.rows_to_purge,
+            "rows_purged": self.rows_purged,
+            "seconds": self.seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PurgeProgress:
+        """Restore stored progress."""
+        return cls(
+            purge_before=datetime.fromisoformat(data["purge_before"]),
+            repack=data["repack"],
+            apply_filter=data["apply_filter"],
+            rows_to_purge=data["rows_to_purge"],
+            rows_purged=data["rows_purged"],
+            seconds=data["seconds"],
+        )
+
+
+def start_purge_progress(
+    instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool
+) -> PurgeProgress:
+    """Estimate the events and states to purge to start tracking a purge."""
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        rows_to_purge = _estimate_rows_before(
+            session, Events.event_id, Events.time_fired, purge_before
+        ) + _estimate_rows_before(
+            session, States.state_id, States.last_updated, purge_before
+        )
+    _LOGGER.debug("Purge will remove about %s events and states", rows_to_purge)
+    return PurgeProgress(purge_before, repack, apply_filter, rows_to_purge)
+
+
+def _estimate_rows_before(
+    session: Session, id_column: Any, time_column: Any, purge_before: datetime
+) -> int:
+    """Estimate the rows recorded before purge_before from the range of their ids.
+
+    Ids grow with the time rows are recorded, so the ids of the oldest and the
+    newest row to purge are found with index lookups instead of counting rows.
+    """
+    query = session.query(id_column).filter(time_column < purge_before)
+    if (first_id := query.order_by(time_column).limit(1).scalar()) is None:
+        return 0
+    last_id = query.order_by(time_column.desc()).limit(1).scalar()
+    return max(last_id - first_id + 1, 1)
+
+
 @retryable_database_job("purge")
 def purge_old_data(
-    instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool = False
+    instance: Recorder,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool = False,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+    Purged events and states are counted in progress when it is passed.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
@@ -55,6 +146,9 @@ def purge_old_data(
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
+        if progress is not None:
+            progress.rows_purged += len(event_ids) + len(state_ids)
+
         if event_ids or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -135,6 +229,13 @@ def _select_short_term_statistics_to_purge(
 
 def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.state_id.in_(state_ids)
+        )
+        if attributes_id is not None
+    }
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -157,6 +258,38 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # Evict eny entries in the old_states cache referring to a purged state
     _evict_purged_states_from_old_states_cache(instance, state_ids)
 
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the state attributes that are no longer used by any state."""
+    used_attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.attributes_id.in_(attributes_ids)
+        )
+    }
+    # The bulk writer may have states buffered that are not written yet
+    bulk_writer = instance._bulk_writer  # pylint: disable=protected-access
+    if bulk_writer is not None:
+        used_attributes_ids |= bulk_writer.buffered_attributes_ids()
+    if not (unused_attributes_ids := attributes_ids - used_attributes_ids):
+        return
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the attributes cache referring to purged attributes
+    instance._state_attributes_ids.evict(  # pylint: disable=protected-access
+        unused_attributes_ids
+    )
+
 
 def _evict_purged_states_from_old_states_cache(
     instance: Recorder, purged_state_ids: set[int]
@@ -174,6 +307,17 @@ def _evict_purged_states_from_old_states_cache(
     for purged_state_id in purged_state_ids.intersection(old_state_reversed):
         old_states.pop(old_state_reversed[purged_state_id], None)
 
+    # The bulk writer only keeps the ids of the old states
+    bulk_writer = instance._bulk_writer  # pylint: disable=protected-access
+    if bulk_writer is None:
+        return
+    old_state_ids = bulk_writer.old_state_ids
+    old_state_ids_reversed = {
+        old_state_id: entity_id for entity_id, old_state_id in old_state_ids.items()
+    }
+    for purged_state_id in purged_state_ids.intersection(old_state_ids_reversed):
+        old_state_ids.pop(old_state_ids_reversed[purged_state_id], None)
+
 
 def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None:
     """Delete by run_id."""
@@ -14,7 +14,7 @@ import re
 from statistics import mean
 from typing import TYPE_CHECKING, Any, Literal
 
-from sqlalchemy import bindparam, func
+from sqlalchemy import and_, bindparam, func, or_
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.ext import baked
 from sqlalchemy.orm.scoping import scoped_session
@@ -43,7 +43,9 @@ from .models import (
     StatisticMetaData,
     StatisticResult,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -76,6 +78,28 @@ QUERY_STATISTICS_SHORT_TERM = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_DAILY = [
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.start,
+    StatisticsDaily.mean,
+    StatisticsDaily.min,
+    StatisticsDaily.max,
+    StatisticsDaily.last_reset,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+]
+
+QUERY_STATISTICS_MONTHLY = [
+    StatisticsMonthly.metadata_id,
+    StatisticsMonthly.start,
+    StatisticsMonthly.mean,
+    StatisticsMonthly.min,
+    StatisticsMonthly.max,
+    StatisticsMonthly.last_reset,
+    StatisticsMonthly.state,
+    StatisticsMonthly.sum,
+]
+
 QUERY_STATISTICS_SUMMARY_MEAN = [
     StatisticsShortTerm.metadata_id,
     func.avg(StatisticsShortTerm.mean),
@@ -121,6 +145,11 @@ QUERY_STATISTIC_META_ID = [
 
 MAX_DUPLICATES = 1000000
 
+# Number of daily and monthly periods summarized by an hourly statistics run or
+# by one backfill task
+MAX_ROLLUP_PERIODS_PER_HOUR = 1
+MAX_ROLLUP_PERIODS_PER_TASK = 31
+
 STATISTICS_BAKERY = "recorder_statistics_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_meta_bakery"
 STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
@@ -571,6 +600,8 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
         if start.minute == 55:
             # A full hour is ready, summarize it
             compile_hourly_statistics(instance, session, start)
+            # Summarize the day and month if the hour completed them
+            compile_missing_rollups(session, end, MAX_ROLLUP_PERIODS_PER_HOUR)
 
         session.add(StatisticsRuns(start=start))
 
@@ -819,7 +850,6 @@ def _reduce_statistics(
     stats: dict[str, list[dict[str, Any]]],
     same_period: Callable[[datetime, datetime], bool],
     period_start_end: Callable[[datetime], tuple[datetime, datetime]],
-    period: timedelta,
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily or monthly statistics."""
     result: dict[str, list[dict[str, Any]]] = defaultdict(list)
@@ -829,11 +859,11 @@ def _reduce_statistics(
         min_values: list[float] = []
         prev_stat: dict[str, Any] = stat_list[0]
 
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(
-            stat_list, ({"start": stat_list[-1]["start"] + period},)
-        ):
-            if not same_period(prev_stat["start"], statistic["start"]):
+        # Loop over the hourly statistics + None to end the last period
+        for statistic in chain(stat_list, (None,)):
+            if statistic is None or not same_period(
+                prev_stat["start"], statistic["start"]
+            ):
                 start, end = period_start_end(prev_stat["start"])
                 # The previous statistic was the last entry of the period
                 result[statistic_id].append(
@@ -852,6 +882,8 @@ def _reduce_statistics(
                 max_values = []
                 mean_values = []
                 min_values = []
+            if statistic is None:
+                break
             if statistic.get("max") is not None:
                 max_values.append(statistic["max"])
             if statistic.get("mean") is not None:
@@ -884,7 +916,7 @@ def _reduce_statistics_per_day(
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily statistics."""
 
-    return _reduce_statistics(stats, same_day, day_start_end, timedelta(days=1))
+    return _reduce_statistics(stats, same_day, day_start_end)
 
 
 def same_month(time1: datetime, time2: datetime) -> bool:
@@ -910,7 +942,195 @@ def _reduce_statistics_per_month(
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to monthly statistics."""
 
-    return _reduce_statistics(stats, same_month, month_start_end, timedelta(days=31))
+    return _reduce_statistics(stats, same_month, month_start_end)
+
+
+def _day_period(time: datetime) -> tuple[datetime, datetime]:
+    """Return the start and end of the local day time is within.
+
+    Unlike day_start_end, the end is the start of the next local day also when
+    the day is shorter or longer than 24 hours because of daylight saving time.
+    """
+    start_local = dt_util.as_local(time).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return (
+        dt_util.as_utc(start_local),
+        dt_util.as_utc(start_local + timedelta(days=1)),
+    )
+
+
+# Tables with hourly statistics summarized per period, and the period of a time
+STATISTICS_ROLLUPS: dict[
+    str,
+    tuple[
+        type[StatisticsDaily | StatisticsMonthly],
+        list,
+        Callable[[datetime], tuple[datetime, datetime]],
+    ],
+] = {
+    "day": (StatisticsDaily, QUERY_STATISTICS_DAILY, _day_period),
+    "month": (StatisticsMonthly, QUERY_STATISTICS_MONTHLY, month_start_end),
+}
+
+
+def _rollup_statistic(start: datetime, stats: list) -> StatisticData:
+    """Summarize the hourly statistics of a period like _reduce_statistics."""
+    means = [stat.mean for stat in stats if stat.mean is not None]
+    mins = [stat.min for stat in stats if stat.min is not None]
+    maxs = [stat.max for stat in stats if stat.max is not None]
+    last_stat = stats[-1]
+    return {
+        "start": start,
+        "mean": mean(means) if means else None,
+        "min": min(mins) if mins else None,
+        "max": max(maxs) if maxs else None,
+        "last_reset": process_timestamp(last_stat.last_reset),
+        "state": last_stat.state,
+        "sum": last_stat.sum,
+    }
+
+
+def _compile_rollups(
+    session: scoped_session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start: datetime,
+    end: datetime,
+    metadata_id: int | None = None,
+) -> None:
+    """Summarize the hourly statistics of a period, replacing an earlier summary."""
+    query = (
+        session.query(*QUERY_STATISTICS)
+        .filter(Statistics.start >= start)
+        .filter(Statistics.start < end)
+    )
+    delete_query = session.query(table).filter(table.start == start)
+    if metadata_id is not None:
+        query = query.filter(Statistics.metadata_id == metadata_id)
+        delete_query = delete_query.filter(table.metadata_id == metadata_id)
+    stats = execute(query.order_by(Statistics.metadata_id, Statistics.start))
+    delete_query.delete(synchronize_session=False)
+
+    for stat_metadata_id, group in groupby(stats or [], lambda stat: stat.metadata_id):  # type: ignore
+        session.add(
+            table.from_stats(stat_metadata_id, _rollup_statistic(start, list(group)))
+        )
+
+
+def _rollups_end(
+    session: scoped_session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    period: Callable[[datetime], tuple[datetime, datetime]],
+) -> datetime | None:
+    """Return the end of the last summarized period.
+
+    All hourly statistics before the end are summarized in the table. Returns None
+    if nothing is summarized, or if the summaries are for another time zone.
+    """
+    if (last_start := session.query(func.max(table.start)).scalar()) is None:
+        return None
+    last_start = process_timestamp(last_start)
+    start, end = period(last_start)
+    if start != last_start:
+        return None
+    return end
+
+
+def compile_missing_rollups(
+    session: scoped_session, compiled_until: datetime, max_periods: int
+) -> bool:
+    """Summarize the complete periods which are not summarized yet.
+
+    Hourly statistics before compiled_until must have been compiled. Periods are
+    summarized in order, so everything before the last summary is summarized.
+    Returns True if there are no more complete periods to summarize.
+    """
+    finished = True
+    for table, _, period in STATISTICS_ROLLUPS.values():
+        if (start := _rollups_end(session, table, period)) is None:
+            if session.query(table.id).first() is not None:
+                _LOGGER.info(
+                    "The time zone has changed, summarizing %s again",
+                    table.__tablename__,
+                )
+                session.query(table).delete(synchronize_session=False)
+            start = dt_util.utc_from_timestamp(0)
+
+        periods = 0
+        # Periods without hourly statistics are skipped
+        while (
+            next_start := session.query(func.min(Statistics.start))
+            .filter(Statistics.start >= start)
+            .scalar()
+        ) is not None:
+            start, end = period(process_timestamp(next_start))
+            if end > compiled_until:
+                break
+            if periods == max_periods:
+                finished = False
+                break
+            _LOGGER.debug("Summarizing %s for %s-%s", table.__tablename__, start, end)
+            _compile_rollups(session, table, start, end)
+            periods += 1
+            start = end
+
+    return finished
+
+
+@retryable_database_job("statistics")
+def compile_rollups(instance: Recorder) -> bool:
+    """Summarize hourly statistics of periods which are not summarized yet."""
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        if (last_run := session.query(func.max(StatisticsRuns.start)).scalar()) is None:
+            return True
+        compiled_until = process_timestamp(last_run) + timedelta(minutes=5)
+        return compile_missing_rollups(
+            session, compiled_until, MAX_ROLLUP_PERIODS_PER_TASK
+        )
+
+
+def _statistics_during_period_with_rollups(
+    session: scoped_session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period: Literal["day", "month"],
+) -> list | None:
+    """Return hourly statistics with the complete periods summarized.
+
+    Returns None if no period between start_time and end_time is summarized.
+    """
+    table, base_query, period_start_end = STATISTICS_ROLLUPS[period]
+    if (rollups_end := _rollups_end(session, table, period_start_end)) is None:
+        return None
+
+    # A period which is only partially requested is reduced from hourly statistics
+    first_period_start, first_period_end = period_start_end(start_time)
+    rollups_start = start_time if first_period_start == start_time else first_period_end
+    if end_time is not None:
+        rollups_end = min(rollups_end, period_start_end(end_time)[0])
+    if rollups_end <= rollups_start:
+        return None
+
+    rollup_query = (
+        session.query(*base_query)
+        .filter(table.start >= rollups_start)
+        .filter(table.start < rollups_end)
+    )
+    hourly_query = session.query(*QUERY_STATISTICS).filter(
+        or_(
+            and_(Statistics.start >= start_time, Statistics.start < rollups_start),
+            Statistics.start >= rollups_end,
+        )
+    )
+    if end_time is not None:
+        hourly_query = hourly_query.filter(Statistics.start < end_time)
+    if metadata_ids is not None:
+        rollup_query = rollup_query.filter(table.metadata_id.in_(metadata_ids))
+        hourly_query = hourly_query.filter(Statistics.metadata_id.in_(metadata_ids))
+
+    stats = chain(execute(rollup_query) or [], execute(hourly_query) or [])
+    return sorted(stats, key=lambda stat: (stat.metadata_id, stat.start))
 
 
 def statistics_during_period(
@@ -946,15 +1166,23 @@ def statistics_during_period(
             base_query = QUERY_STATISTICS
             table = Statistics
 
-        baked_query = _statistics_during_period_query(
-            hass, end_time, statistic_ids, bakery, base_query, table
-        )
+        stats = None
+        if period in STATISTICS_ROLLUPS:
+            # Complete days and months are read from their summaries
+            stats = _statistics_during_period_with_rollups(
+                session, start_time, end_time, metadata_ids, period  # type: ignore[arg-type]
+            )
 
-        stats = execute(
-            baked_query(session).params(
-                start_time=start_time, end_time=end_time, metadata_ids=metadata_ids
+        if stats is None:
+            baked_query = _statistics_during_period_query(
+                hass, end_time, statistic_ids, bakery, base_query, table
+            )
+
+            stats = execute(
+                baked_query(session).params(
+                    start_time=start_time, end_time=end_time, metadata_ids=metadata_ids
+                )
             )
-        )
         if not stats:
             return {}
         # Return statistics combined with metadata
@@ -1263,7 +1491,9 @@ def add_external_statistics(
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
         metadata_id = _update_or_add_metadata(instance.hass, session, metadata)
+        starts: set[datetime] = set()
         for stat in statistics:
+            starts.add(stat["start"])
             if stat_id := _statistics_exists(
                 session, Statistics, metadata_id, stat["start"]
             ):
@@ -1271,4 +1501,13 @@ def add_external_statistics(
             else:
                 _insert_statistics(session, Statistics, metadata_id, stat)
 
+        # Summarize the already summarized periods again
+        for table, _, period in STATISTICS_ROLLUPS.values():
+            if (rollups_end := _rollups_end(session, table, period)) is None:
+                continue
+            for start, end in {
+                period(start) for start in starts if start < rollups_end
+            }:
+                _compile_rollups(session, table, start, end, metadata_id)
+
     return True
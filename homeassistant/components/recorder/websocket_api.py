@@ -26,6 +26,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_clear_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_purge_progress)
     websocket_api.async_register_command(hass, ws_backup_start)
     websocket_api.async_register_command(hass, ws_backup_end)
 
@@ -102,9 +103,11 @@ def ws_info(
     migration_in_progress = async_migration_in_progress(hass)
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
+    commits = instance.commit_stats.as_dict() if instance else None
 
     recorder_info = {
         "backlog": backlog,
+        "commits": commits,
         "max_backlog": MAX_QUEUE_BACKLOG,
         "migration_in_progress": migration_in_progress,
         "recording": recording,
@@ -113,6 +116,34 @@ def ws_info(
     connection.send_result(msg["id"], recorder_info)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/purge_progress",
+    }
+)
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the progress of the running purge."""
+    instance: Recorder = hass.data[DATA_INSTANCE]
+
+    if (progress := instance.purge_progress) is None:
+        connection.send_result(msg["id"], None)
+        return
+
+    connection.send_result(
+        msg["id"],
+        {
+            "purge_before": progress.purge_before,
+            "rows_to_purge": progress.rows_to_purge,
+            "rows_purged": progress.rows_purged,
+            "rows_per_second": progress.rows_per_second,
+            "seconds_remaining": progress.seconds_remaining,
+        },
+    )
+
+
 @websocket_api.ws_require_user(only_supervisor=True)
 @websocket_api.websocket_command({vol.Required("type"): "backup/start"})
 @websocket_api.async_response
@@ -15,14 +15,19 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    entity_platform,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
@@ -32,7 +37,11 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_IMPORT_TIME,
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+)
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
@@ -47,6 +56,7 @@ def async_register_commands(
     """Register commands."""
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_entity_source)
+    async_reg(hass, handle_entity_polling_stats)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
@@ -55,9 +65,11 @@ def async_register_commands(
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
+    async_reg(hass, handle_message_cache_info)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -227,23 +239,76 @@ async def handle_call_service(
         )
 
 
+@callback
+def _async_get_allowed_states(
+    hass: HomeAssistant, connection: ActiveConnection
+) -> list[State]:
+    """Return the states the user of the connection is allowed to read."""
+    if connection.user.permissions.access_all_entities("read"):
+        return hass.states.async_all()
+    entity_perm = connection.user.permissions.check_entity
+    return [
+        state
+        for state in hass.states.async_all()
+        if entity_perm(state.entity_id, "read")
+    ]
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "get_states"})
 def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
-    else:
-        entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in hass.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
+    states = _async_get_allowed_states(hass, connection)
+
+    connection.send_message(messages.cached_states_result_message(msg["id"], states))
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compressed states once and then only what changed.
+    """
+    entity_ids = set(msg.get("entity_ids", []))
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward entity state changed events to websocket."""
+        if entity_ids and event.data["entity_id"] not in entity_ids:
+            return
+        if not connection.user.permissions.check_entity(
+            event.data["entity_id"], POLICY_READ
+        ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    # We must never await between getting the states and listening for
+    # state changed events or we will introduce a race condition
+    # where some states are missed
+    states = _async_get_allowed_states(hass, connection)
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, forward_entity_changes
+    )
+    connection.send_message(messages.result_message(msg["id"]))
+    data: dict[str, dict[str, dict[str, Any]]] = {
+        messages.ENTITY_EVENT_ADD: {
+            state.entity_id: state.as_compressed_state()
+            for state in states
+            if not entity_ids or state.entity_id in entity_ids
+        }
+    }
+    connection.send_message(messages.event_message(msg["id"], data))
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -295,16 +360,39 @@ async def handle_manifest_get(
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "message_cache/info"})
+@decorators.require_admin
+def handle_message_cache_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle message cache info command."""
+    connection.send_result(
+        msg["id"],
+        {
+            "messages": messages.MESSAGE_CACHE.cache_info()._asdict(),
+            "states": messages.STATES_MESSAGE_CACHE.cache_info()._asdict(),
+        },
+    )
+
+
 @decorators.websocket_command({vol.Required("type"): "integration/setup_info"})
 @decorators.async_response
 async def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_time = hass.data.get(DATA_IMPORT_TIME, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "import_seconds": import_time[integration].total_seconds()
+                if integration in import_time
+                else None,
+            }
             for integration, timedelta in hass.data[DATA_SETUP_TIME].items()
         ],
     )
@@ -436,6 +524,18 @@ def handle_entity_source(
     connection.send_result(msg["id"], sources)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity/polling_stats"})
+@decorators.require_admin
+def handle_entity_polling_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle entity polling stats command."""
+    connection.send_result(
+        msg["id"], entity_platform.async_get_polling_scheduler(hass).async_stats()
+    )
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_trigger",
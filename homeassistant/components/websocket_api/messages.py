@@ -1,13 +1,21 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
-from functools import lru_cache
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 import logging
-from typing import Any, Final
+from typing import Any, Final, NamedTuple
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -31,6 +39,15 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+# Keys of entity events sent to subscribe_entities subscribers
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
+# Keys of the state diff in ENTITY_EVENT_CHANGE
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -52,6 +69,75 @@ def event_message(iden: JSON_TYPE, event: Any) -> dict[str, Any]:
     return {"id": iden, "type": "event", "event": event}
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of a MessageCache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class MessageCache:
+    """Bounded cache of serialized messages shared by all connections.
+
+    Entries are keyed on the identity of the objects they were built from.
+    The objects are kept alive by the cache so their ids can not be reused
+    while the entry exists. Since events and states are immutable, a new
+    state or event always results in a new entry and stale entries simply
+    age out of the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the message cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, str]] = OrderedDict()
+
+    def get(self, key: Hashable, source: Any, build: Callable[[], str]) -> str:
+        """Return the cached message for key or build and store it."""
+        entries = self._entries
+        if (entry := entries.get(key)) is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entry[1]
+        self.misses += 1
+        message = build()
+        entries[key] = (source, message)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return message
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+# Every event is forwarded to all subscribed connections right after it is
+# fired, so the cache only needs to outlive a burst of events.
+MESSAGE_CACHE: Final = MessageCache(maxsize=512)
+
+# Results of get_states can be megabytes in size. They get their own cache,
+# so event storms don't evict them and quiet periods pin only a few of them.
+# Users with different permissions get different lists of states.
+STATES_MESSAGE_CACHE: Final = MessageCache(maxsize=2)
+
+_CACHE_KIND_EVENT: Final = "event"
+_CACHE_KIND_STATE_DIFF: Final = "state_diff"
+_CACHE_KIND_STATES: Final = "states"
+
+
+def _replace_iden(message: str, iden: int) -> str:
+    """Replace the IDEN_TEMPLATE in a cached message with the actual iden."""
+    return message.replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
 def cached_event_message(iden: int, event: Event) -> str:
     """Return an event message.
 
@@ -61,17 +147,115 @@ def cached_event_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    return _replace_iden(
+        MESSAGE_CACHE.get(
+            (_CACHE_KIND_EVENT, id(event)),
+            event,
+            lambda: message_to_json(event_message(IDEN_TEMPLATE, event)),
+        ),
+        iden,
+    )
 
 
-@lru_cache(maxsize=128)
-def _cached_event_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an event message with the changes of a state_changed event.
 
-    The IDEN_TEMPLATE is used which will be replaced
-    with the actual iden in cached_event_message
+    Serialize to json once per message.
+
+    Since we can have many clients connected that are
+    all getting many of the same events (mostly state changed)
+    we can avoid serializing the same data for each connection.
+    """
+    return _replace_iden(
+        MESSAGE_CACHE.get(
+            (_CACHE_KIND_STATE_DIFF, id(event)),
+            event,
+            lambda: message_to_json(
+                event_message(IDEN_TEMPLATE, _state_diff_event(event))
+            ),
+        ),
+        iden,
+    )
+
+
+def cached_states_result_message(iden: int, states: list[State]) -> str:
+    """Return a result message with a list of states.
+
+    Serialize to json once per list of states.
+
+    Clients tend to request all states right after connecting, so the
+    result is shared until any of the states is replaced.
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    return _replace_iden(
+        STATES_MESSAGE_CACHE.get(
+            (_CACHE_KIND_STATES, *map(id, states)),
+            states,
+            lambda: _states_result_message_to_json(states),
+        ),
+        iden,
+    )
+
+
+def _states_result_message_to_json(states: list[State]) -> str:
+    """Serialize a result message of states reusing their cached JSON."""
+    try:
+        states_json = ",".join(state.as_dict_json() for state in states)
+    except (ValueError, TypeError):
+        # Let message_to_json find and log the bad data
+        return message_to_json(result_message(IDEN_TEMPLATE, states))
+    return (
+        f'{{"id":{IDEN_JSON_TEMPLATE},"type":"{const.TYPE_RESULT}",'
+        f'"success":true,"result":[{states_json}]}}'
+    )
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state_changed event to the minimal version.
+
+    State updates are sent as additions, changes and removals keyed by
+    entity_id so the client can apply them to its copy of the states.
+    """
+    if (new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    assert isinstance(new_state, State)
+    if (old_state := event.data["old_state"]) is None:
+        return {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state()}
+        }
+    assert isinstance(old_state, State)
+    return _state_diff(old_state, new_state)
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return the fields that changed between two states."""
+    additions: dict[str, Any] = {}
+    diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
+    old_context = old_state.context
+    new_context = new_state.context
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_context.parent_id != new_context.parent_id:
+        additions[COMPRESSED_STATE_CONTEXT] = {"parent_id": new_context.parent_id}
+    if old_context.user_id != new_context.user_id:
+        additions.setdefault(COMPRESSED_STATE_CONTEXT, {})[
+            "user_id"
+        ] = new_context.user_id
+    if old_context.id != new_context.id:
+        if COMPRESSED_STATE_CONTEXT in additions:
+            additions[COMPRESSED_STATE_CONTEXT]["id"] = new_context.id
+        else:
+            additions[COMPRESSED_STATE_CONTEXT] = new_context.id
+    old_attributes = old_state.attributes
+    for key, value in new_state.attributes.items():
+        if key not in old_attributes or old_attributes[key] != value:
+            additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
+    if removed := [key for key in old_attributes if key not in new_state.attributes]:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed}
+    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
 def message_to_json(message: dict[str, Any]) -> str:
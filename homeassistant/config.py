@@ -63,6 +63,7 @@ from .requirements import RequirementsNotFound, async_get_integration_with_requi
 from .util.package import is_docker_env
 from .util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 from .util.yaml import SECRET_YAML, Secrets, load_yaml
+from .util.yaml.loader import ParsedYamlCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -366,6 +367,10 @@ def load_yaml_config_file(
     """
     conf_dict = load_yaml(config_path, secrets)
 
+    if secrets is not None:
+        # Drop the parsed YAML of files that were deleted or renamed
+        ParsedYamlCache(secrets.config_dir).prune()
+
     if not isinstance(conf_dict, dict):
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
@@ -50,6 +50,11 @@ from .const import (
     ATTR_SECONDS,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     CONF_UNIT_SYSTEM_IMPERIAL,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
@@ -77,6 +82,7 @@ from .exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from .helpers.json import json_dumps
 from .util import dt as dt_util, location, uuid as uuid_util
 from .util.async_ import (
     fire_coroutine_threadsafe,
@@ -781,12 +787,31 @@ class _FilterableJob(NamedTuple):
     event_filter: Callable[[Event], bool] | None
 
 
+def _run_timed_callback_listener(
+    listener_timer: Callable[[HassJob[Any], float | None], None],
+    job: HassJob[Any],
+    event: Event,
+) -> None:
+    """Run a callback event listener and report its run time."""
+    start = monotonic()
+    try:
+        job.target(event)
+    finally:
+        listener_timer(job, monotonic() - start)
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        # Immutable, pre-merged listeners per event type (MATCH_ALL listeners
+        # first), rebuilt only when listeners are added or removed.
+        self._dispatch: dict[str, tuple[_FilterableJob, ...]] = {}
+        self._match_all_dispatch: tuple[_FilterableJob, ...] = ()
+        self._listener_timer: Callable[[HassJob[Any], float | None], None] | None = None
+        self._tick_listeners: tuple[Callable[[datetime.datetime], None], ...] = ()
         self._hass = hass
 
     @callback
@@ -797,6 +822,66 @@ class EventBus:
         """
         return {key: len(listeners) for key, listeners in self._listeners.items()}
 
+    @callback
+    def async_set_listener_timer(
+        self, listener_timer: Callable[[HassJob[Any], float | None], None] | None
+    ) -> None:
+        """Set a callback that is told how long each dispatched listener ran.
+
+        Only callback listeners run to completion in the event loop, other
+        listeners are reported with None. Pass None to stop timing.
+
+        This method must be run in the event loop.
+        """
+        self._listener_timer = listener_timer
+
+    @callback
+    def async_listen_tick(
+        self, listener: Callable[[datetime.datetime], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for the tick of the timer every second.
+
+        The listener is called with the current time, without an event being
+        created or fired, and must be a callback that does not block. Like
+        event listeners it is scheduled on the loop, so it keeps its order
+        with the events fired before the tick.
+
+        This method must be run in the event loop.
+        """
+        self._tick_listeners = (*self._tick_listeners, listener)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the tick listener."""
+            listeners = list(self._tick_listeners)
+            try:
+                listeners.remove(listener)
+            except ValueError:
+                _LOGGER.exception("Unable to remove unknown tick listener %s", listener)
+                return
+            self._tick_listeners = tuple(listeners)
+
+        return remove_listener
+
+    @callback
+    def async_fire_tick(
+        self, now: datetime.datetime, context: Context | None = None
+    ) -> None:
+        """Run the tick listeners and fire EVENT_TIME_CHANGED if it has listeners.
+
+        Listeners of all events only receive EVENT_TIME_CHANGED while
+        something listens to it explicitly.
+
+        This method must be run in the event loop.
+        """
+        for listener in self._tick_listeners:
+            self._hass.loop.call_soon(listener, now)
+
+        if EVENT_TIME_CHANGED in self._listeners:
+            self.async_fire(
+                EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=context
+            )
+
     @property
     def listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners."""
@@ -832,12 +917,14 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        listeners = self._dispatch.get(event_type)
+        if listeners is None:
+            # EVENT_HOMEASSISTANT_CLOSE should go only to its own listeners
+            listeners = (
+                self._match_all_dispatch
+                if event_type != EVENT_HOMEASSISTANT_CLOSE
+                else ()
+            )
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
@@ -847,6 +934,7 @@ class EventBus:
         if not listeners:
             return
 
+        listener_timer = self._listener_timer
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -855,7 +943,15 @@ class EventBus:
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error in event filter")
                     continue
-            self._hass.async_add_hass_job(job, event)
+            if listener_timer is None:
+                self._hass.async_add_hass_job(job, event)
+            elif job.job_type == HassJobType.Callback:
+                self._hass.loop.call_soon(
+                    _run_timed_callback_listener, listener_timer, job, event
+                )
+            else:
+                listener_timer(job, None)
+                self._hass.async_add_hass_job(job, event)
 
     def listen(
         self,
@@ -906,6 +1002,7 @@ class EventBus:
         self, event_type: str, filterable_job: _FilterableJob
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_update_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -992,11 +1089,82 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+
+        self._async_update_dispatch(event_type)
+
+    @callback
+    def _async_update_dispatch(self, event_type: str) -> None:
+        """Rebuild the dispatch tuples affected by a change to event_type.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            self._match_all_dispatch = tuple(self._listeners.get(MATCH_ALL, ()))
+            for dispatch_type in self._dispatch:
+                self._dispatch[dispatch_type] = self._build_dispatch(dispatch_type)
+            return
+
+        if event_type in self._listeners:
+            self._dispatch[event_type] = self._build_dispatch(event_type)
+        else:
+            self._dispatch.pop(event_type, None)
+
+    def _build_dispatch(self, event_type: str) -> tuple[_FilterableJob, ...]:
+        """Return the merged listeners to call for event_type."""
+        listeners = tuple(self._listeners[event_type])
+        if event_type == EVENT_HOMEASSISTANT_CLOSE:
+            return listeners
+        return self._match_all_dispatch + listeners
 
 
 _StateT = TypeVar("_StateT", bound="State")
 
 
+# Attribute values that can't change after they were created
+_IMMUTABLE_ATTRIBUTE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    enum.Enum,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+def _same_attribute_value(old: Any, new: Any) -> bool:
+    """Return if two attribute values are equal and serialize the same.
+
+    Unlike ==, the types have to match, so 1, 1.0 and True differ. A mutable
+    value shared by both states may have been changed in place since the
+    old state was serialized, so it never counts as the same.
+    """
+    if type(old) is not type(new):
+        return False
+    if isinstance(new, _IMMUTABLE_ATTRIBUTE_TYPES):
+        return bool(old == new)
+    if isinstance(new, (list, tuple)):
+        if old is new and not isinstance(new, tuple):
+            return False
+        return len(old) == len(new) and all(map(_same_attribute_value, old, new))
+    if isinstance(new, dict):
+        return old is not new and _same_attributes(old, new)
+    return False
+
+
+def _same_attributes(old: Mapping[str, Any], new: Mapping[str, Any]) -> bool:
+    """Return if two attribute mappings are equal and serialize the same."""
+    if len(old) != len(new):
+        return False
+    for key, value in new.items():
+        if key not in old or not _same_attribute_value(old[key], value):
+            return False
+    return True
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -1020,6 +1188,10 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_attributes_dict",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -1049,12 +1221,19 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        if isinstance(attributes, MappingProxyType):
+            self.attributes = attributes
+        else:
+            self.attributes = MappingProxyType(attributes or {})
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: dict[str, Any] | None = None
+        self._attributes_dict: dict[str, Any] | None = None
+        self._attributes_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -1080,13 +1259,81 @@ class State:
             self._as_dict = {
                 "entity_id": self.entity_id,
                 "state": self.state,
-                "attributes": dict(self.attributes),
+                "attributes": self._attributes_as_dict(),
                 "last_changed": last_changed_isoformat,
                 "last_updated": last_updated_isoformat,
                 "context": self.context.as_dict(),
             }
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return the JSON encoding of as_dict.
+
+        The result is cached so every consumer serializing the same state
+        shares the work.
+
+        Async friendly.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
+    def attributes_json(self) -> str:
+        """Return the JSON encoding of the attributes.
+
+        Shared with the states that replaced this one without changing
+        the attributes.
+
+        Async friendly.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = json_dumps(self._attributes_as_dict())
+        return self._attributes_json
+
+    def _attributes_as_dict(self) -> dict[str, Any]:
+        """Return the attributes as a plain dict."""
+        if self._attributes_dict is None:
+            self._attributes_dict = dict(self.attributes)
+        return self._attributes_dict
+
+    def _share_attributes(self, old_state: State) -> None:
+        """Reuse the serialized attributes of a state with the same attributes."""
+        self._attributes_dict = old_state._attributes_dict
+        self._attributes_json = old_state._attributes_json
+
+    def as_compressed_state(self) -> dict[str, Any]:
+        """Build a compressed dict of a state for adds.
+
+        Omits the entity_id, which is used as the key of the dict it is
+        sent in, and last_updated when it is the same as last_changed.
+
+        Async friendly.
+
+        To be used for JSON serialization.
+        """
+        if self._as_compressed_state:
+            return self._as_compressed_state
+
+        context = self.context
+        compressed_context: dict[str, Any] | str
+        if context.parent_id is None and context.user_id is None:
+            compressed_context = context.id
+        else:
+            compressed_context = context.as_dict()
+
+        compressed_state = {
+            COMPRESSED_STATE_STATE: self.state,
+            COMPRESSED_STATE_ATTRIBUTES: self._attributes_as_dict(),
+            COMPRESSED_STATE_CONTEXT: compressed_context,
+            COMPRESSED_STATE_LAST_CHANGED: self.last_changed.timestamp(),
+        }
+        if self.last_changed != self.last_updated:
+            compressed_state[
+                COMPRESSED_STATE_LAST_UPDATED
+            ] = self.last_updated.timestamp()
+        self._as_compressed_state = compressed_state
+        return compressed_state
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -1146,6 +1393,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1169,12 +1417,16 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
+
+        if len(domains := set(domain_filter)) == 1:
+            return list(self._domain_index.get(domains.pop(), ()))
 
+        # Keep the order the entities were added in across domains
         return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+            entity_id
+            for entity_id, state in self._states.items()
+            if state.domain in domains
         ]
 
     @callback
@@ -1189,10 +1441,10 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ())) for domain in set(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1213,11 +1465,17 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            if (states := self._domain_index.get(domain_filter.lower())) is None:
+                return []
+            return list(states.values())
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+        if len(domains := set(domain_filter)) == 1:
+            if (states := self._domain_index.get(domains.pop())) is None:
+                return []
+            return list(states.values())
+
+        # Keep the order the entities were added in across domains
+        return [state for state in self._states.values() if state.domain in domains]
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
@@ -1260,6 +1518,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1363,7 +1626,16 @@ class StateMachine:
             context,
             old_state is None,
         )
+        # Entities build a new mapping with every write, reuse the serialized
+        # attributes when they are unchanged. Equality alone misses type
+        # changes and values mutated in place, so a stricter check is used.
+        if old_state is not None and (
+            attributes is old_state.attributes
+            or (same_attr and _same_attributes(old_state.attributes, attributes))
+        ):
+            state._share_attributes(old_state)  # pylint: disable=protected-access
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1927,9 +2199,7 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(
-            EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
-        )
+        hass.bus.async_fire_tick(now, timer_context)
 
         # If we are more than a second late, a tick was missed
         if (late := monotonic() - target) > 1:
@@ -49,6 +49,11 @@ class _DeviceIndex(NamedTuple):
     connections: dict[tuple[str, str], str]
 
 
+class _DeviceLookup(NamedTuple):
+    area_id: dict[str, dict[str, DeviceEntry]]
+    config_entry_id: dict[str, dict[str, DeviceEntry]]
+
+
 class DeviceEntryDisabler(StrEnum):
     """What disabled a device entry."""
 
@@ -210,9 +215,12 @@ class DeviceRegistry:
     """Class to hold a registry of devices."""
 
     devices: dict[str, DeviceEntry]
+    # Increased on every change of the registered devices
+    generation: int = 0
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _lookup: _DeviceLookup
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -266,6 +274,8 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self.generation += 1
+            _add_device_to_lookup(self._lookup, device)
 
         _add_device_to_index(devices_index, device)
 
@@ -277,27 +287,33 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self.generation += 1
+            _remove_device_from_lookup(self._lookup, device)
 
         _remove_device_from_index(devices_index, device)
 
     def _update_device(self, old_device: DeviceEntry, new_device: DeviceEntry) -> None:
         """Update a device and the index."""
         self.devices[new_device.id] = new_device
+        self.generation += 1
 
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
+        _update_device_in_lookup(self._lookup, old_device, new_device)
 
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._lookup = _DeviceLookup(area_id={}, config_entry_id={})
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            _add_device_to_lookup(self._lookup, device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -631,7 +647,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in async_entries_for_config_entry(self, config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -672,9 +688,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in async_entries_for_area(self, area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -702,7 +717,8 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable-next=protected-access
+    return list(registry._lookup.area_id.get(area_id, {}).values())
 
 
 @callback
@@ -710,11 +726,8 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    # pylint: disable-next=protected-access
+    return list(registry._lookup.config_entry_id.get(config_entry_id, {}).values())
 
 
 @callback
@@ -875,3 +888,40 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+
+
+def _add_device_to_lookup(lookup: _DeviceLookup, device: DeviceEntry) -> None:
+    """Add a device to the area and config entry lookup."""
+    if device.area_id is not None:
+        lookup.area_id.setdefault(device.area_id, {})[device.id] = device
+    for config_entry_id in device.config_entries:
+        lookup.config_entry_id.setdefault(config_entry_id, {})[device.id] = device
+
+
+def _remove_device_from_lookup(lookup: _DeviceLookup, device: DeviceEntry) -> None:
+    """Remove a device from the area and config entry lookup."""
+    if device.area_id is not None:
+        _remove_from_bucket(lookup.area_id, device.area_id, device.id)
+    for config_entry_id in device.config_entries:
+        _remove_from_bucket(lookup.config_entry_id, config_entry_id, device.id)
+
+
+def _update_device_in_lookup(
+    lookup: _DeviceLookup, old_device: DeviceEntry, new_device: DeviceEntry
+) -> None:
+    """Update a device in the lookup, keeping its position in unchanged buckets."""
+    if old_device.area_id is not None and old_device.area_id != new_device.area_id:
+        _remove_from_bucket(lookup.area_id, old_device.area_id, old_device.id)
+    for config_entry_id in old_device.config_entries - new_device.config_entries:
+        _remove_from_bucket(lookup.config_entry_id, config_entry_id, old_device.id)
+    _add_device_to_lookup(lookup, new_device)
+
+
+def _remove_from_bucket(
+    index: dict[str, dict[str, DeviceEntry]], key: str, device_id: str
+) -> None:
+    """Remove a device from a bucket of a lookup and drop the bucket if empty."""
+    bucket = index[key]
+    del bucket[device_id]
+    if not bucket:
+        del index[key]
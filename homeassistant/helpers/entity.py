@@ -35,16 +35,24 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
 
 from . import entity_registry as er
 from .device_registry import DeviceEntryType
-from .entity_platform import EntityPlatform
+from .entity_platform import EntityPlatform, polling_executor_updates
 from .event import async_track_entity_registry_updated_event
 from .frame import report
+from .instrumentation import DATA_INSTRUMENTATION
 from .typing import StateType
 
 _LOGGER = logging.getLogger(__name__)
@@ -651,9 +659,24 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
+        if (instrumentation := self.hass.data.get(DATA_INSTRUMENTATION)) is None:
+            self.hass.states.async_set(
+                self.entity_id, state, attr, self.force_update, self._context
+            )
+            return
+
+        old_state = self.hass.states.get(self.entity_id)
         self.hass.states.async_set(
             self.entity_id, state, attr, self.force_update, self._context
         )
+        instrumentation.async_record_state_write(
+            self.platform.platform_name
+            if self.platform
+            else split_entity_id(self.entity_id)[0],
+            self.entity_id,
+            timer() - start,
+            self.hass.states.get(self.entity_id) is old_state,
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -701,7 +724,7 @@ class Entity(ABC):
             if hasattr(self, "async_update"):
                 task = self.hass.async_create_task(self.async_update())  # type: ignore
             elif hasattr(self, "update"):
-                task = self.hass.async_add_executor_job(self.update)  # type: ignore
+                task = self.hass.async_create_task(self._async_executor_update())
             else:
                 return
 
@@ -727,6 +750,14 @@ class Entity(ABC):
             if self.parallel_updates:
                 self.parallel_updates.release()
 
+    async def _async_executor_update(self) -> None:
+        """Run 'update' in the executor, bounded across all polled entities."""
+        if (executor_updates := polling_executor_updates.get()) is None:
+            await self.hass.async_add_executor_job(self.update)  # type: ignore
+            return
+        async with executor_updates:
+            await self.hass.async_add_executor_job(self.update)  # type: ignore
+
     @callback
     def async_on_remove(self, func: CALLBACK_TYPE) -> None:
         """Add a function to call when entity removed."""
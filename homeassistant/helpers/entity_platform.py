@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+import time
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, cast
 from urllib.parse import urlparse
 
 import voluptuous as vol
@@ -33,6 +36,7 @@ from homeassistant.exceptions import (
     RequiredParameterMissing,
 )
 from homeassistant.setup import async_start_setup
+from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from . import (
@@ -43,7 +47,11 @@ from . import (
 )
 from .device_registry import DeviceRegistry
 from .entity_registry import EntityRegistry, RegistryEntryDisabler
-from .event import async_call_later, async_track_time_interval
+from .event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -58,6 +66,13 @@ SLOW_ADD_MIN_TIMEOUT = 500
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+DATA_POLLING_SCHEDULER = "entity_platform_polling_scheduler"
+# Polls of platforms sharing a scan interval are spread over this
+# fraction of the interval
+POLLING_JITTER_FRACTION = 0.1
+# Limit the updates running in the executor at the same time, so polling
+# leaves room in the executor for the rest of Home Assistant
+MAX_PARALLEL_EXECUTOR_UPDATES = 32
 
 _LOGGER = getLogger(__name__)
 
@@ -103,6 +118,7 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        self.polling_stats = PollingStats()
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -402,11 +418,9 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-        )
+        self._async_unsub_polling = async_get_polling_scheduler(
+            self.hass
+        ).async_track_platform(self)
 
     async def _async_add_entity(  # noqa: C901
         self,
@@ -715,7 +729,9 @@ class EntityPlatform:
         """
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
+        stats = self.polling_stats
         if self._process_updates.locked():
+            stats.skipped += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -725,20 +741,140 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
+            stats.polls += 1
+            stats.last_lag = max((dt_util.utcnow() - now).total_seconds(), 0.0)
+            stats.max_lag = max(stats.max_lag, stats.last_lag)
+            start = time.monotonic()
             tasks = []
             for entity in self.entities.values():
                 if not entity.should_poll:
                     continue
                 tasks.append(entity.async_update_ha_state(True))
 
-            if tasks:
-                await asyncio.gather(*tasks)
+            token = polling_executor_updates.set(
+                async_get_polling_scheduler(self.hass).executor_updates
+            )
+            try:
+                if tasks:
+                    await asyncio.gather(*tasks)
+            finally:
+                polling_executor_updates.reset(token)
+                duration = time.monotonic() - start
+                stats.last_duration = duration
+                stats.max_duration = max(stats.max_duration, duration)
+                stats.total_duration += duration
+
+
+@dataclass
+class PollingStats:
+    """Statistics of the polling of an entity platform."""
+
+    polls: int = 0
+    skipped: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+
+class PollingScheduler:
+    """Schedule the polling of all entity platforms.
+
+    Platforms that share a scan interval start polling at staggered offsets
+    so they do not all wake up at once, and the number of updates running
+    in the executor at the same time is bounded across all platforms.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self.executor_updates = asyncio.Semaphore(MAX_PARALLEL_EXECUTOR_UPDATES)
+        self.platforms: list[EntityPlatform] = []
+        # Jitter indexes in use by the platforms polling at each interval
+        self._interval_indexes: defaultdict[timedelta, set[int]] = defaultdict(set)
+
+    @callback
+    def async_track_platform(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Start polling a platform and return a function to stop it."""
+        hass = self.hass
+        interval = platform.scan_interval
+        # Reuse the index of a platform that stopped polling, so reloading
+        # platforms does not keep moving new ones to other offsets
+        indexes = self._interval_indexes[interval]
+        index = next(index for index in range(len(indexes) + 1) if index not in indexes)
+        indexes.add(index)
+        self.platforms.append(platform)
+
+        # The golden ratio spreads any number of platforms evenly over the
+        # jitter window. The first platform with an interval is not moved
+        # and the others poll a little earlier, never later than before.
+        offset = interval * POLLING_JITTER_FRACTION * ((index * 0.618033988749895) % 1)
+        unsub: CALLBACK_TYPE
+
+        async def _async_start_polling(now: datetime) -> None:
+            """Poll for the first time and continue at the scan interval."""
+            nonlocal unsub
+            unsub = async_track_time_interval(
+                hass, platform._update_entity_states, interval
+            )
+            await platform._update_entity_states(now)
+
+        if offset:
+            unsub = async_track_point_in_utc_time(
+                hass, _async_start_polling, dt_util.utcnow() + interval - offset
+            )
+        else:
+            unsub = async_track_time_interval(
+                hass, platform._update_entity_states, interval
+            )
+
+        @callback
+        def _async_stop_polling() -> None:
+            """Stop polling the platform."""
+            unsub()
+            self.platforms.remove(platform)
+            indexes.discard(index)
+            if not indexes:
+                del self._interval_indexes[interval]
+
+        return _async_stop_polling
+
+    @callback
+    def async_stats(self) -> list[dict[str, Any]]:
+        """Return the polling statistics of all polling platforms."""
+        return [
+            {
+                "domain": platform.domain,
+                "platform": platform.platform_name,
+                "config_entry_id": platform.config_entry.entry_id
+                if platform.config_entry
+                else None,
+                "scan_interval": platform.scan_interval.total_seconds(),
+                **asdict(platform.polling_stats),
+            }
+            for platform in self.platforms
+        ]
+
+
+@callback
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler of a Home Assistant instance."""
+    if (scheduler := hass.data.get(DATA_POLLING_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = PollingScheduler(hass)
+    return cast(PollingScheduler, scheduler)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
 )
 
+# Bounds the sync updates of the entities being polled, unset for updates
+# requested any other way
+polling_executor_updates: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "polling_executor_updates", default=None
+)
+
 
 @callback
 def async_get_current_platform() -> EntityPlatform:
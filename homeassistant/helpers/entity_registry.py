@@ -185,33 +185,68 @@ class EntityRegistryStore(storage.Store):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entry
+    - device_id -> entity_id -> entry
+    - area_id -> entity_id -> entry
+    - config_entry_id -> entity_id -> entry
+
+    The generation is increased on every change, so caches built from the
+    entries can tell they are stale without waiting for the update event.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
+        self.generation = 0
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._area_id_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._config_entry_id_index: dict[str, dict[str, RegistryEntry]] = {}
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.data.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
+        self.generation += 1
         self._entry_ids.__setitem__(entry.id, entry)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._update_secondary_indexes(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         self._entry_ids.__delitem__(entry.id)
         self._index.__delitem__((entry.domain, entry.platform, entry.unique_id))
+        self._update_secondary_indexes(key, entry, None)
         super().__delitem__(key)
+        self.generation += 1
+
+    def copy(self) -> EntityRegistryItems:
+        """Return a shallow copy that maintains its own indexes."""
+        items = EntityRegistryItems()
+        items.update(self)
+        return items
+
+    def _update_secondary_indexes(
+        self, key: str, old_entry: RegistryEntry | None, entry: RegistryEntry | None
+    ) -> None:
+        """Move an entry to the buckets matching its new values."""
+        for index, old_value, new_value in zip(
+            (
+                self._device_id_index,
+                self._area_id_index,
+                self._config_entry_id_index,
+            ),
+            _secondary_index_values(old_entry),
+            _secondary_index_values(entry),
+        ):
+            _update_index(index, key, old_value, new_value, entry)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -221,6 +256,55 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        entries = self._device_id_index.get(device_id, {}).values()
+        if include_disabled_entities:
+            return list(entries)
+        return [entry for entry in entries if not entry.disabled_by]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        return list(self._area_id_index.get(area_id, {}).values())
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        return list(self._config_entry_id_index.get(config_entry_id, {}).values())
+
+
+def _secondary_index_values(
+    entry: RegistryEntry | None,
+) -> tuple[str | None, str | None, str | None]:
+    """Return the device_id, area_id and config_entry_id of an entry."""
+    if entry is None:
+        return (None, None, None)
+    return (entry.device_id, entry.area_id, entry.config_entry_id)
+
+
+def _update_index(
+    index: dict[str, dict[str, RegistryEntry]],
+    key: str,
+    old_value: str | None,
+    new_value: str | None,
+    entry: RegistryEntry | None,
+) -> None:
+    """Update the bucket of an entry in an index keyed by one of its values.
+
+    An entry that stays in the same bucket keeps its position in it.
+    """
+    if old_value is not None and old_value != new_value:
+        bucket = index[old_value]
+        del bucket[key]
+        if not bucket:
+            del index[old_value]
+    if new_value is not None:
+        assert entry is not None
+        index.setdefault(new_value, {})[key] = entry
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -687,19 +771,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry):
+            self.async_remove(entry.entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -729,12 +808,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -742,7 +818,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -750,11 +826,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
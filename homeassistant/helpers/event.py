@@ -16,10 +16,8 @@ from typing_extensions import Concatenate, ParamSpec
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -56,6 +54,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TIMER_SCHEDULER = "timer_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1229,6 +1229,135 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+class _ScheduledTimer:
+    """A callback waiting in a slot of the timer scheduler."""
+
+    __slots__ = ("slot", "target")
+
+    def __init__(self, slot: _TimerSlot, target: Callable[[], None]) -> None:
+        """Initialize the scheduled timer."""
+        self.slot: _TimerSlot | None = slot
+        self.target = target
+
+    @callback
+    def cancel(self) -> None:
+        """Remove the timer from its slot."""
+        if (slot := self.slot) is None:
+            return
+        self.slot = None
+        slot.scheduler.async_cancel(slot, self)
+
+
+class _TimerSlot:
+    """All timers due at the same timestamp, run by one loop timer."""
+
+    __slots__ = ("scheduler", "timestamp", "handle", "timers")
+
+    def __init__(self, scheduler: TimerScheduler, timestamp: float) -> None:
+        """Initialize the slot."""
+        self.scheduler = scheduler
+        self.timestamp = timestamp
+        self.handle: asyncio.TimerHandle | None = None
+        # A dict keeps the timers in the order they were scheduled
+        self.timers: dict[_ScheduledTimer, None] = {}
+
+
+class TimerScheduler:
+    """Coalesce callbacks due at the same point in time into one loop timer.
+
+    Time pattern triggers, sun events and intervals started together are due
+    at exactly the same timestamp. Instead of one TimerHandle per callback on
+    the asyncio heap, every distinct timestamp gets a single TimerHandle that
+    runs all callbacks due at it.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the scheduler."""
+        self._loop = loop
+        self._slots: dict[float, _TimerSlot] = {}
+        self.scheduled = 0
+        self.coalesced = 0
+        self.cancelled = 0
+        self.fired = 0
+        self.max_late = 0.0
+        self.total_late = 0.0
+
+    @callback
+    def async_schedule(
+        self, timestamp: float, target: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call a callback at a POSIX timestamp and return a cancel function."""
+        self.scheduled += 1
+        if (slot := self._slots.get(timestamp)) is None:
+            slot = self._slots[timestamp] = _TimerSlot(self, timestamp)
+            slot.handle = self._loop.call_later(
+                timestamp - time.time(), self._async_run_slot, slot
+            )
+        else:
+            self.coalesced += 1
+        timer = _ScheduledTimer(slot, target)
+        slot.timers[timer] = None
+        return timer.cancel
+
+    @callback
+    def async_cancel(self, slot: _TimerSlot, timer: _ScheduledTimer) -> None:
+        """Remove a timer and release the loop timer of an empty slot."""
+        self.cancelled += 1
+        del slot.timers[timer]
+        if slot.timers or self._slots.get(slot.timestamp) is not slot:
+            return
+        del self._slots[slot.timestamp]
+        assert slot.handle is not None
+        slot.handle.cancel()
+
+    @callback
+    def _async_run_slot(self, slot: _TimerSlot) -> None:
+        """Run the timers of a slot that is due."""
+        if self._slots.get(slot.timestamp) is slot:
+            del self._slots[slot.timestamp]
+        late = max(time.time() - slot.timestamp, 0.0)
+        self.max_late = max(self.max_late, late)
+        self.total_late += late
+        for timer in list(slot.timers):
+            # An earlier callback of the slot may have cancelled this one
+            if timer.slot is None:
+                continue
+            timer.slot = None
+            self.fired += 1
+            try:
+                timer.target()
+            except Exception as err:  # pylint: disable=broad-except
+                self._loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer callback {timer.target!r}",
+                        "exception": err,
+                    }
+                )
+        slot.timers.clear()
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return statistics about the scheduled timers."""
+        return {
+            "pending": sum(len(slot.timers) for slot in self._slots.values()),
+            "slots": len(self._slots),
+            "scheduled": self.scheduled,
+            "coalesced": self.coalesced,
+            "cancelled": self.cancelled,
+            "fired": self.fired,
+            "max_late": self.max_late,
+            "average_late": self.total_late / self.fired if self.fired else 0.0,
+        }
+
+
+@callback
+def async_get_timer_scheduler(hass: HomeAssistant) -> TimerScheduler:
+    """Return the timer scheduler of a Home Assistant instance."""
+    if (scheduler := hass.data.get(TIMER_SCHEDULER)) is None:
+        scheduler = hass.data[TIMER_SCHEDULER] = TimerScheduler(hass.loop)
+    return cast(TimerScheduler, scheduler)
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -1265,10 +1394,12 @@ def async_track_point_in_utc_time(
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    job = action if isinstance(action, HassJob) else HassJob(action)
+    scheduler = async_get_timer_scheduler(hass)
+    timestamp = utc_point_in_time.timestamp()
 
     @callback
-    def run_action(job: HassJob[Awaitable[None] | None]) -> None:
+    def run_action() -> None:
         """Call the action."""
         nonlocal cancel_callback
 
@@ -1282,20 +1413,17 @@ def async_track_point_in_utc_time(
         if (delta := (utc_point_in_time - now).total_seconds()) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
+            cancel_callback = scheduler.async_schedule(time.time() + delta, run_action)
             return
 
         hass.async_run_hass_job(job, utc_point_in_time)
 
-    job = action if isinstance(action, HassJob) else HassJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
+    cancel_callback = scheduler.async_schedule(timestamp, run_action)
 
     @callback
     def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+        """Cancel the scheduled timer."""
+        cancel_callback()
 
     return unsub_point_in_time_listener
 
@@ -1469,11 +1597,11 @@ def async_track_utc_time_change(
     if all(val is None for val in (hour, minute, second)):
 
         @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_hass_job(job, cast(datetime, event.data[ATTR_NOW]))
+        def time_change_listener(now: datetime) -> None:
+            """Fire every tick of the timer."""
+            hass.async_run_hass_job(job, now)
 
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
+        return hass.bus.async_listen_tick(time_change_listener)
 
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
@@ -0,0 +1,144 @@
+"""Opt-in instrumentation of state writes and event listeners.
+
+While enabled, entities report every state write and the event bus reports
+how long every listener it dispatched to ran. When disabled, the only cost
+is a lookup in hass.data per state write and a None check per listener.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+import functools
+from typing import Any
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+DATA_INSTRUMENTATION = "instrumentation"
+
+
+@dataclass
+class WriteStats:
+    """Statistics of the state writes of an integration or entity."""
+
+    writes: int = 0
+    suppressed: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class ListenerStats:
+    """Statistics of an event listener.
+
+    Only callback listeners run to completion in the event loop, so the
+    time of coroutine and executor listeners is not measured.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+
+
+def _listener_name(job: HassJob[Any]) -> str:
+    """Return a readable name for the target of a listener."""
+    target = job.target
+    while isinstance(target, functools.partial):
+        target = target.func
+    module = getattr(target, "__module__", None)
+    if (name := getattr(target, "__qualname__", None)) is None:
+        return repr(target)
+    return f"{module}.{name}" if module else name
+
+
+def _sorted_stats(stats: dict[str, Any], limit: int | None) -> dict[str, Any]:
+    """Return the stats as dicts with the most time consuming first."""
+    ordered = sorted(stats.items(), key=lambda item: item[1].seconds, reverse=True)
+    return {key: asdict(value) for key, value in ordered[:limit]}
+
+
+class Instrumentation:
+    """Collect state write and event listener statistics."""
+
+    def __init__(self) -> None:
+        """Initialize the instrumentation."""
+        self.started = dt_util.utcnow()
+        self.integrations: defaultdict[str, WriteStats] = defaultdict(WriteStats)
+        self.entities: defaultdict[str, WriteStats] = defaultdict(WriteStats)
+        self.listeners: defaultdict[str, ListenerStats] = defaultdict(ListenerStats)
+
+    @callback
+    def async_record_state_write(
+        self, integration: str, entity_id: str, seconds: float, suppressed: bool
+    ) -> None:
+        """Record a state write of an entity.
+
+        A suppressed write did not change the state machine because the
+        state and attributes were the same as before.
+        """
+        for stats in (self.integrations[integration], self.entities[entity_id]):
+            stats.writes += 1
+            stats.seconds += seconds
+            if suppressed:
+                stats.suppressed += 1
+
+    @callback
+    def async_record_listener(self, job: HassJob[Any], seconds: float | None) -> None:
+        """Record a call of an event listener."""
+        stats = self.listeners[_listener_name(job)]
+        stats.calls += 1
+        if seconds is not None:
+            stats.seconds += seconds
+
+    @callback
+    def async_as_dict(self, limit: int | None = None) -> dict[str, Any]:
+        """Return the statistics with the most time consuming first."""
+        return {
+            "started": self.started.isoformat(),
+            "integrations": _sorted_stats(self.integrations, limit),
+            "entities": _sorted_stats(self.entities, limit),
+            "listeners": _sorted_stats(self.listeners, limit),
+        }
+
+    @callback
+    def async_summary(self, limit: int) -> str:
+        """Return a human readable summary of the most time consuming entries."""
+        lines = [f"Instrumentation since {self.started.isoformat()}"]
+        for title, section in (
+            ("integrations", self.integrations),
+            ("entities", self.entities),
+        ):
+            lines.append(f"State writes by {title}:")
+            lines.extend(
+                f"  {key}: {stats['writes']} writes"
+                f" ({stats['suppressed']} suppressed) in {stats['seconds']:.3f}s"
+                for key, stats in _sorted_stats(section, limit).items()
+            )
+        lines.append("Event listeners:")
+        lines.extend(
+            f"  {key}: {stats['calls']} calls in {stats['seconds']:.3f}s"
+            for key, stats in _sorted_stats(self.listeners, limit).items()
+        )
+        return "\n".join(lines)
+
+
+@callback
+def async_get(hass: HomeAssistant) -> Instrumentation | None:
+    """Return the active instrumentation or None if it is disabled."""
+    instrumentation: Instrumentation | None = hass.data.get(DATA_INSTRUMENTATION)
+    return instrumentation
+
+
+@callback
+def async_enable(hass: HomeAssistant) -> Instrumentation:
+    """Enable the instrumentation or return the active one."""
+    if (instrumentation := async_get(hass)) is None:
+        instrumentation = hass.data[DATA_INSTRUMENTATION] = Instrumentation()
+        hass.bus.async_set_listener_timer(instrumentation.async_record_listener)
+    return instrumentation
+
+
+@callback
+def async_disable(hass: HomeAssistant) -> Instrumentation | None:
+    """Disable the instrumentation and return what it collected."""
+    hass.bus.async_set_listener_timer(None)
+    instrumentation: Instrumentation | None = hass.data.pop(DATA_INSTRUMENTATION, None)
+    return instrumentation
@@ -1,7 +1,28 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 import datetime
 import json
-from typing import Any
+import math
+import re
+from typing import Any, Final
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Hand other objects to the original method.
+    """
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -12,14 +33,10 @@ class JSONEncoder(json.JSONEncoder):
 
         Hand other objects to the original method.
         """
-        if isinstance(o, datetime.datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
-
-        return json.JSONEncoder.default(self, o)
+        try:
+            return json_encoder_default(o)
+        except TypeError:
+            return json.JSONEncoder.default(self, o)
 
 
 class ExtendedJSONEncoder(JSONEncoder):
@@ -40,3 +57,99 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Convert objects orjson does not serialize the way the stdlib does.
+
+    orjson serializes exact floats and tuples itself, only subclasses like
+    named tuples reach this hook.
+    """
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, tuple):
+        return list(obj)
+    return json_encoder_default(obj)
+
+
+def _has_non_finite_float(data: Any, nulls: int) -> bool:
+    """Return if data contains NaN or infinity where orjson wrote null.
+
+    The walk stops as soon as None values account for all nulls in the output.
+    States check their attributes once, they keep the serialized attributes.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if obj is None:
+            nulls -= 1
+            if not nulls:
+                return False
+        elif isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            stack.extend(obj)
+        elif hasattr(obj, "attributes_json"):
+            # Raises ValueError for non-finite floats in the attributes
+            obj.attributes_json()
+            stack.append(obj.context)
+        elif hasattr(obj, "as_dict"):
+            stack.append(obj.as_dict())
+    return False
+
+
+def _json_dumps_stdlib(data: Any) -> str:
+    """Dump json with the stdlib encoder."""
+    return json.dumps(data, cls=JSONEncoder, allow_nan=False, separators=(",", ":"))
+
+
+def _json_dumps_pretty_stdlib(data: Any) -> str:
+    """Dump indented json with the stdlib encoder."""
+    return json.dumps(data, cls=JSONEncoder, indent=4)
+
+
+# json_dumps and json_bytes raise ValueError for NaN and infinity with both
+# backends. orjson writes them as null, so output containing null is checked
+# until None values explain all of them.
+if orjson is not None:
+    # Dataclasses are passed to the default hook so their as_dict is used
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    # orjson only indents by 2, storage files have always been indented by 4
+    _INDENT_RE = re.compile(rb"^( +)", re.MULTILINE)
+
+    def json_bytes(data: Any) -> bytes:
+        """Dump json to bytes."""
+        result = orjson.dumps(data, option=_ORJSON_OPTIONS, default=_orjson_default)
+        if (nulls := result.count(b"null")) and _has_non_finite_float(data, nulls):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return result
+
+    def json_dumps(data: Any) -> str:
+        """Dump compact json."""
+        return json_bytes(data).decode("utf-8")
+
+    def json_dumps_pretty(data: Any) -> str:
+        """Dump indented json for files that are meant to be readable."""
+        result = orjson.dumps(
+            data,
+            option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2,
+            default=_orjson_default,
+        )
+        return _INDENT_RE.sub(lambda match: match[1] * 2, result).decode("utf-8")
+
+    JSON_BACKEND: Final = "orjson"
+
+else:  # pragma: no cover
+
+    def json_bytes(data: Any) -> bytes:
+        """Dump json to bytes."""
+        return _json_dumps_stdlib(data).encode("utf-8")
+
+    json_dumps = _json_dumps_stdlib
+    json_dumps_pretty = _json_dumps_pretty_stdlib
+
+    JSON_BACKEND: Final = "json"  # type: ignore[misc]
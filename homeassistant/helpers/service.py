@@ -61,6 +61,8 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+TARGET_CACHE = "service_target_cache"
+TARGET_CACHE_SIZE = 1024
 
 
 class ServiceParams(TypedDict):
@@ -130,6 +132,97 @@ class SelectedEntities:
         _LOGGER.warning("Unable to find referenced %s", ", ".join(parts))
 
 
+class _TargetCache:
+    """Cache the devices and entities referenced through devices and areas.
+
+    Keyed on the device and area ids of a target selector. The cache is
+    cleared as soon as the entity or device registry changes, checked with
+    their generation counters, and when the registries are replaced, e.g. by
+    loading them. Areas are only resolved through those two registries.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[
+            tuple[frozenset[str], frozenset[str]],
+            tuple[frozenset[str], frozenset[str]],
+        ] = {}
+        self._entities: entity_registry.EntityRegistryItems | None = None
+        self._devices: dict[str, device_registry.DeviceEntry] | None = None
+        self._generations = (-1, -1)
+
+    @callback
+    def async_resolve(
+        self,
+        ent_reg: entity_registry.EntityRegistry,
+        dev_reg: device_registry.DeviceRegistry,
+        device_ids: set[str],
+        area_ids: set[str],
+    ) -> tuple[frozenset[str], frozenset[str]]:
+        """Return the referenced devices and indirectly referenced entities."""
+        generations = (ent_reg.entities.generation, dev_reg.generation)
+        if (
+            self._entities is not ent_reg.entities
+            or self._devices is not dev_reg.devices
+            or self._generations != generations
+        ):
+            self._entries.clear()
+            self._entities = ent_reg.entities
+            self._devices = dev_reg.devices
+            self._generations = generations
+
+        key = (frozenset(device_ids), frozenset(area_ids))
+        if (resolved := self._entries.get(key)) is None:
+            if len(self._entries) >= TARGET_CACHE_SIZE:
+                self._entries.clear()
+            resolved = self._entries[key] = _async_resolve_target(
+                ent_reg, dev_reg, device_ids, area_ids
+            )
+        return resolved
+
+
+@callback
+def _async_resolve_target(
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    device_ids: set[str],
+    area_ids: set[str],
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Find the devices and entities referenced by device and area ids."""
+    # Find devices for this area
+    referenced_devices = set(device_ids)
+    for area_id in area_ids:
+        referenced_devices.update(
+            device_entry.id
+            for device_entry in device_registry.async_entries_for_area(dev_reg, area_id)
+        )
+
+    # Do not add config or diagnostic entities referenced by areas or devices
+    indirectly_referenced: set[str] = set()
+    for area_id in area_ids:
+        # when area matches the target area
+        indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id)
+            if ent_entry.entity_category is None
+        )
+    for device_id in referenced_devices:
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
+        ):
+            if ent_entry.entity_category is not None:
+                continue
+            if (
+                # when device matches a referenced devices with no explicitly set area
+                not ent_entry.area_id
+                # when device matches target device
+                or device_id in device_ids
+            ):
+                indirectly_referenced.add(ent_entry.entity_id)
+
+    return frozenset(referenced_devices), frozenset(indirectly_referenced)
+
+
 @bind_hass
 def call_from_config(
     hass: HomeAssistant,
@@ -359,33 +452,13 @@ def async_extract_referenced_entity_ids(
         if area_id not in area_reg.areas:
             selected.missing_areas.add(area_id)
 
-    # Find devices for this area
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
-
-    if not selector.area_ids and not selected.referenced_devices:
-        return selected
-
-    for ent_entry in ent_reg.entities.values():
-        # Do not add config or diagnostic entities referenced by areas or devices
-
-        if ent_entry.entity_category is not None:
-            continue
-
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+    if (target_cache := hass.data.get(TARGET_CACHE)) is None:
+        target_cache = hass.data[TARGET_CACHE] = _TargetCache()
+    referenced_devices, indirectly_referenced = target_cache.async_resolve(
+        ent_reg, dev_reg, selector.device_ids, selector.area_ids
+    )
+    selected.referenced_devices.update(referenced_devices)
+    selected.indirectly_referenced.update(indirectly_referenced)
 
     return selected
 
@@ -526,6 +599,24 @@ def async_set_service_schema(
     hass.data[SERVICE_DESCRIPTION_CACHE][f"{domain}.{service}"] = description
 
 
+def _get_referenced_platform_entities(
+    platform: EntityPlatform, entity_ids: set[str]
+) -> list[Entity]:
+    """Return the entities of a platform that are referenced.
+
+    Looks up the referenced entity ids when there are fewer of them than
+    entities in the platform, which is the common case for service calls.
+    """
+    entities = platform.entities
+    if len(entity_ids) < len(entities):
+        return [
+            entity
+            for entity_id in entity_ids
+            if (entity := entities.get(entity_id)) is not None
+        ]
+    return [entity for entity in entities.values() if entity.entity_id in entity_ids]
+
+
 @bind_hass
 async def entity_service_call(
     hass: HomeAssistant,
@@ -581,11 +672,7 @@ async def entity_service_call(
             else:
                 assert all_referenced is not None
                 entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
+                    _get_referenced_platform_entities(platform, all_referenced)
                 )
 
     elif target_all_entities:
@@ -605,10 +692,7 @@ async def entity_service_call(
 
         for platform in platforms:
             platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
+            for entity in _get_referenced_platform_entities(platform, all_referenced):
 
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
@@ -16,6 +16,8 @@ from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, c
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 
+from . import json as json_helper
+
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
 
@@ -286,6 +288,10 @@ class Store:
             self._private,
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
+            # Custom encoders are only supported by the stdlib json module
+            dump=json_helper.json_dumps_pretty
+            if self._encoder in (None, json_helper.JSONEncoder)
+            else None,
         )
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
@@ -4,6 +4,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager, suppress
@@ -19,7 +20,9 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
-from typing import Any, cast
+import threading
+from types import CodeType
+from typing import Any, NamedTuple, cast
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
@@ -69,6 +72,9 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+# Number of compiled templates shared by all template environments
+COMPILE_CACHE_SIZE = 4096
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -599,9 +605,7 @@ class Template:
         self._strict = strict
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        self._compiled = env.template_from_code(self.template, self._compiled_code)
 
         return self._compiled
 
@@ -1855,6 +1859,67 @@ class LoggingUndefined(jinja2.Undefined):
         return super().__bool__()
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of a CompileCache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompileCache:
+    """Bounded cache of compiled template code shared by all environments.
+
+    Entries are keyed on the kind of environment and the template source, the
+    least recently used entry is evicted when the cache is full. The compiled
+    code does not refer to the environment, it can be loaded into any
+    environment of the same kind. Templates are compiled from worker threads
+    as well, so the cache is guarded by a lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the compile cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], CodeType] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, kind: str, source: str, compile_source: Callable[[str], CodeType]
+    ) -> CodeType:
+        """Return the compiled code of source or compile and store it."""
+        key = (kind, source)
+        with self._lock:
+            if (code := self._entries.get(key)) is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return code
+            self.misses += 1
+        # Compile outside the lock, in the rare case two threads compile the
+        # same source at the same time both get a valid result
+        code = compile_source(source)
+        with self._lock:
+            self._entries[key] = code
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return code
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+COMPILE_CACHE = CompileCache(maxsize=COMPILE_CACHE_SIZE)
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -1866,6 +1931,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
+        if limited:
+            self.kind = "limited"
+        elif strict:
+            self.kind = "strict"
+        else:
+            self.kind = "default"
         self.template_cache = weakref.WeakValueDictionary()
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -1944,6 +2015,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.tests["search"] = regex_search
 
         if hass is None:
+            # Compiled code refers to the filters and tests the environment
+            # has, don't share it with the environments that have hass
+            self.kind = f"{self.kind}_no_hass"
             return
 
         # We mark these as a context functions to ensure they get
@@ -2058,9 +2132,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        return COMPILE_CACHE.get(self.kind, source, super().compile)
 
+    def template_from_code(self, source: str, code: CodeType) -> jinja2.Template:
+        """Return the template for compiled code, shared while it is in use."""
+        if (cached := self.template_cache.get(source)) is None:
+            cached = self.template_cache[source] = jinja2.Template.from_code(
+                self, code, self.globals, None
+            )
         return cached
 
 
@@ -6,17 +6,24 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    MATCH_ALL,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSON_BACKEND, JSONEncoder, json_dumps
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -119,6 +126,50 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_no_listeners(hass):
+    """Fire a million events without any listeners."""
+    return await _fire_events_with_listeners(hass, 0)
+
+
+@benchmark
+async def fire_events_10_listeners(hass):
+    """Fire 100k events to 10 listeners."""
+    return await _fire_events_with_listeners(hass, 10, 10 ** 5)
+
+
+@benchmark
+async def fire_events_1000_listeners(hass):
+    """Fire 1000 events to 1000 listeners."""
+    return await _fire_events_with_listeners(hass, 1000, 10 ** 3)
+
+
+async def _fire_events_with_listeners(hass, listener_count, events_to_fire=10 ** 6):
+    """Fire events to a number of callback listeners, half of them on MATCH_ALL."""
+    count = 0
+    event_name = "benchmark_event"
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listener_count):
+        hass.bus.async_listen(MATCH_ALL if idx % 2 else event_name, listener)
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire * listener_count
+
+    return timer() - start
+
+
 @benchmark
 async def time_changed_helper(hass):
     """Run a million events through time changed helper."""
@@ -391,6 +442,394 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_realistic_states(hass):
+    """Serialize 100k realistic states with the JSON backend and the stdlib."""
+    now = dt_util.utcnow()
+    attributes = [
+        {
+            "unit_of_measurement": "W",
+            "device_class": "power",
+            "state_class": "measurement",
+            "friendly_name": "Kitchen Power",
+        },
+        {
+            "brightness": 180,
+            "color_mode": "hs",
+            "hs_color": (30.0, 71.3),
+            "rgb_color": (255, 165, 73),
+            "xy_color": (0.54, 0.387),
+            "supported_color_modes": {"color_temp", "hs"},
+            "friendly_name": "Living Room Lights",
+            "supported_features": 44,
+        },
+        {
+            "latitude": 52.3731339,
+            "longitude": 4.8903147,
+            "gps_accuracy": 12,
+            "source_type": "gps",
+            "battery_level": 87,
+            "last_seen": now,
+            "friendly_name": "Phone",
+        },
+    ]
+    states = [
+        core.State(f"sensor.benchmark_{idx}", str(idx), attributes[idx % 3])
+        for idx in range(10 ** 5)
+    ]
+
+    start = timer()
+    json.dumps(states, cls=JSONEncoder)
+    print(f"stdlib json: {timer() - start}s")
+
+    start = timer()
+    json_dumps(states)
+    runtime = timer() - start
+    print(f"{JSON_BACKEND}: {runtime}s")
+    return runtime
+
+
+@benchmark
+async def state_changes_unchanged_attributes(hass):
+    """Write and serialize 100k state changes that keep their attributes."""
+    attributes = {
+        "brightness": 180,
+        "color_mode": "hs",
+        "hs_color": (30.0, 71.3),
+        "rgb_color": (255, 165, 73),
+        "xy_color": (0.54, 0.387),
+        "supported_color_modes": ["color_temp", "hs"],
+        "friendly_name": "Living Room Lights",
+        "supported_features": 44,
+    }
+    entity_ids = [f"light.benchmark_{idx}" for idx in range(1000)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "on", dict(attributes))
+
+    start = timer()
+    for idx in range(100):
+        for entity_id in entity_ids:
+            # Entities build a new dict with every write
+            hass.states.async_set(entity_id, str(idx), dict(attributes))
+            state = hass.states.get(entity_id)
+            # Like the recorder and the websocket api serializing the state
+            state.attributes_json()
+            state.as_dict_json()
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 100k state changes to SQLite with the default write path."""
+    return await _recorder_write_states(hass, False)
+
+
+@benchmark
+async def recorder_bulk_write_states(hass):
+    """Record 100k state changes to SQLite with bulk writes."""
+    return await _recorder_write_states(hass, True)
+
+
+async def _recorder_write_states(hass, bulk_write):
+    """Record state changed events for 1000 entities to a SQLite database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    events_to_record = 10 ** 5
+
+    with TemporaryDirectory() as tmpdir:
+        instance = recorder.Recorder(
+            hass,
+            auto_purge=False,
+            keep_days=10,
+            commit_interval=1,
+            bulk_write=bulk_write,
+            uri=f"sqlite:///{tmpdir}/benchmark.db",
+            db_max_retries=1,
+            db_retry_wait=1,
+            entity_filter=lambda entity_id: True,
+            exclude_t=[],
+        )
+        instance.async_initialize()
+        hass.state = core.CoreState.running
+        instance.start()
+        assert await instance.async_db_ready
+        await instance.async_recorder_ready.wait()
+
+        start = timer()
+
+        for idx in range(events_to_record):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx % 1000}",
+                idx,
+                {"unit_of_measurement": "W", "friendly_name": "Benchmark"},
+            )
+            if idx % 1000 == 999:
+                # Commit once per 1000 events, the recorder queues
+                # its commits on the ticks of the timer
+                hass.bus.async_fire_tick(dt_util.utcnow())
+        # The commit is queued behind all the events
+        hass.bus.async_fire_tick(dt_util.utcnow())
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.block_till_done)
+
+        runtime = timer() - start
+        print(f"Recorded {events_to_record / runtime:.0f} events/second")
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.join)
+
+    return runtime
+
+
+@benchmark
+async def history_minimal_response_states(hass):
+    """Load 7 days of history for 200 sensors as minimal response states."""
+    return await _history_states(hass, False)
+
+
+@benchmark
+async def history_numeric_states(hass):
+    """Load 7 days of history for 200 sensors as numeric columns."""
+    return await _history_states(hass, True)
+
+
+async def _history_states(hass, numeric):
+    """Query a generated SQLite database with 2M states."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder import history, models
+
+    entity_count = 200
+    states_per_entity = 10 ** 4
+    end = dt_util.utcnow()
+    start = end - timedelta(days=7)
+    interval = (end - start) / states_per_entity
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entity_count)]
+
+    with TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/benchmark.db")
+        models.Base.metadata.create_all(engine)
+        attributes = json.dumps({"unit_of_measurement": "W"})
+        with engine.begin() as conn:
+            for step in range(states_per_entity):
+                timestamp = start + interval * step
+                conn.execute(
+                    models.States.__table__.insert(),
+                    [
+                        {
+                            "domain": "sensor",
+                            "entity_id": entity_id,
+                            "state": "unavailable" if step % 100 == 0 else str(step),
+                            "attributes": attributes,
+                            "last_changed": timestamp,
+                            "last_updated": timestamp,
+                        }
+                        for entity_id in entity_ids
+                    ],
+                )
+
+        history.async_setup(hass)
+
+        def _query():
+            with Session(engine) as session:
+                if numeric:
+                    return history.get_numeric_states_with_session(
+                        hass, session, start, end, include_start_time_state=False
+                    )
+                return history.get_significant_states_with_session(
+                    hass,
+                    session,
+                    start,
+                    end,
+                    include_start_time_state=False,
+                    minimal_response=True,
+                )
+
+        begin = timer()
+        result = await hass.async_add_executor_job(_query)
+        runtime = timer() - begin
+        engine.dispose()
+
+    print(f"Loaded history for {len(result)} entities")
+    return runtime
+
+
+@benchmark
+async def template_compile_startup(hass):
+    """Compile 10k templates using 100 distinct sources with a cold cache."""
+    return await _template_compile(hass, False)
+
+
+@benchmark
+async def template_compile_reload(hass):
+    """Compile 10k templates again after they were unloaded."""
+    return await _template_compile(hass, True)
+
+
+async def _template_compile(hass, reload):
+    """Compile templates like template entities and automations do."""
+    # pylint: disable=import-outside-toplevel
+    import gc
+
+    from homeassistant.helpers import template
+
+    sources = [
+        f"{{{{ states('sensor.benchmark_{idx}') | float(0) * {idx} | round(2) }}}}"
+        if idx % 2
+        else f"{{% if is_state('light.benchmark_{idx}', 'on') %}}on{{% endif %}}"
+        for idx in range(100)
+    ]
+
+    def _compile():
+        templates = [template.Template(source, hass) for source in sources * 100]
+        for tpl in templates:
+            tpl._ensure_compiled()  # pylint: disable=protected-access
+        return templates
+
+    template.COMPILE_CACHE.cache_clear()
+    if reload:
+        _compile()
+        # Unload the templates like a reload of the integrations using them
+        gc.collect()
+
+    begin = timer()
+    _compile()
+    runtime = timer() - begin
+
+    print("Compile cache:", template.COMPILE_CACHE.cache_info())
+    return runtime
+
+
+@benchmark
+async def template_render_domain_states(hass):
+    """Render templates iterating one domain of a large state machine."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    for domain in ("sensor", "binary_sensor", "light", "switch", "automation"):
+        for idx in range(2000):
+            hass.states.async_set(f"{domain}.benchmark_{idx}", idx)
+
+    tpl = template.Template(
+        "{{ states.sensor | count }} {{ states.sensor | map(attribute='state')"
+        " | join(',') }}",
+        hass,
+    )
+    tpl.ensure_valid()
+
+    begin = timer()
+    for _ in range(10 ** 2):
+        tpl.async_render()
+    return timer() - begin
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match a million messages against 5000 zigbee2mqtt style subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.trie import TopicTrie
+
+    trie = TopicTrie()
+    topic_filters = ["homeassistant/+/+/+/config", "zigbee2mqtt/bridge/#", "$SYS/#"]
+    for device in range(1250):
+        topic_filters.extend(
+            f"zigbee2mqtt/device_{device}{suffix}"
+            for suffix in ("", "/availability", "/set", "/+/state")
+        )
+    for index, topic_filter in enumerate(topic_filters):
+        trie.add(topic_filter, index)
+
+    topics = [
+        "zigbee2mqtt/device_17",
+        "zigbee2mqtt/device_999/availability",
+        "zigbee2mqtt/device_1249/l1/state",
+        "zigbee2mqtt/bridge/state",
+        "homeassistant/sensor/0x00158d0001/temperature/config",
+        "tasmota/discovery/DC4F22/config",
+    ]
+    messages = 10 ** 6
+
+    start = timer()
+    for index in range(messages):
+        trie.match(topics[index % len(topics)])
+    return timer() - start
+
+
+@benchmark
+async def yaml_load_config(hass):
+    """Load a configuration split over 400 YAML files with libyaml."""
+    return await hass.async_add_executor_job(_yaml_load_config, False, False)
+
+
+@benchmark
+async def yaml_load_config_python(hass):
+    """Load a configuration split over 400 YAML files with the pure Python loader."""
+    return await hass.async_add_executor_job(_yaml_load_config, False, True)
+
+
+@benchmark
+async def yaml_load_config_cached(hass):
+    """Load a configuration split over 400 YAML files from the parsed cache."""
+    return await hass.async_add_executor_job(_yaml_load_config, True, False)
+
+
+def _yaml_load_config(cached, python_loader):
+    """Load configuration.yaml including 400 automation files."""
+    # pylint: disable=import-outside-toplevel
+    from pathlib import Path
+
+    from homeassistant.util.yaml import loader as yaml_loader
+
+    with TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+        (config_dir / "secrets.yaml").write_text("api_key: secret\n")
+        (config_dir / "configuration.yaml").write_text(
+            "homeassistant:\n  name: Benchmark\n"
+            "sensor:\n  - platform: demo\n    api_key: !secret api_key\n"
+            "automation: !include_dir_merge_list automations\n"
+        )
+        (config_dir / "automations").mkdir()
+        for index in range(400):
+            (config_dir / "automations" / f"automation_{index}.yaml").write_text(
+                "".join(
+                    f"- id: '{index}_{number}'\n"
+                    f"  alias: Automation {index} {number}\n"
+                    "  trigger:\n"
+                    "    - platform: state\n"
+                    f"      entity_id: binary_sensor.motion_{index}\n"
+                    "      to: 'on'\n"
+                    "  condition:\n"
+                    "    - condition: time\n"
+                    "      after: '07:00:00'\n"
+                    "  action:\n"
+                    "    - service: light.turn_on\n"
+                    "      target:\n"
+                    f"        entity_id: light.room_{index}\n"
+                    "      data:\n"
+                    "        brightness_pct: 80\n"
+                    for number in range(5)
+                )
+            )
+
+        configuration = str(config_dir / "configuration.yaml")
+        if cached:
+            yaml_loader.load_yaml(configuration, yaml_loader.Secrets(config_dir))
+
+        fast_loader = yaml_loader.FastSafeLoader
+        if python_loader:
+            yaml_loader.FastSafeLoader = yaml_loader.SafeLineLoader
+        try:
+            start = timer()
+            yaml_loader.load_yaml(configuration, yaml_loader.Secrets(config_dir))
+            return timer() - start
+        finally:
+            yaml_loader.FastSafeLoader = fast_loader
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -50,13 +50,19 @@ def save_json(
     *,
     encoder: type[json.JSONEncoder] | None = None,
     atomic_writes: bool = False,
+    dump: Callable[[Any], str] | None = None,
 ) -> None:
     """Save JSON data to a file.
 
+    A dump function replaces json.dumps and the encoder when given.
+
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if dump is None:
+            json_data = json.dumps(data, indent=4, cls=encoder)
+        else:
+            json_data = dump(data)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
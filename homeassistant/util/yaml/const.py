@@ -1,2 +1,6 @@
 """Constants."""
+import os
+
 SECRET_YAML = "secrets.yaml"
+# Parsed YAML cache, relative to the configuration directory
+YAML_CACHE_DIR = os.path.join(".storage", "yaml_cache")
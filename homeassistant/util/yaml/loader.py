@@ -2,18 +2,31 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from contextlib import suppress
 import fnmatch
+import hashlib
+import io
 import logging
 import os
 from pathlib import Path
+import pickle
+import tempfile
 from typing import Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:  # pragma: no cover
+    HAS_C_LOADER = False
+    FastestAvailableSafeLoader = yaml.SafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import SECRET_YAML
+from .const import SECRET_YAML, YAML_CACHE_DIR
 from .objects import Input, NodeListClass, NodeStrClass
 
 # mypy: allow-untyped-calls, no-warn-return-any
@@ -23,6 +36,20 @@ DICT_T = TypeVar("DICT_T", bound=dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Tags whose value depends on more than the file they are in
+DYNAMIC_TAGS = {
+    "!env_var",
+    "!include",
+    "!include_dir_list",
+    "!include_dir_merge_list",
+    "!include_dir_merge_named",
+    "!include_dir_named",
+    "!secret",
+}
+
+# Bump when the objects the loader creates or the cache entries change
+CACHE_VERSION = 2
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -88,7 +115,39 @@ class Secrets:
         return secrets
 
 
-class SafeLineLoader(yaml.SafeLoader):
+class _LoaderMixin:
+    """Track whether the loaded document only depends on its own file."""
+
+    cacheable = True
+
+    def construct_object(self, node: yaml.nodes.Node, deep: bool = False) -> Any:
+        """Construct an object and note tags that load other data."""
+        if node.tag in DYNAMIC_TAGS:
+            self.cacheable = False
+        return super().construct_object(node, deep)  # type: ignore[misc]
+
+
+class FastSafeLoader(_LoaderMixin, FastestAvailableSafeLoader):
+    """Loader class using libyaml when it is available.
+
+    Line numbers are taken from the node marks, so objects get the same
+    __config_file__ and __line__ references as with the SafeLineLoader.
+    """
+
+    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+        """Initialize a fast safe loader."""
+        super().__init__(stream)
+        if isinstance(stream, str):
+            self.name = "<unicode string>"
+        elif isinstance(stream, bytes):
+            self.name = "<byte string>"
+        else:
+            self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+        self.secrets = secrets
+
+
+class SafeLineLoader(_LoaderMixin, yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
     def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
@@ -104,52 +163,161 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+class ParsedYamlCache:
+    """Cache of parsed YAML files stored in the configuration directory.
+
+    Entries are only used while the SHA-256 digest of the file content is
+    unchanged, so edits are seen even when the modification time is coarse
+    or the file keeps its size. Documents using secrets, environment
+    variables or includes are never cached, so the cache does not hold
+    secrets and can't go stale when secrets.yaml or an included file changes.
+
+    Every entry starts with a small header naming the file it was parsed
+    from, which allows pruning entries without loading the documents.
+    """
+
+    def __init__(self, config_dir: Path) -> None:
+        """Initialize the cache."""
+        self.cache_dir = os.path.join(config_dir, YAML_CACHE_DIR)
+
+    def _cache_path(self, fname: str) -> str:
+        """Return the path of the cache entry for a file."""
+        digest = hashlib.sha1(os.path.abspath(fname).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pickle")
+
+    def get(self, fname: str, content_digest: str) -> JSON_TYPE | None:
+        """Return the cached document for a file if it is still valid."""
+        try:
+            with open(self._cache_path(fname), "rb") as cache_file:
+                version, _, digest = pickle.load(cache_file)
+                if (version, digest) != (CACHE_VERSION, content_digest):
+                    return None
+                data: JSON_TYPE = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Ignoring unreadable YAML cache entry for %s", fname)
+            return None
+        return data
+
+    def set(self, fname: str, content_digest: str, data: JSON_TYPE) -> None:
+        """Store the parsed document of a file."""
+        tmp_filename = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="wb", dir=self.cache_dir, delete=False
+            ) as tmp_file:
+                tmp_filename = tmp_file.name
+                pickle.dump(
+                    (CACHE_VERSION, os.path.abspath(fname), content_digest),
+                    tmp_file,
+                    pickle.HIGHEST_PROTOCOL,
+                )
+                pickle.dump(data, tmp_file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filename, self._cache_path(fname))
+        except (OSError, pickle.PicklingError) as err:
+            _LOGGER.debug("Unable to cache parsed YAML of %s: %s", fname, err)
+            if tmp_filename is not None:
+                with suppress(OSError):
+                    os.remove(tmp_filename)
+
+    def prune(self) -> None:
+        """Remove the entries of files that no longer exist."""
+        try:
+            entries = os.scandir(self.cache_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                try:
+                    with open(entry.path, "rb") as cache_file:
+                        version, fname, _ = pickle.load(cache_file)
+                    stale = version != CACHE_VERSION or not os.path.exists(fname)
+                except Exception:  # pylint: disable=broad-except
+                    stale = True
+                if stale:
+                    _LOGGER.debug("Removing stale YAML cache entry %s", entry.name)
+                    with suppress(OSError):
+                        os.remove(entry.path)
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Files loaded with secrets are part of the configuration and use the parsed
+    YAML cache in the configuration directory.
+    """
+    cache = None
+    if secrets is not None and os.path.isfile(fname):
+        cache = ParsedYamlCache(secrets.config_dir)
+
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            if cache is None:
+                return _parse_yaml(conf_file, secrets)[0]
+            content = conf_file.read()
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    content_digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if (cached := cache.get(fname, content_digest)) is not None:
+        return cached
+
+    stream = io.StringIO(content)
+    # The loader takes the name for the __config_file__ references
+    stream.name = fname  # type: ignore[attr-defined]
+    data, cacheable = _parse_yaml(stream, secrets)
+    if cacheable:
+        cache.set(fname, content_digest, data)
+    return data
+
 
 def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    return _parse_yaml(content, secrets)[0]
+
+
+def _parse_yaml(
+    content: str | TextIO, secrets: Secrets | None = None
+) -> tuple[JSON_TYPE, bool]:
+    """Load a YAML document and return if it only depends on its content."""
+    loader = FastSafeLoader(content, secrets)
     try:
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
-        return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
-            or OrderedDict()
-        )
+        return loader.get_single_data() or OrderedDict(), loader.cacheable
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
+    finally:
+        loader.dispose()
+
+
+LoaderType = Union[FastSafeLoader, SafeLineLoader]
 
 
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> DICT_T:
+def _add_reference(obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -160,7 +328,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -191,9 +359,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -206,7 +372,7 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -221,7 +387,7 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -233,7 +399,7 @@ def _include_dir_list_yaml(
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -247,7 +413,7 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -279,13 +445,13 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
@@ -298,7 +464,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
@@ -306,19 +472,19 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+def add_constructor(tag: Any, constructor: Callable) -> None:
+    """Add a constructor to all YAML loaders."""
+    for loader in (FastSafeLoader, SafeLineLoader):
+        loader.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!input", Input.from_node)
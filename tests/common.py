@@ -40,7 +40,6 @@ from homeassistant.const import (
     DEVICE_DEFAULT_NAME,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     STATE_OFF,
     STATE_ON,
 )
@@ -385,7 +384,7 @@ def async_fire_time_changed(
     if datetime_ is None:
         datetime_ = date_util.utcnow()
 
-    hass.bus.async_fire(EVENT_TIME_CHANGED, {"now": date_util.as_utc(datetime_)})
+    hass.bus.async_fire_tick(date_util.as_utc(datetime_))
 
     for task in list(hass.loop._scheduled):
         if not isinstance(task, asyncio.TimerHandle):
@@ -678,6 +678,109 @@ async def test_fetch_period_api_with_entity_glob_include(hass, hass_client):
     assert response_json[0][0]["entity_id"] == "light.kitchen"
 
 
+async def test_fetch_period_api_with_numeric_response(hass, hass_client):
+    """Test the fetch period view for history with numeric_response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(
+        hass,
+        "history",
+        {
+            "history": {
+                "use_include_order": True,
+                "include": {"entities": ["sensor.power", "sensor.energy"]},
+            }
+        },
+    )
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.energy", "1.5")
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.power", "unknown", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?numeric_response",
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert list(response_json) == ["sensor.power", "sensor.energy"]
+    assert response_json["sensor.power"]["s"] == [10.0, None]
+    assert response_json["sensor.energy"]["s"] == [1.5]
+    assert len(response_json["sensor.energy"]["lu"]) == 1
+    assert "a" not in response_json["sensor.power"]
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"numeric_response": "", "include_attributes": ""},
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert response_json["sensor.power"]["a"] == [
+        {"unit_of_measurement": "W"},
+        {"unit_of_measurement": "W"},
+    ]
+
+
+async def test_numeric_states_during_period(hass, hass_ws_client):
+    """Test the numeric states websocket command."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.energy", "1.5")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/numeric_states_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert list(response["result"]) == ["sensor.power"]
+    assert response["result"]["sensor.power"]["s"] == [10.0]
+    assert "a" not in response["result"]["sensor.power"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/numeric_states_during_period",
+            "start_time": start.isoformat(),
+            "include_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sensor.power"]["a"] == [{"unit_of_measurement": "W"}]
+    assert response["result"]["sensor.energy"]["a"] == [{}]
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/numeric_states_during_period",
+            "start_time": "invalid",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def test_fetch_period_api_with_entity_glob_exclude(hass, hass_client):
     """Test the fetch period view for history."""
     await hass.async_add_executor_job(init_recorder_component, hass)
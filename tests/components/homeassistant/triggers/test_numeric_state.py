@@ -13,6 +13,7 @@ from homeassistant.components.homeassistant.triggers import (
 from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
 from homeassistant.core import Context
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1878,3 +1879,54 @@ async def test_template_variable(hass, calls, multiplier):
         assert len(calls) == 1
     else:
         assert len(calls) == 0
+
+
+async def test_triggers_share_entity_dispatch(hass, calls):
+    """Test triggers on an entity share a listener and parse the state once."""
+    hass.states.async_set("test.entity", 15)
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        **thresholds,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"name": name},
+                    },
+                }
+                for name, thresholds in (
+                    ("below_10", {"below": 10}),
+                    ("below_5", {"below": 5}),
+                    ("between", {"above": 2, "below": 8}),
+                    ("entity", {"below": "input_number.value_10"}),
+                )
+            ]
+        },
+    )
+    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.entity"]) == 1
+
+    with patch(
+        "homeassistant.components.homeassistant.triggers.state_dispatch.float",
+        side_effect=float,
+        create=True,
+    ) as parse_float:
+        hass.states.async_set("test.entity", 7)
+        await hass.async_block_till_done()
+    assert sorted(call.data["name"] for call in calls) == [
+        "below_10",
+        "between",
+        "entity",
+    ]
+    assert parse_float.call_count == 1
+
+    hass.states.async_set("test.entity", 3)
+    await hass.async_block_till_done()
+    assert sorted(call.data["name"] for call in calls[3:]) == ["below_5"]
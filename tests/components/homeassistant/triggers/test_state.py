@@ -5,10 +5,14 @@ from unittest.mock import patch
 import pytest
 
 import homeassistant.components.automation as automation
-from homeassistant.components.homeassistant.triggers import state as state_trigger
+from homeassistant.components.homeassistant.triggers import (
+    state as state_trigger,
+    state_dispatch,
+)
 from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
 from homeassistant.core import Context
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1553,3 +1557,110 @@ async def test_variables_priority(hass, calls):
         await hass.async_block_till_done()
         assert len(calls) == 2
         assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+def _automation(name, trigger):
+    """Return the config of an automation calling test.automation with its name."""
+    return {
+        "id": name,
+        "alias": name,
+        "trigger": {"platform": "state", "entity_id": "test.entity", **trigger},
+        "action": {"service": "test.automation", "data": {"name": name}},
+    }
+
+
+async def test_triggers_share_entity_dispatch(hass, calls):
+    """Test state triggers on an entity share a single state change listener."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                _automation("to_world", {"to": "world"}),
+                _automation("from_hello", {"from": "hello"}),
+                _automation("attribute", {"attribute": "name"}),
+            ]
+        },
+    )
+    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.entity"]) == 1
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert sorted(call.data["name"] for call in calls) == ["from_hello", "to_world"]
+
+    hass.states.async_set("test.entity", "world", {"name": "bob"})
+    await hass.async_block_till_done()
+    assert [call.data["name"] for call in calls[2:]] == ["attribute"]
+
+
+async def test_for_cancelled_through_shared_dispatch(hass, calls):
+    """Test a for timer is cancelled by the dispatch shared with other triggers."""
+    dispatcher = state_dispatch.async_get_dispatcher(hass)
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                _automation("world_for", {"to": "world", "for": {"seconds": 5}}),
+                _automation("hello_for", {"to": "hello", "for": {"seconds": 5}}),
+                _automation("any", {}),
+            ]
+        },
+    )
+    assert len(dispatcher._listeners["test.entity"]) == 3
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    # The pending timer listens through the shared dispatch as well
+    assert len(dispatcher._listeners["test.entity"]) == 4
+    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.entity"]) == 1
+
+    hass.states.async_set("test.entity", "hello")
+    await hass.async_block_till_done()
+    # The world timer is cancelled and a hello timer started
+    assert len(dispatcher._listeners["test.entity"]) == 4
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert [call.data["name"] for call in calls] == ["any", "any", "hello_for"]
+    assert len(dispatcher._listeners["test.entity"]) == 3
+
+
+async def test_remove_automation_with_pending_for(hass, calls):
+    """Test removing an automation cancels its pending for timer."""
+    dispatcher = state_dispatch.async_get_dispatcher(hass)
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                _automation("first", {"to": "world", "for": {"seconds": 5}}),
+                _automation("second", {"to": "world", "for": {"seconds": 5}}),
+            ]
+        },
+    )
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(dispatcher._listeners["test.entity"]) == 4
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "automation.first"},
+        blocking=True,
+    )
+    assert len(dispatcher._listeners["test.entity"]) == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert [call.data["name"] for call in calls] == ["second"]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "automation.second"},
+        blocking=True,
+    )
+    assert "test.entity" not in dispatcher._listeners
+    assert "test.entity" not in hass.data[TRACK_STATE_CHANGE_CALLBACKS]
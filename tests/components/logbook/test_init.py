@@ -1864,6 +1864,144 @@ async def test_context_filter(hass, hass_client):
     assert response.status == HTTPStatus.BAD_REQUEST
 
 
+async def test_logbook_stream_view_pagination(hass, hass_client):
+    """Test the stream view pages through entries with a cursor."""
+    await async_init_recorder_component(hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=2
+    )
+    # Three entries in the first group, two in the second and one in the third
+    for index, minutes in enumerate((1, 2, 3, 20, 21, 40)):
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=start + timedelta(minutes=minutes),
+        ):
+            logbook.async_log_entry(hass, f"entry {index}", "logged", "switch")
+    await _async_commit_and_wait(hass)
+    client = await hass_client()
+
+    async def fetch_page(params):
+        response = await client.get(
+            f"/api/logbook_stream/{start.isoformat()}",
+            params={"end_time": str(start + timedelta(hours=1)), **params},
+        )
+        assert response.status == HTTPStatus.OK
+        return await response.json()
+
+    # Pages end after the limit even inside a group
+    page = await fetch_page({"limit": 2})
+    assert [entry["name"] for entry in page["events"]] == ["entry 0", "entry 1"]
+
+    page = await fetch_page({"limit": 2, "cursor": page["next_cursor"]})
+    assert [entry["name"] for entry in page["events"]] == ["entry 2", "entry 3"]
+
+    page = await fetch_page({"limit": 2, "cursor": page["next_cursor"]})
+    assert [entry["name"] for entry in page["events"]] == ["entry 4", "entry 5"]
+    assert page["next_cursor"] is None
+
+    page = await fetch_page({})
+    assert len(page["events"]) == 6
+    assert page["next_cursor"] is None
+
+    for params in (
+        {"limit": 0},
+        {"limit": "many"},
+        {"cursor": "invalid"},
+        {"cursor": start.isoformat()},
+    ):
+        response = await client.get("/api/logbook_stream", params=params)
+        assert response.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_logbook_stream_view_limit_within_group(hass, hass_client):
+    """Test the limit caps pages of entries fired in the same group and time."""
+    await async_init_recorder_component(hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=2
+    )
+    # Seven entries within five minutes, three of them at the same time
+    for index, minutes in enumerate((1, 2, 2, 2, 3, 4, 5)):
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=start + timedelta(minutes=minutes),
+        ):
+            logbook.async_log_entry(hass, f"entry {index}", "logged", "switch")
+    await _async_commit_and_wait(hass)
+    client = await hass_client()
+
+    names = []
+    params = {"end_time": str(start + timedelta(hours=1)), "limit": 2}
+    while True:
+        response = await client.get(
+            f"/api/logbook_stream/{start.isoformat()}", params=params
+        )
+        assert response.status == HTTPStatus.OK
+        page = await response.json()
+        assert 0 < len(page["events"]) <= 2
+        names.extend(entry["name"] for entry in page["events"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert names == [f"entry {index}" for index in range(7)]
+
+
+async def test_event_stream(hass, hass_ws_client):
+    """Test live logbook entries are sent over the websocket."""
+    await async_init_recorder_component(hass)
+    assert await async_setup_component(hass, "logbook", {})
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("switch.other", STATE_OFF)
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "entity_ids": ["light.kitchen", "sensor.power"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+        context=context,
+    )
+    hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("switch.other", STATE_ON)
+    hass.states.async_set("light.kitchen", STATE_OFF, {"brightness": 10})
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    logbook.async_log_entry(hass, "Kitchen", "is bright", entity_id="light.kitchen")
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    entries = response["event"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], name="kitchen", entity_id="light.kitchen", state="on")
+    assert entries[0]["context_domain"] == "light"
+    assert entries[0]["context_service"] == "turn_on"
+
+    response = await client.receive_json()
+    entries = response["event"]
+    _assert_entry(entries[0], name="Kitchen", message="is bright")
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["success"]
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
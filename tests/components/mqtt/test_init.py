@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant.components import mqtt, websocket_api
 from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
+from homeassistant.components.mqtt.models import ReceiveMessage
 from homeassistant.const import (
     ATTR_ASSUMED_STATE,
     EVENT_HOMEASSISTANT_STARTED,
@@ -1218,13 +1219,9 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=hass.data["mqtt"],
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -1365,6 +1362,81 @@ async def test_mqtt_ws_subscription(hass, hass_ws_client, mqtt_mock):
     assert response["success"]
 
 
+async def test_received_messages_handled_in_batches(
+    hass, hass_ws_client, mqtt_mock, calls, record_calls
+):
+    """Test messages from the client thread are handed to the loop in batches."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls, encoding=None)
+    mqtt_component = hass.data["mqtt"]
+
+    # The loop can't drain the queue before all messages are received
+    for index in range(3):
+        mqtt_component._mqtt_on_message(
+            None, None, ReceiveMessage(f"test-topic/{index}", b"on", 0, False)
+        )
+    assert not calls
+    await hass.async_block_till_done()
+
+    assert len(calls) == 9
+    assert [call[0].payload for call in calls[:3]] == ["on", "on", b"on"]
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "mqtt/message_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    stats = response["result"]
+    assert stats["batches"] == 1
+    assert stats["messages"] == 3
+    assert stats["last_batch_size"] == stats["max_batch_size"] == 3
+    assert stats["average_batch_size"] == 3
+    assert stats["max_lag"] >= stats["last_lag"] >= 0
+
+
+async def test_received_messages_drained_in_slices(
+    hass, hass_ws_client, mqtt_mock, calls, record_calls
+):
+    """Test a large batch of messages is handled over several loop callbacks."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    mqtt_component = hass.data["mqtt"]
+
+    with patch("homeassistant.components.mqtt.MAX_MESSAGES_PER_DRAIN", 2):
+        for index in range(5):
+            mqtt_component._mqtt_on_message(
+                None, None, ReceiveMessage(f"test-topic/{index}", b"on", 0, False)
+            )
+        # Each loop iteration handles a slice of the messages
+        for handled in (2, 4, 5):
+            await asyncio.sleep(0)
+            assert len(calls) == handled
+        await hass.async_block_till_done()
+
+    assert [call[0].topic for call in calls] == [
+        f"test-topic/{index}" for index in range(5)
+    ]
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "mqtt/message_stats"})
+    response = await client.receive_json()
+    stats = response["result"]
+    assert stats["batches"] == 3
+    assert stats["messages"] == 5
+    assert stats["max_batch_size"] == 2
+    assert stats["last_batch_size"] == 1
+
+
+async def test_message_stats_without_client(hass, hass_ws_client):
+    """Test getting message statistics before the MQTT client is set up."""
+    assert await async_setup_component(hass, websocket_api.DOMAIN, {})
+    websocket_api.async_register_command(hass, mqtt.websocket_message_stats)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "mqtt/message_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
 async def test_dump_service(hass, mqtt_mock):
     """Test that we can dump a topic."""
     mopen = mock_open()
@@ -0,0 +1,55 @@
+"""Test the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("test-topic", "test-topic", True),
+        ("test-topic", "other-topic", False),
+        ("test-topic/+/on", "test-topic/bier/on", True),
+        ("test-topic/+/on", "test-topic/bier/off", False),
+        ("test-topic/+/on", "test-topic/bier/on/off", False),
+        ("+/on", "/on", True),
+        ("test-topic/#", "test-topic/bier/on", True),
+        ("test-topic/#", "test-topic", True),
+        ("test-topic/#", "other-topic/bier", False),
+        ("+/+/#", "hi/here/test", True),
+        ("#", "test-topic/bier/on", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker/uptime", True),
+        ("$SYS/+/uptime", "$SYS/broker/uptime", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test matching topics against a single topic filter."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_match_order_and_remove():
+    """Test values are returned in order added and can be removed."""
+    trie = TopicTrie()
+    trie.add("zigbee2mqtt/#", "all")
+    trie.add("zigbee2mqtt/lamp", "lamp")
+    trie.add("zigbee2mqtt/+", "device")
+    trie.add("zigbee2mqtt/lamp", "lamp_again")
+
+    assert trie.match("zigbee2mqtt/lamp") == ["all", "lamp", "device", "lamp_again"]
+
+    trie.remove("zigbee2mqtt/lamp", "lamp")
+    trie.remove("zigbee2mqtt/#", "all")
+    assert trie.match("zigbee2mqtt/lamp") == ["device", "lamp_again"]
+
+    trie.remove("zigbee2mqtt/lamp", "lamp_again")
+    trie.remove("zigbee2mqtt/+", "device")
+    assert trie.match("zigbee2mqtt/lamp") == []
+    assert not trie._root.children
+
+    with pytest.raises(KeyError):
+        trie.remove("zigbee2mqtt/lamp", "lamp")
@@ -10,11 +10,14 @@ from homeassistant.components.profiler import (
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_MEMORY,
     SERVICE_START,
+    SERVICE_START_INSTRUMENTATION,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_INSTRUMENTATION,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.helpers import instrumentation
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -185,3 +188,59 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_instrumentation(hass, hass_ws_client, caplog):
+    """Test we can collect, fetch and log instrumentation."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "profiler/instrumentation"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_INSTRUMENTATION, {CONF_SCAN_INTERVAL: 10}
+    )
+    await hass.async_block_till_done()
+    assert instrumentation.async_get(hass) is not None
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 2, "type": "profiler/instrumentation", "limit": 5})
+    response = await client.receive_json()
+    assert response["success"]
+    assert set(response["result"]) == {
+        "started",
+        "integrations",
+        "entities",
+        "listeners",
+    }
+    assert len(response["result"]["listeners"]) <= 5
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert "Instrumentation since" in caplog.text
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_INSTRUMENTATION, {})
+    await hass.async_block_till_done()
+    assert instrumentation.async_get(hass) is None
+    caplog.clear()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    await hass.async_block_till_done()
+    assert "Instrumentation since" not in caplog.text
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_INSTRUMENTATION, {})
+    await hass.async_block_till_done()
+    assert instrumentation.async_get(hass) is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert instrumentation.async_get(hass) is None
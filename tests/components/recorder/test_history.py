@@ -6,7 +6,8 @@ import json
 from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.models import States, process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -369,6 +370,111 @@ def test_get_significant_states_only(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_numeric_states(hass_recorder):
+    """Test numeric states are returned as columns of floats and timestamps."""
+    hass = hass_recorder()
+    entity_id = "sensor.test"
+
+    def set_state(state, **kwargs):
+        """Set the state."""
+        hass.states.set(entity_id, state, **kwargs)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    start = dt_util.utcnow() - timedelta(minutes=4)
+    points = [start + timedelta(minutes=i) for i in range(1, 5)]
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=start):
+        set_state("1.5", attributes={"unit_of_measurement": "W"})
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow", return_value=points[0]
+    ):
+        # Attribute only changes are not significant
+        set_state("1.5", attributes={"unit_of_measurement": "kW"})
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow", return_value=points[1]
+    ):
+        set_state("unavailable", attributes={"unit_of_measurement": "kW"})
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow", return_value=points[2]
+    ):
+        set_state("nan", attributes={"unit_of_measurement": "kW"})
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow", return_value=points[3]
+    ):
+        set_state("20", attributes={"unit_of_measurement": "kW"})
+
+    hist = history.get_numeric_states(hass, start - timedelta(seconds=1))
+    assert hist == {
+        entity_id: {
+            "s": [1.5, None, None, 20.0],
+            "lu": [
+                start.timestamp(),
+                points[1].timestamp(),
+                points[2].timestamp(),
+                points[3].timestamp(),
+            ],
+        }
+    }
+
+    hist = history.get_numeric_states(
+        hass,
+        start,
+        points[1] + timedelta(seconds=1),
+        entity_ids=[entity_id, "sensor.missing"],
+        include_start_time_state=False,
+        significant_changes_only=False,
+        include_attributes=True,
+    )
+    assert hist == {
+        entity_id: {
+            "s": [1.5, None],
+            "lu": [points[0].timestamp(), points[1].timestamp()],
+            "a": [{"unit_of_measurement": "kW"}, {"unit_of_measurement": "kW"}],
+        }
+    }
+
+
+def test_get_numeric_states_matches_significant_states(hass_recorder):
+    """Test numeric states select the same rows as significant states."""
+    hass = hass_recorder()
+    zero, four, _states = record_states(hass)
+    hist = history.get_significant_states(hass, zero, four)
+    numeric_hist = history.get_numeric_states(hass, zero, four)
+
+    assert list(numeric_hist) == list(hist)
+    for entity_id, states in hist.items():
+        assert numeric_hist[entity_id]["lu"] == [
+            state.last_updated.timestamp() for state in states
+        ]
+    assert numeric_hist["thermostat.test"]["s"] == [20.0, 21.0, 21.0]
+    assert numeric_hist["media_player.test"]["s"] == [None, None, None]
+
+
+def test_get_significant_states_with_legacy_attributes(hass_recorder):
+    """Test states stored before the state_attributes table are read back."""
+    hass = hass_recorder()
+    start = dt_util.utcnow() - timedelta(minutes=1)
+    hass.states.set("sensor.new", "1", {"unit_of_measurement": "W"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        session.add(
+            States(
+                domain="sensor",
+                entity_id="sensor.legacy",
+                state="2",
+                attributes='{"unit_of_measurement": "kW"}',
+                last_changed=start,
+                last_updated=start,
+            )
+        )
+
+    hist = history.get_significant_states(hass, start - timedelta(seconds=1))
+    assert hist["sensor.new"][0].attributes == {"unit_of_measurement": "W"}
+    assert hist["sensor.legacy"][0].attributes == {"unit_of_measurement": "kW"}
+
+
 def record_states(hass):
     """Record some test states.
 
@@ -30,6 +30,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -70,6 +71,7 @@ def _default_recorder(hass):
         auto_purge=True,
         keep_days=7,
         commit_interval=1,
+        bulk_write=False,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
@@ -856,6 +858,119 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
     assert "State is not JSON serializable" in caplog.text
 
 
+def test_saving_sets_old_state_bulk_write(hass_recorder):
+    """Test saving with bulk writes links old states and events."""
+    hass = hass_recorder({"bulk_write": True})
+
+    hass.states.set("test.one", "on", {"test_attr": 5})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.one", "off", {"test_attr": 5})
+    wait_recording_done(hass)
+    hass.states.set("test.two", "off", {})
+    hass.states.remove("test.one")
+    hass.bus.fire("EVENT_TEST", {"test_attr": 5})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 5
+
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+            "test.one",
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id == states[2].state_id
+        assert states[4].state is None
+        native = states[2].to_native()
+        assert native.state == "off"
+        assert native.attributes == {"test_attr": 5}
+
+        for state in states:
+            event = session.query(Events).filter_by(event_id=state.event_id).one()
+            assert event.event_type == "state_changed"
+            assert event.event_data == "{}"
+
+        db_events = list(session.query(Events).filter_by(event_type="EVENT_TEST"))
+        assert len(db_events) == 1
+        assert db_events[0].to_native().data == {"test_attr": 5}
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        state = session.query(States).order_by(States.state_id.desc()).first()
+        assert state.entity_id == "test.one"
+        assert state.old_state_id is None
+
+
+def test_saving_state_bulk_write_commit_interval_zero(hass_recorder):
+    """Test bulk writes with a commit interval of zero."""
+    hass = hass_recorder({"bulk_write": True, "commit_interval": 0})
+
+    hass.states.set("test.recorder", "on", {})
+    hass.states.set("test.recorder", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 2
+        assert states[0].event_id > 0
+        assert states[1].old_state_id == states[0].state_id
+
+
+@pytest.mark.parametrize("bulk_write", [False, True])
+def test_saving_state_shares_attributes(hass_recorder, bulk_write):
+    """Test states with the same attributes share one state_attributes row."""
+    hass = hass_recorder({"bulk_write": bulk_write})
+
+    hass.states.set("test.one", "on", {"test_attr": 5})
+    hass.states.set("test.two", "on", {"test_attr": 5})
+    hass.states.set("test.one", "off", {"test_attr": 5})
+    wait_recording_done(hass)
+    # Attributes that are not new anymore are found in the cache
+    hass.states.set("test.one", "on", {"test_attr": 5})
+    hass.states.set("test.one", "off", {"test_attr": 6})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        state_attributes = {
+            row.shared_attrs: row.attributes_id
+            for row in session.query(StateAttributes)
+        }
+        assert len(state_attributes) == 3
+        shared_id = state_attributes['{"test_attr":5}']
+
+        states = list(session.query(States).order_by(States.event_id))
+        assert [state.attributes_id for state in states] == [
+            shared_id,
+            shared_id,
+            shared_id,
+            shared_id,
+            state_attributes['{"test_attr":6}'],
+            state_attributes["{}"],
+        ]
+        assert all(state.attributes is None for state in states)
+        assert states[4].to_native().attributes == {"test_attr": 6}
+
+    # Attributes that are not in the cache are found in the database
+    hass.data[DATA_INSTANCE]._state_attributes_ids.clear()
+    hass.states.set("test.one", "on", {"test_attr": 6})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 3
+        state = session.query(States).order_by(States.state_id.desc()).first()
+        assert state.attributes_id == state_attributes['{"test_attr":6}']
+
+
 def test_run_information(hass_recorder):
     """Ensure run_information returns expected data."""
     before_start_recording = dt_util.utcnow()
@@ -1201,6 +1316,84 @@ async def test_database_lock_and_overflow(hass: HomeAssistant, tmp_path):
         assert not instance.unlock_database()
 
 
+async def test_commits_batched_while_backlogged(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test commits are batched while the queue is backed up."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+    release = threading.Event()
+
+    class BlockQueue(recorder.RecorderTask):
+        def run(self, instance: Recorder) -> None:
+            release.wait()
+
+    async def _async_fire_events_and_tick():
+        for _ in range(10):
+            hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+
+    commits = instance.commit_stats.commits
+    with patch.object(recorder, "ADAPTIVE_COMMIT_MIN_BACKLOG", 5):
+        instance.queue.put(BlockQueue())
+        await _async_fire_events_and_tick()
+        await _async_fire_events_and_tick()
+        release.set()
+        await async_wait_recording_done(hass, instance)
+
+    stats = instance.commit_stats
+    assert stats.deferred == 1
+    assert stats.commits == commits + 1
+    assert stats.last_events == 20
+    assert stats.max_backlog >= 0
+    assert stats.as_dict()["average_events"] > 0
+
+    with session_scope(hass=hass) as session:
+        assert session.query(Events).filter_by(event_type="test_event").count() == 20
+
+
+async def test_purge_commits_batched_events(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a purge commits the events held back while the queue is backed up."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+    release = threading.Event()
+    pending_at_purge = []
+
+    class BlockQueue(recorder.RecorderTask):
+        def run(self, instance: Recorder) -> None:
+            release.wait()
+
+    class NoopTask(recorder.RecorderTask):
+        def run(self, instance: Recorder) -> None:
+            pass
+
+    def _purge_old_data(instance, *args, **kwargs):
+        pending_at_purge.append(instance._pending_events)
+        return True
+
+    with patch.object(recorder, "ADAPTIVE_COMMIT_MIN_BACKLOG", 5), patch(
+        "homeassistant.components.recorder.purge.purge_old_data",
+        side_effect=_purge_old_data,
+    ):
+        instance.queue.put(BlockQueue())
+        for _ in range(10):
+            hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        instance.queue.put(recorder.PurgeTask(dt_util.utcnow(), False, False))
+        # Keep the queue backed up until the purge has run
+        for _ in range(20):
+            instance.queue.put(NoopTask())
+        release.set()
+        await async_wait_recording_done(hass, instance)
+
+    assert pending_at_purge == [0]
+    assert instance.commit_stats.last_events == 10
+
+
 async def test_database_lock_timeout(hass):
     """Test locking database timeout when recorder stopped."""
     await async_init_recorder_component(hass)
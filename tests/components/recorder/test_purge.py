@@ -4,23 +4,25 @@ import json
 import sqlite3
 from unittest.mock import MagicMock, patch
 
+import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import PurgeTask
+from homeassistant.components.recorder import PURGE_STORAGE_KEY, PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     StatisticsShortTerm,
 )
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
@@ -32,6 +34,8 @@ from .common import (
 )
 from .conftest import SetupRecorderInstanceT
 
+from tests.common import async_fire_time_changed
+
 
 async def test_purge_old_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
@@ -91,6 +95,108 @@ async def test_purge_old_states(
         assert "test.recorder2" in instance._old_states
 
 
+async def test_purge_old_states_bulk_write(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states evicts them from the bulk writer."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_write": True})
+    bulk_writer = instance._bulk_writer
+
+    await _add_test_states(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 6
+        assert states[0].old_state_id is None
+        assert states[-1].old_state_id == states[-2].state_id
+        assert bulk_writer.old_state_ids["test.recorder2"] == states[-1].state_id
+
+        finished = purge_old_data(
+            instance, dt_util.utcnow() - timedelta(days=4), repack=False
+        )
+        assert not finished
+        assert states.count() == 2
+        assert "test.recorder2" in bulk_writer.old_state_ids
+
+        finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+        assert not finished
+        assert states.count() == 0
+        assert "test.recorder2" not in bulk_writer.old_state_ids
+
+
+@pytest.mark.parametrize("bulk_write", [False, True])
+async def test_purge_old_state_attributes(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    bulk_write: bool,
+):
+    """Test state attributes are deleted once no state uses them."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_write": bulk_write})
+    utcnow = dt_util.utcnow()
+
+    for state, timestamp, attributes in (
+        ("on", utcnow - timedelta(days=11), {"old": True}),
+        ("off", utcnow - timedelta(days=11), {"shared": True}),
+        ("on", utcnow, {"shared": True}),
+    ):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=timestamp
+        ):
+            hass.states.async_set("test.recorder", state, attributes)
+            await async_wait_recording_done(hass, instance)
+
+    assert instance._state_attributes_ids.get('{"old":true}') is not None
+
+    with session_scope(hass=hass) as session:
+        state_attributes = session.query(StateAttributes)
+        assert state_attributes.count() == 2
+
+        finished = purge_old_data(instance, utcnow - timedelta(days=4), repack=False)
+        assert not finished
+        assert session.query(States).count() == 1
+        assert [row.shared_attrs for row in state_attributes] == ['{"shared":true}']
+
+    assert instance._state_attributes_ids.get('{"old":true}') is None
+    assert instance._state_attributes_ids.get('{"shared":true}') is not None
+
+
+async def test_purge_keeps_attributes_of_pending_states(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a purge keeps attributes reused by states that are not committed."""
+    instance = await async_setup_recorder_instance(hass)
+    utcnow = dt_util.utcnow()
+
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=utcnow - timedelta(days=11),
+    ):
+        hass.states.async_set("test.recorder", "off", {"shared": True})
+        await async_wait_recording_done(hass, instance)
+    attributes_id = instance._state_attributes_ids.get('{"shared":true}')
+    assert attributes_id is not None
+
+    # The new state reuses the cached attributes id but is not committed yet
+    new_state = State("test.recorder", "on", {"shared": True})
+    with patch.object(instance, "_commit_due", return_value=False):
+        instance._process_one_event(
+            Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": "test.recorder", "new_state": new_state},
+            )
+        )
+    assert instance.event_session.new
+
+    PurgeTask(utcnow - timedelta(days=4), False, False).run(instance)
+    instance._commit_event_session_or_retry()
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["on"]
+        assert states[0].attributes_id == attributes_id
+        assert session.query(StateAttributes).count() == 1
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -257,6 +363,76 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+async def test_purge_task_yields_and_tracks_progress(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    hass_storage,
+    hass_ws_client,
+):
+    """Test a purge task yields once its time is up and stores its progress."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass, instance)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with patch(
+        "homeassistant.components.recorder.MAX_PURGE_TASK_TIME", 0
+    ), patch.object(instance, "queue") as queue_mock:
+        PurgeTask(purge_before, False, False).run(instance)
+
+    assert queue_mock.put.call_args[0][0] == PurgeTask(purge_before, False, False)
+    progress = instance.purge_progress
+    assert progress.rows_to_purge == 8
+    assert progress.rows_purged == 8
+    assert progress.rows_per_second > 0
+    assert progress.seconds_remaining == 0
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["rows_to_purge"] == 8
+    assert response["result"]["rows_purged"] == 8
+    assert response["result"]["seconds_remaining"] == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass_storage[PURGE_STORAGE_KEY]["data"] == progress.as_dict()
+
+    PurgeTask(purge_before, False, False).run(instance)
+    assert instance.purge_progress is None
+
+    await client.send_json({"id": 2, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+
+async def test_purge_resumes_after_restart(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    hass_storage,
+):
+    """Test an unfinished purge is resumed with its stored progress."""
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before, False, True, 5000, 3000, 1.5)
+    hass_storage[PURGE_STORAGE_KEY] = {
+        "version": 1,
+        "key": PURGE_STORAGE_KEY,
+        "data": progress.as_dict(),
+    }
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_mock:
+        instance = await async_setup_recorder_instance(hass)
+        await async_wait_purge_done(hass, instance)
+
+    assert purge_mock.call_args[0][1:] == (purge_before, False, True)
+    assert purge_mock.call_args[1]["progress"].rows_purged == 3000
+    assert purge_mock.call_args[1]["progress"].rows_to_purge == 5000
+    assert instance.purge_progress is None
+
+
 async def test_purge_method(
     hass: HomeAssistant,
     async_setup_recorder_instance: SetupRecorderInstanceT,
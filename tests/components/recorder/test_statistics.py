@@ -15,6 +15,8 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import SQLITE_URL_PREFIX, history, statistics
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
@@ -669,6 +671,99 @@ def test_monthly_statistics(hass_recorder, caplog, timezone):
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2021-11-05 00:00:00+00:00")
+def test_statistics_rollups(hass_recorder, timezone):
+    """Test daily and monthly statistics are read from their summaries."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    wait_recording_done(hass)
+
+    zero = dt_util.as_utc(dt_util.parse_datetime("2021-09-29 00:00:00"))
+    external_statistics = [
+        {
+            "start": zero + timedelta(hours=hour),
+            "mean": float(hour % 24),
+            "min": float(hour % 24) - 1,
+            "max": float(hour % 24) + 1,
+            "last_reset": None,
+            "state": float(hour % 10),
+            "sum": float(hour),
+        }
+        for hour in range(24 * 35)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    oct_start = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    nov_start = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00"))
+    queries = [
+        (period, start_time, end_time)
+        for period in ("day", "month")
+        for start_time, end_time in (
+            (zero, None),
+            (zero + timedelta(hours=5), oct_start + timedelta(days=15, hours=7)),
+            (oct_start, nov_start),
+        )
+    ]
+    expected = {
+        query: statistics_during_period(hass, query[1], query[2], period=query[0])
+        for query in queries
+    }
+
+    while not statistics.compile_rollups(instance):
+        pass
+
+    with session_scope(hass=hass) as session:
+        monthly_starts = [
+            process_timestamp_to_utc_isoformat(row.start)
+            for row in session.query(StatisticsMonthly).order_by(
+                StatisticsMonthly.start
+            )
+        ]
+        assert monthly_starts == [
+            dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00")).isoformat(),
+            oct_start.isoformat(),
+        ]
+        # The days of September 29 up to November 2
+        assert session.query(StatisticsDaily).count() == 35
+
+    for query in queries:
+        assert (
+            statistics_during_period(hass, query[1], query[2], period=query[0])
+            == expected[query]
+        )
+
+    # Importing statistics of a summarized day summarizes it again
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [{**external_statistics[24 * 10 + 12], "max": 1000.0, "sum": 1000.0}],
+    )
+    wait_recording_done(hass)
+    hourly = statistics_during_period(
+        hass, zero, period="hour", start_time_as_datetime=True
+    )
+    assert statistics_during_period(hass, zero, period="day") == (
+        statistics._reduce_statistics_per_day(hourly)
+    )
+    assert statistics_during_period(hass, zero, period="month") == (
+        statistics._reduce_statistics_per_month(hourly)
+    )
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 def _create_engine_test(*args, **kwargs):
     """Test version of create_engine that initializes with old schema.
 
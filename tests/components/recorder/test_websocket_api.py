@@ -2,7 +2,7 @@
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
 import threading
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 from pytest import approx
@@ -263,11 +263,13 @@ async def test_recorder_info(hass, hass_ws_client):
     assert response["success"]
     assert response["result"] == {
         "backlog": 0,
+        "commits": ANY,
         "max_backlog": 30000,
         "migration_in_progress": False,
         "recording": True,
         "thread_running": True,
     }
+    assert response["result"]["commits"]["commits"] > 0
 
 
 async def test_recorder_info_no_recorder(hass, hass_ws_client):
@@ -6,7 +6,7 @@ from async_timeout import timeout
 import pytest
 import voluptuous as vol
 
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import const, messages
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -19,7 +19,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import DATA_IMPORT_TIME, DATA_SETUP_TIME, async_setup_component
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -659,6 +659,145 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities_with_unserializable_state(hass, websocket_client):
+    """Test subscribe entities reports states that cannot be serialized."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set(
+        "light.cannot_serialize", "off", {"cannot_serialize": object()}
+    )
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+
+
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe entities sends compressed states and diffs."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.not_permitted", "off", {"color": "blue"})
+    original_state = hass.states.get("light.permitted")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red"},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    hass.states.async_set(
+        "light.permitted", "on", {"effect": "help", "color": ["blue", "green"]}
+    )
+    hass.states.async_remove("light.permitted")
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "on",
+                }
+            }
+        }
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"effect": "help"}, "c": ANY, "lu": ANY},
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": ["blue", "green"]}, "c": ANY, "lu": ANY}
+            }
+        }
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"effect": "help"},
+                "c": ANY,
+                "lc": ANY,
+                "s": "on",
+            }
+        }
+    }
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribe entities filtered by entity_ids."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.two"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.two"]
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"light.two": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -1244,6 +1383,7 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": datetime.timedelta(seconds=1.5)}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1251,6 +1391,63 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": None},
     ]
+
+
+async def test_message_cache_info(hass, websocket_client, hass_admin_user):
+    """Test getting the statistics of the message caches."""
+    messages.MESSAGE_CACHE.cache_clear()
+    messages.STATES_MESSAGE_CACHE.cache_clear()
+    hass.states.async_set("light.window", "on")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    await websocket_client.receive_json()
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    await websocket_client.receive_json()
+
+    await websocket_client.send_json({"id": 7, "type": "message_cache/info"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "messages": {"hits": 0, "misses": 0, "maxsize": 512, "currsize": 0},
+        "states": {"hits": 1, "misses": 1, "maxsize": 2, "currsize": 1},
+    }
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "message_cache/info"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_entity_polling_stats(hass, websocket_client, hass_admin_user):
+    """Test getting the polling statistics of entity platforms."""
+    platform = MockEntityPlatform(hass, scan_interval=datetime.timedelta(seconds=20))
+    await platform.async_add_entities([MockEntity(should_poll=True)])
+
+    await websocket_client.send_json({"id": 5, "type": "entity/polling_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "test_domain",
+            "platform": "test_platform",
+            "config_entry_id": None,
+            "scan_interval": 20,
+            "polls": 0,
+            "skipped": 0,
+            "last_lag": 0,
+            "max_lag": 0,
+            "last_duration": 0,
+            "max_duration": 0,
+            "total_duration": 0,
+        }
+    ]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 6, "type": "entity/polling_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
@@ -1,8 +1,11 @@
 """Test Websocket API messages module."""
 
 from homeassistant.components.websocket_api.messages import (
-    _cached_event_message as lru_event_cache,
+    MESSAGE_CACHE,
+    STATES_MESSAGE_CACHE,
+    MessageCache,
     cached_event_message,
+    cached_states_result_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -25,7 +28,7 @@ async def test_cached_event_message(hass):
     await hass.async_block_till_done()
 
     assert len(events) == 2
-    lru_event_cache.cache_clear()
+    MESSAGE_CACHE.cache_clear()
 
     msg0 = cached_event_message(2, events[0])
     assert msg0 == cached_event_message(2, events[0])
@@ -35,13 +38,13 @@ async def test_cached_event_message(hass):
 
     assert msg0 != msg1
 
-    cache_info = lru_event_cache.cache_info()
+    cache_info = MESSAGE_CACHE.cache_info()
     assert cache_info.hits == 2
     assert cache_info.misses == 2
     assert cache_info.currsize == 2
 
     cached_event_message(2, events[1])
-    cache_info = lru_event_cache.cache_info()
+    cache_info = MESSAGE_CACHE.cache_info()
     assert cache_info.hits == 3
     assert cache_info.misses == 2
     assert cache_info.currsize == 2
@@ -63,7 +66,7 @@ async def test_cached_event_message_with_different_idens(hass):
 
     assert len(events) == 1
 
-    lru_event_cache.cache_clear()
+    MESSAGE_CACHE.cache_clear()
 
     msg0 = cached_event_message(2, events[0])
     msg1 = cached_event_message(3, events[0])
@@ -72,24 +75,88 @@ async def test_cached_event_message_with_different_idens(hass):
     assert msg0 != msg1
     assert msg0 != msg2
 
-    cache_info = lru_event_cache.cache_info()
+    cache_info = MESSAGE_CACHE.cache_info()
     assert cache_info.hits == 2
     assert cache_info.misses == 1
     assert cache_info.currsize == 1
 
 
+async def test_cached_states_result_message(hass):
+    """Test that the states result is shared until a state changes."""
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.door", "off")
+
+    MESSAGE_CACHE.cache_clear()
+    STATES_MESSAGE_CACHE.cache_clear()
+
+    msg0 = cached_states_result_message(2, hass.states.async_all())
+    msg1 = cached_states_result_message(3, hass.states.async_all())
+
+    assert msg0.startswith('{"id":2,')
+    assert msg1.startswith('{"id":3,')
+    assert msg0[8:] == msg1[8:]
+
+    cache_info = STATES_MESSAGE_CACHE.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+    hass.states.async_set("light.window", "off")
+    msg2 = cached_states_result_message(2, hass.states.async_all())
+
+    assert msg2 != msg0
+    assert '"state":"off","attributes":{},"last_changed"' in msg2
+    cache_info = STATES_MESSAGE_CACHE.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+    assert cache_info.currsize == 2
+
+    # States results are not evicted by event messages
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+    for index in range(MESSAGE_CACHE.maxsize + 1):
+        hass.states.async_set("light.window", str(index))
+    await hass.async_block_till_done()
+    for event in events:
+        cached_event_message(2, event)
+
+    assert cached_states_result_message(2, hass.states.async_all()) != msg2
+    assert STATES_MESSAGE_CACHE.cache_info().currsize == 2
+    assert MESSAGE_CACHE.cache_info().currsize == MESSAGE_CACHE.maxsize
+
+
+def test_message_cache_bounded():
+    """Test the message cache evicts the least recently used entries."""
+    cache = MessageCache(maxsize=2)
+    sources = [object(), object(), object()]
+
+    for source in sources:
+        cache.get(id(source), source, lambda: "msg")
+    assert cache.get(id(sources[2]), sources[2], lambda: "new") == "msg"
+    assert cache.get(id(sources[0]), sources[0], lambda: "new") == "new"
+
+    assert cache.cache_info() == (1, 4, 2, 2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
     json_str = message_to_json({"id": 1, "message": "xyz"})
 
-    assert json_str == '{"id": 1, "message": "xyz"}'
+    assert json_str == '{"id":1,"message":"xyz"}'
 
     json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
 
     assert (
         json_str2
-        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
+        == '{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
     )
     assert "Unable to serialize to JSON" in caplog.text
 
@@ -1573,3 +1573,44 @@ async def test_only_disable_device_if_all_config_entries_are_disabled(hass, regi
 
     entry1 = registry.async_get(entry1.id)
     assert not entry1.disabled
+
+
+async def test_entries_for_area_and_config_entry(hass, registry):
+    """Test looking up devices by area and config entry follows updates."""
+    device1 = registry.async_get_or_create(
+        config_entry_id="entry1", identifiers={("bridgeid", "0123")}
+    )
+    device2 = registry.async_get_or_create(
+        config_entry_id="entry1", identifiers={("bridgeid", "4567")}
+    )
+    assert device_registry.async_entries_for_config_entry(registry, "entry1") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+    device1 = registry.async_update_device(device1.id, area_id="kitchen")
+    device1 = registry.async_get_or_create(
+        config_entry_id="entry2", identifiers={("bridgeid", "0123")}
+    )
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [device1]
+    assert device_registry.async_entries_for_config_entry(registry, "entry1") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "entry2") == [
+        device1
+    ]
+
+    registry.async_clear_area_id("kitchen")
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_clear_config_entry("entry1")
+    assert device_registry.async_entries_for_config_entry(registry, "entry1") == []
+    assert device_registry.async_entries_for_config_entry(registry, "entry2") == [
+        registry.async_get(device1.id)
+    ]
+    assert registry.async_get(device2.id) is None
+
+    registry.async_remove_device(device1.id)
+    assert device_registry.async_entries_for_config_entry(registry, "entry2") == []
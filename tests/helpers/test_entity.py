@@ -212,6 +212,26 @@ async def test_async_schedule_update_ha_state(hass):
     assert update_call is True
 
 
+async def test_write_ha_state_shares_unchanged_attributes(hass):
+    """Test entity writes with unchanged attributes reuse the serialized ones."""
+    ent = MockEntity(entity_id="test.shared", state="on", icon="mdi:one")
+    ent.hass = hass
+    ent.async_write_ha_state()
+    attributes_json = hass.states.get("test.shared").attributes_json()
+
+    ent._values["state"] = "off"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.shared")
+    assert state.state == "off"
+    assert state.attributes_json() is attributes_json
+
+    ent._values["icon"] = "mdi:two"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.shared")
+    assert state.attributes["icon"] == "mdi:two"
+    assert state.attributes_json() is not attributes_json
+
+
 async def test_async_async_request_call_without_lock(hass):
     """Test for async_requests_call works without a lock."""
     updates = []
@@ -2,6 +2,8 @@
 import asyncio
 from datetime import timedelta
 import logging
+import threading
+import time
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -105,6 +107,112 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_spreads_platforms_with_same_interval(hass):
+    """Test platforms sharing a scan interval poll at staggered times."""
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    now = dt_util.utcnow()
+    first_platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    second_platform = MockEntityPlatform(
+        hass, platform_name="other_platform", scan_interval=timedelta(seconds=20)
+    )
+    first_ent = MockEntity(should_poll=True)
+    first_ent.async_update = Mock()
+    second_ent = MockEntity(should_poll=True)
+    second_ent.async_update = Mock()
+
+    with patch("homeassistant.util.dt.utcnow", return_value=now):
+        await first_platform.async_add_entities([first_ent])
+        await second_platform.async_add_entities([second_ent])
+
+    # The second platform polls up to 2 seconds earlier
+    async_fire_time_changed(hass, now + timedelta(seconds=19))
+    await hass.async_block_till_done()
+    assert not first_ent.async_update.called
+    assert second_ent.async_update.called
+
+    async_fire_time_changed(hass, now + timedelta(seconds=21))
+    await hass.async_block_till_done()
+    assert first_ent.async_update.called
+
+    stats = scheduler.async_stats()
+    assert [item["platform"] for item in stats] == [
+        "test_platform",
+        "other_platform",
+    ]
+    assert stats[0]["polls"] == 1
+    assert stats[1]["polls"] >= 1
+    assert stats[0]["scan_interval"] == 20
+    assert stats[0]["skipped"] == 0
+    assert stats[0]["last_duration"] >= 0
+
+    second_platform.async_unsub_polling()
+    assert [item["platform"] for item in scheduler.async_stats()] == ["test_platform"]
+
+    # A platform added after another one stopped polling takes its offset
+    later = now + timedelta(seconds=30)
+    third_platform = MockEntityPlatform(
+        hass, platform_name="third_platform", scan_interval=timedelta(seconds=20)
+    )
+    third_ent = MockEntity(should_poll=True)
+    third_ent.async_update = Mock()
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        await third_platform.async_add_entities([third_ent])
+
+    async_fire_time_changed(hass, later + timedelta(seconds=19))
+    await hass.async_block_till_done()
+    assert third_ent.async_update.called
+
+
+async def test_parallel_executor_updates_bounded(hass):
+    """Test polled updates running in the executor are bounded across entities."""
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    class SyncEntity(MockEntity):
+        """Mock entity that updates in the executor."""
+
+        def update(self):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+    platform = MockEntityPlatform(hass)
+    entities = [SyncEntity(should_poll=True) for _ in range(3)]
+    with patch.object(entity_platform, "MAX_PARALLEL_EXECUTOR_UPDATES", 1):
+        await platform.async_add_entities(entities)
+    async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+    await hass.async_block_till_done()
+
+    assert entities[0].parallel_updates is None
+    assert max_running == 1
+
+
+async def test_requested_executor_updates_not_bounded(hass):
+    """Test updates requested outside of polling don't wait for polling slots."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    class SyncEntity(MockEntity):
+        """Mock entity that updates in the executor."""
+
+        def update(self):
+            barrier.wait()
+
+    platform = MockEntityPlatform(hass)
+    entities = [SyncEntity(should_poll=True) for _ in range(3)]
+    with patch.object(entity_platform, "MAX_PARALLEL_EXECUTOR_UPDATES", 1):
+        await platform.async_add_entities(entities)
+        await asyncio.gather(
+            *(entity.async_update_ha_state(True) for entity in entities)
+        )
+
+    assert not barrier.broken
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1114,6 +1115,54 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes():
+    """Test the device, area and config entry indexes follow updates."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="entry",
+        device_id="device",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="entry",
+        device_id="device",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device") == [entry1]
+    assert entities.get_entries_for_device_id("device", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1, entry2]
+
+    # Entries that stay in a bucket keep their position
+    entry1_updated = attr.evolve(entry1, area_id="hall")
+    entities["test.entity1"] = entry1_updated
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("hall") == [entry1_updated]
+    assert entities.get_entries_for_config_entry_id("entry") == [
+        entry1_updated,
+        entry2,
+    ]
+
+    copied = entities.copy()
+    del entities["test.entity1"]
+    assert entities.get_entries_for_device_id("device", True) == [entry2]
+    assert entities.get_entries_for_area_id("hall") == []
+    assert copied.get_entries_for_area_id("hall") == [entry1_updated]
+
+    entities.pop("test.entity2")
+    assert entities.get_entries_for_device_id("device", True) == []
+    assert entities.get_entries_for_config_entry_id("entry") == []
+
+
 async def test_deprecated_disabled_by_str(hass, registry, caplog):
     """Test deprecated str use of disabled_by converts to enum and logs a warning."""
     entry = registry.async_get_or_create(
@@ -20,6 +20,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_timer_scheduler,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -126,6 +127,66 @@ async def test_track_point_in_time_drift_rearm(hass):
     assert len(specific_runs) == 1
 
 
+async def test_track_point_in_time_coalesced(hass):
+    """Test timers due at the same point in time share one loop timer."""
+    birthday_paulus = datetime(2086, 7, 9, 12, 0, 0, tzinfo=dt_util.UTC)
+    after_birthday = datetime(2087, 7, 9, 12, 0, 0, tzinfo=dt_util.UTC)
+    scheduler = async_get_timer_scheduler(hass)
+    handles = len(hass.loop._scheduled)
+    runs = []
+
+    @callback
+    def failing_action(now):
+        runs.append("failing")
+        raise ValueError("Boom")
+
+    unsub_first = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("first")), birthday_paulus
+    )
+    unsub_second = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("second")), birthday_paulus
+    )
+    async_track_point_in_utc_time(hass, failing_action, birthday_paulus)
+    async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("third")), birthday_paulus
+    )
+    assert len(hass.loop._scheduled) == handles + 1
+    stats = scheduler.async_stats()
+    assert stats["pending"] == 4
+    assert stats["slots"] == 1
+    assert stats["coalesced"] == 3
+
+    unsub_second()
+    unsub_second()
+    assert scheduler.async_stats()["pending"] == 3
+
+    with patch.object(hass.loop, "call_exception_handler") as mock_handler:
+        async_fire_time_changed(hass, after_birthday)
+        await hass.async_block_till_done()
+    assert runs == ["first", "failing", "third"]
+    assert len(mock_handler.mock_calls) == 1
+    assert isinstance(mock_handler.mock_calls[0][1][0]["exception"], ValueError)
+
+    # Unsubscribing after the timer fired does nothing
+    unsub_first()
+    stats = scheduler.async_stats()
+    assert stats["pending"] == 0
+    assert stats["slots"] == 0
+    assert stats["cancelled"] == 1
+    assert stats["fired"] == 3
+
+    # The loop timer of a slot is cancelled with its last timer
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("fourth")), birthday_paulus
+    )
+    handle = next(
+        task for task in hass.loop._scheduled if task.when() > hass.loop.time() + 3600
+    )
+    unsub()
+    assert handle.cancelled()
+    assert scheduler.async_stats()["slots"] == 0
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -0,0 +1,80 @@
+"""Test the instrumentation helper."""
+from homeassistant.core import callback
+from homeassistant.helpers import instrumentation
+
+from tests.common import MockEntity, MockEntityPlatform
+
+
+async def test_state_writes(hass):
+    """Test state writes are counted per integration and entity."""
+    platform = MockEntityPlatform(hass, platform_name="hue")
+    entity = MockEntity(name="Bowl", state="on")
+    await platform.async_add_entities([entity])
+    entity_id = entity.entity_id
+
+    assert instrumentation.async_get(hass) is None
+
+    active = instrumentation.async_enable(hass)
+    assert instrumentation.async_enable(hass) is active
+    assert instrumentation.async_get(hass) is active
+
+    entity.async_write_ha_state()
+    entity._values["state"] = "off"
+    entity.async_write_ha_state()
+
+    # Entities without a platform count towards their domain
+    platformless = MockEntity(name="Kitchen", state="on")
+    platformless.hass = hass
+    platformless.entity_id = "light.kitchen"
+    platformless.async_write_ha_state()
+
+    stats = active.async_as_dict()
+    assert stats["integrations"]["hue"]["writes"] == 2
+    assert stats["integrations"]["hue"]["suppressed"] == 1
+    assert stats["integrations"]["light"]["writes"] == 1
+    assert stats["entities"][entity_id]["writes"] == 2
+    assert stats["entities"][entity_id]["suppressed"] == 1
+    assert stats["entities"][entity_id]["seconds"] > 0
+    assert "hue: 2 writes (1 suppressed)" in active.async_summary(10)
+
+    assert instrumentation.async_disable(hass) is active
+    assert instrumentation.async_get(hass) is None
+    entity._values["state"] = "on"
+    entity.async_write_ha_state()
+    assert active.entities[entity_id].writes == 2
+
+
+async def test_event_listeners(hass):
+    """Test the calls of event listeners are counted and timed."""
+    calls = []
+
+    @callback
+    def _callback_listener(event):
+        calls.append(event)
+
+    async def _coroutine_listener(event):
+        calls.append(event)
+
+    hass.bus.async_listen("test_event", _callback_listener)
+    hass.bus.async_listen("test_event", _coroutine_listener)
+
+    prefix = f"{__name__}.test_event_listeners.<locals>"
+    active = instrumentation.async_enable(hass)
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    listeners = active.async_as_dict()["listeners"]
+    callback_stats = listeners[f"{prefix}._callback_listener"]
+    assert callback_stats["calls"] == 2
+    assert callback_stats["seconds"] > 0
+    # Coroutine listeners do not run to completion in one go
+    assert listeners[f"{prefix}._coroutine_listener"] == {"calls": 2, "seconds": 0.0}
+    assert list(listeners)[0] == f"{prefix}._callback_listener"
+
+    instrumentation.async_disable(hass)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 6
+    assert active.listeners[f"{prefix}._callback_listener"].calls == 2
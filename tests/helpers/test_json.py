@@ -1,10 +1,19 @@
 """Test Home Assistant remote methods and classes."""
+from collections import namedtuple
 import datetime
+import json
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers import json as json_helper
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+    json_dumps_pretty,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -64,3 +73,83 @@ def test_extended_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+@pytest.mark.parametrize(
+    "dump",
+    (json_dumps, json_helper._json_dumps_stdlib),  # pylint: disable=protected-access
+)
+def test_json_dumps(dump):
+    """Test the JSON backend matches the stdlib encoder."""
+    now = dt_util.utcnow()
+    point = namedtuple("Point", ["x", "y"])
+    data = {
+        "state": core.State("test.test", "hello", {"last_seen": now}),
+        "time": now,
+        "set": {"milk"},
+        "tuple": (1, 2.5),
+        "namedtuple": point(1, 2),
+        1: "int key",
+    }
+
+    assert json.loads(dump(data)) == json.loads(json.dumps(data, cls=JSONEncoder))
+    assert json.loads(json_bytes(data)) == json.loads(dump(data))
+    assert json.loads(json_dumps_pretty(data)) == json.loads(dump(data))
+
+
+@pytest.mark.parametrize(
+    "dump",
+    (json_dumps, json_helper._json_dumps_stdlib),  # pylint: disable=protected-access
+)
+def test_json_dumps_raises(dump):
+    """Test the JSON backend raises TypeError on unsupported types."""
+    with pytest.raises(TypeError):
+        dump({"bad": object()})
+
+
+@pytest.mark.parametrize(
+    "dump",
+    (
+        json_dumps,
+        json_bytes,
+        json_helper._json_dumps_stdlib,  # pylint: disable=protected-access
+    ),
+)
+@pytest.mark.parametrize(
+    "data",
+    (
+        float("NaN"),
+        {"value": float("inf")},
+        {"values": [None, (1.0, float("-inf"))]},
+        core.State("test.test", "on", {"value": float("NaN")}),
+    ),
+)
+def test_json_dumps_non_finite_floats(dump, data):
+    """Test both backends raise ValueError instead of producing invalid JSON."""
+    with pytest.raises(ValueError):
+        dump(data)
+
+
+def test_json_dumps_null():
+    """Test None is still encoded as null."""
+    assert (
+        json_dumps({"value": None, "values": [1.5]}) == '{"value":null,"values":[1.5]}'
+    )
+    assert json_dumps({"value": None, "text": "null"}) == (
+        '{"value":null,"text":"null"}'
+    )
+    with pytest.raises(ValueError):
+        json_dumps({"value": None, "values": [float("NaN")]})
+    with pytest.raises(ValueError):
+        json_dumps(
+            {
+                "states": [core.State("test.test", "on", {"value": None})] * 2,
+                "value": float("NaN"),
+            }
+        )
+
+
+def test_json_dumps_pretty():
+    """Test indented json matches the stdlib encoder."""
+    data = {"key": "value", "list": [1, {"nested": None}], "empty": {}}
+    assert json_dumps_pretty(data) == json.dumps(data, indent=4)
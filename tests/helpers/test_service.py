@@ -1090,6 +1090,53 @@ async def test_extract_from_service_area_id(hass, area_mock):
     ]
 
 
+async def test_extract_from_service_area_id_cache(hass, area_mock):
+    """Test resolved targets are cached until a registry is updated."""
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "test-area"})
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {
+        "light.in_area",
+        "light.assigned_to_area",
+    }
+    # Callers may modify the result without affecting the cache
+    selected.indirectly_referenced.clear()
+
+    with patch("homeassistant.helpers.service._async_resolve_target") as mock_resolve:
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert not mock_resolve.called
+    assert selected.indirectly_referenced == {
+        "light.in_area",
+        "light.assigned_to_area",
+    }
+
+    # The cache is cleared before the registry updated event is handled
+    registry = ent_reg.async_get(hass)
+    registry.async_update_entity("light.diff_area", area_id="test-area")
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.diff_area",
+    }
+
+
+async def test_extract_from_service_area_id_cache_device_update(hass, area_mock):
+    """Test resolved targets are not reused after a device changes area."""
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "test-area"})
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert "light.diff_area" not in selected.indirectly_referenced
+
+    registry = dev_reg.async_get(hass)
+    device = next(
+        device for device in registry.devices.values() if device.area_id == "diff-area"
+    )
+    registry.async_update_device(device.id, area_id="test-area")
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert "light.diff_area" in selected.indirectly_referenced
+
+
 async def test_entity_service_call_warn_referenced(hass, caplog):
     """Test we only warn for referenced entities in entity_service_call."""
     call = ha.ServiceCall(
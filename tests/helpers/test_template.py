@@ -1,5 +1,6 @@
 """Test Home Assistant template helper methods."""
 from datetime import datetime, timedelta
+import gc
 import logging
 import math
 import random
@@ -3225,35 +3226,66 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_cache_garbage_collection(hass):
+    """Test compiled templates are shared while in use and their code is kept."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    template.COMPILE_CACHE.cache_clear()
+    tpl = template.Template((template_string), hass)
+    assert tpl.async_render() == "foo=x%26y&bar=42"
+    env = hass.data[template._ENVIRONMENT]  # pylint: disable=protected-access
+    assert env.template_cache.get(template_string) is tpl._compiled
 
-    tpl2 = template.Template(
-        (template_string),
-    )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    tpl2 = template.Template((template_string), hass)
+    assert tpl2.async_render() == "foo=x%26y&bar=42"
+    assert tpl2._compiled is tpl._compiled
+    assert template.COMPILE_CACHE.cache_info() == (1, 1, 4096, 1)
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert env.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    # Jinja templates refer to themselves from their namespace
+    gc.collect()
+    assert not env.template_cache.get(template_string)
+
+    # The code is still cached when the template is used again, e.g. on reload
+    tpl3 = template.Template((template_string), hass)
+    assert tpl3.async_render() == "foo=x%26y&bar=42"
+    assert template.COMPILE_CACHE.cache_info() == (2, 1, 4096, 1)
+
+
+async def test_compile_cache_not_shared_without_hass(hass):
+    """Test code compiled with hass is not used by templates without hass."""
+    template_string = "{{ 'x' | area_entities }}"
+    assert template.Template(template_string, hass).async_render() == []
+
+    with pytest.raises(TemplateError, match="No filter named 'area_entities'"):
+        template.Template(template_string).ensure_valid()
+
+
+def test_compile_cache_lru():
+    """Test the compile cache evicts the least recently used code."""
+    cache = template.CompileCache(maxsize=2)
+    compiled = []
+
+    def compile_source(source):
+        compiled.append(source)
+        return compile(source, "<template>", "eval")
+
+    code_1 = cache.get("default", "1", compile_source)
+    cache.get("default", "2", compile_source)
+    assert cache.get("default", "1", compile_source) is code_1
+    cache.get("limited", "1", compile_source)
+    assert cache.cache_info() == (1, 3, 2, 2)
+
+    # "2" was used least recently
+    cache.get("default", "1", compile_source)
+    cache.get("default", "2", compile_source)
+    assert compiled == ["1", "2", "1", "2"]
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
 
 
 def test_is_template_string():
@@ -12,6 +12,7 @@ import homeassistant.config as config_util
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.setup import DATA_IMPORT_TIME
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -302,6 +303,34 @@ async def test_setup_after_deps_not_trigger_load(hass):
     assert "second_dep" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_preload_integrations(hass):
+    """Test integrations and their config flows are imported in the executor."""
+    imported = []
+    integration = mock_integration(
+        hass,
+        MockModule(domain="preloaded", partial_manifest={"config_flow": True}),
+    )
+    integration._import_platform = lambda platform: imported.append(platform)
+    needs_requirements = mock_integration(
+        hass,
+        MockModule(
+            domain="needs_requirements",
+            requirements=["package-that-is-not-installed==1.0"],
+        ),
+    )
+
+    with patch.object(hass.config, "skip_pip", False):
+        await bootstrap._async_preload_integrations(
+            hass, [integration, needs_requirements]
+        )
+
+    assert imported == ["config_flow"]
+    import_time = hass.data[DATA_IMPORT_TIME]
+    assert import_time["preloaded"].total_seconds() >= 0
+    assert "needs_requirements" not in import_time
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_not_present(hass):
     """Test after_dependencies when referenced integration doesn't exist."""
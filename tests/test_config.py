@@ -3,6 +3,7 @@
 from collections import OrderedDict
 import copy
 import os
+import shutil
 from unittest import mock
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -34,6 +35,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
 from homeassistant.util.yaml import SECRET_YAML
+from homeassistant.util.yaml.const import YAML_CACHE_DIR
 
 from tests.common import get_test_config_dir, patch_yaml_files
 
@@ -44,6 +46,7 @@ VERSION_PATH = os.path.join(CONFIG_DIR, config_util.VERSION_FILE)
 AUTOMATIONS_PATH = os.path.join(CONFIG_DIR, config_util.AUTOMATION_CONFIG_PATH)
 SCRIPTS_PATH = os.path.join(CONFIG_DIR, config_util.SCRIPT_CONFIG_PATH)
 SCENES_PATH = os.path.join(CONFIG_DIR, config_util.SCENE_CONFIG_PATH)
+YAML_CACHE_PATH = os.path.join(CONFIG_DIR, YAML_CACHE_DIR)
 ORIG_TIMEZONE = dt_util.DEFAULT_TIME_ZONE
 
 
@@ -75,6 +78,8 @@ def teardown():
     if os.path.isfile(SCENES_PATH):
         os.remove(SCENES_PATH)
 
+    shutil.rmtree(YAML_CACHE_PATH, ignore_errors=True)
+
 
 async def test_create_default_config(hass):
     """Test creation of default config."""
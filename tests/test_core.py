@@ -383,6 +383,123 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test the JSON encoding of a State is cached."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+        context=ha.Context(id="01GZZZ"),
+    )
+    expected = (
+        '{"entity_id":"happy.happy","state":"on","attributes":{"pig":"dog"},'
+        '"last_changed":"1984-12-08T12:00:00","last_updated":"1984-12-08T12:00:00",'
+        '"context":{"id":"01GZZZ","parent_id":null,"user_id":null}}'
+    )
+    assert state.as_dict_json() == expected
+    assert state.as_dict_json() is state.as_dict_json()
+    assert state.attributes_json() == '{"pig":"dog"}'
+
+
+async def test_statemachine_shares_unchanged_attributes(hass):
+    """Test a new state reuses the attributes of the old one if unchanged."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    old_state = hass.states.get("light.bowl")
+    attributes_json = old_state.attributes_json()
+    compressed_attributes = old_state.as_compressed_state()["a"]
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    assert state.attributes_json() is attributes_json
+    assert state.as_compressed_state()["a"] is compressed_attributes
+    assert state.as_dict()["attributes"] is compressed_attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    state = hass.states.get("light.bowl")
+    assert state.attributes == {"brightness": 50}
+    assert state.attributes_json() == '{"brightness":50}'
+
+
+async def test_statemachine_reserializes_equal_attributes(hass):
+    """Test attributes are serialized again if they may serialize differently."""
+    items = [1]
+    hass.states.async_set("light.bowl", "on", {"items": items, "level": 1})
+    assert hass.states.get("light.bowl").attributes_json() == (
+        '{"items":[1],"level":1}'
+    )
+
+    items.append(2)
+    hass.states.async_set("light.bowl", "off", {"items": items, "level": True})
+    state = hass.states.get("light.bowl")
+    assert state.attributes == {"items": [1, 2], "level": True}
+    assert state.attributes_json() == '{"items":[1,2],"level":true}'
+    assert state.as_dict()["attributes"] == {"items": [1, 2], "level": True}
+
+
+async def test_statemachine_shares_attributes_strictly():
+    """Test only attributes that serialize the same are considered unchanged."""
+    same = ha._same_attributes
+    assert same({"a": 1, "b": ("x", [1.5])}, {"a": 1, "b": ("x", [1.5])})
+    assert same({"a": {"b": None}}, {"a": {"b": None}})
+    assert not same({"a": 1}, {"a": 1.0})
+    assert not same({"a": 1}, {"a": True})
+    assert not same({"a": 1}, {"a": 1, "b": 2})
+    assert not same({"a": 1}, {"b": 1})
+    assert not same({"a": float("nan")}, {"a": float("nan")})
+    items = [1]
+    assert not same({"a": items}, {"a": items})
+    assert not same({"a": (items,)}, {"a": (items,)})
+    assert not same({"a": object()}, {"a": object()})
+
+
+def test_state_as_compressed_state():
+    """Test a State as compressed state."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = {
+        "a": {"pig": "dog"},
+        "c": state.context.id,
+        "lc": last_time.timestamp(),
+        "s": "on",
+    }
+    as_compressed_state = state.as_compressed_state()
+    assert as_compressed_state == expected
+    # 2nd time to verify cache
+    assert state.as_compressed_state() == expected
+    assert state.as_compressed_state() is as_compressed_state
+
+
+def test_state_as_compressed_state_unique_last_updated():
+    """Test a State as compressed state where last_changed is not last_updated."""
+    last_changed = datetime(1984, 12, 8, 11, 0, 0, tzinfo=dt_util.UTC)
+    last_updated = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    context = ha.Context(user_id="abc")
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_updated,
+        last_changed=last_changed,
+        context=context,
+    )
+    assert state.as_compressed_state() == {
+        "a": {"pig": "dog"},
+        "c": context.as_dict(),
+        "lc": last_changed.timestamp(),
+        "lu": last_updated.timestamp(),
+        "s": "on",
+    }
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -547,6 +664,78 @@ async def test_eventbus_coroutine_event_listener(hass):
     assert len(coroutine_calls) == 1
 
 
+async def test_eventbus_match_all_listeners_order(hass):
+    """Test MATCH_ALL listeners run first and follow listen/unlisten changes."""
+    calls = []
+
+    @ha.callback
+    def match_all_listener(event):
+        calls.append(("all", event.event_type))
+
+    @ha.callback
+    def listener(event):
+        calls.append(("test", event.event_type))
+
+    unsub_test = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == [("test", "test")]
+
+    calls.clear()
+    unsub_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    await hass.async_block_till_done()
+    assert calls == [("all", "test"), ("test", "test"), ("all", "other")]
+
+    calls.clear()
+    unsub_test()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == [("all", "test")]
+
+    calls.clear()
+    unsub_all()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+
+async def test_eventbus_listen_once_does_not_skip_other_listeners(hass):
+    """Test removing a listener while firing does not skip the next one."""
+    calls = []
+
+    @ha.callback
+    def once_listener(event):
+        calls.append("once")
+
+    @ha.callback
+    def listener(event):
+        calls.append("listener")
+
+    hass.bus.async_listen_once("test", once_listener)
+    hass.bus.async_listen("test", listener)
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["once", "listener", "listener"]
+
+
+async def test_eventbus_close_event_skips_match_all(hass):
+    """Test EVENT_HOMEASSISTANT_CLOSE is not sent to MATCH_ALL listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        calls.append(event.event_type)
+
+    hass.bus.async_listen(MATCH_ALL, listener)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert calls == []
+
+
 async def test_eventbus_max_length_exceeded(hass):
     """Test that an exception is raised when the max character length is exceeded."""
 
@@ -1081,7 +1270,8 @@ def test_create_timer(mock_monotonic, loop):
         callback(target)
 
     assert len(hass.bus.async_listen_once.mock_calls) == 1
-    assert len(hass.bus.async_fire.mock_calls) == 1
+    assert len(hass.bus.async_fire_tick.mock_calls) == 1
+    assert len(hass.bus.async_fire.mock_calls) == 0
     assert len(hass.loop.call_later.mock_calls) == 2
 
     event_type, callback = hass.bus.async_listen_once.mock_calls[0][1]
@@ -1093,9 +1283,34 @@ def test_create_timer(mock_monotonic, loop):
     assert callback is fire_time_event
     assert abs(target - 12.2) < 0.001
 
-    event_type, event_data = hass.bus.async_fire.mock_calls[0][1]
-    assert event_type == EVENT_TIME_CHANGED
-    assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
+    now, _ = hass.bus.async_fire_tick.mock_calls[0][1]
+    assert now == datetime(2018, 12, 31, 3, 4, 6, 100000)
+
+
+async def test_tick_listeners(hass):
+    """Test tick listeners and firing EVENT_TIME_CHANGED only when listened to."""
+    now = dt_util.utcnow()
+    ticks = []
+    all_events = async_capture_events(hass, MATCH_ALL)
+
+    unsub = hass.bus.async_listen_tick(ticks.append)
+    hass.bus.async_fire_tick(now)
+    await hass.async_block_till_done()
+    assert ticks == [now]
+    assert not all_events
+
+    time_changed = async_capture_events(hass, EVENT_TIME_CHANGED)
+    hass.bus.async_fire_tick(now)
+    await hass.async_block_till_done()
+    assert ticks == [now, now]
+    assert len(time_changed) == 1
+    assert time_changed[0].data == {ATTR_NOW: now}
+    assert [event.event_type for event in all_events] == [EVENT_TIME_CHANGED]
+
+    unsub()
+    hass.bus.async_fire_tick(now)
+    await hass.async_block_till_done()
+    assert ticks == [now, now]
 
 
 @patch("homeassistant.core.monotonic")
@@ -1125,13 +1340,10 @@ def test_timer_out_of_sync(mock_monotonic, loop):
     ):
         callback(target)
 
-        _, event_0_args, event_0_kwargs = hass.bus.async_fire.mock_calls[0]
-        event_context_0 = event_0_kwargs["context"]
-
-        event_type_0, _ = event_0_args
-        assert event_type_0 == EVENT_TIME_CHANGED
+        _, tick_args, _ = hass.bus.async_fire_tick.mock_calls[0]
+        _, event_context_0 = tick_args
 
-        _, event_1_args, event_1_kwargs = hass.bus.async_fire.mock_calls[1]
+        _, event_1_args, event_1_kwargs = hass.bus.async_fire.mock_calls[0]
         event_type_1, event_data_1 = event_1_args
         event_context_1 = event_1_kwargs["context"]
 
@@ -1547,6 +1759,48 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_domain_index(hass):
+    """Test domain filtered queries stay in sync with set and remove."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("light.Bowl", "off")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert [state.state for state in hass.states.async_all("light")] == [
+        "off",
+        "on",
+    ]
+    assert hass.states.async_entity_ids(["switch", "light"]) == [
+        "light.bowl",
+        "switch.link",
+        "light.frog",
+    ]
+    assert [
+        state.entity_id for state in hass.states.async_all(("switch", "light"))
+    ] == [
+        "light.bowl",
+        "switch.link",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids(["light", "light"]) == [
+        "light.bowl",
+        "light.frog",
+    ]
+    assert len(hass.states.async_all(["light", "light"])) == 2
+    assert hass.states.async_entity_ids_count(["light", "vacuum"]) == 2
+    assert hass.states.async_entity_ids_count(["light", "light"]) == 2
+
+    assert hass.states.async_remove("switch.link")
+    assert hass.states.async_entity_ids("switch") == []
+    assert hass.states.async_all("switch") == []
+    assert hass.states.async_entity_ids_count("switch") == 0
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.async_entity_ids("light") == ["light.frog", "light.bowl"]
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
@@ -107,6 +107,14 @@ def test_custom_encoder():
     assert data == "9"
 
 
+def test_custom_dump():
+    """Test serializing with a custom dump function."""
+    fname = _path_for("test7")
+    save_json(fname, {"hello": "world"}, dump=lambda data: '"9"')
+    data = load_json(fname)
+    assert data == "9"
+
+
 def test_find_unserializable_data():
     """Find unserializeable data."""
     assert find_paths_unserializable_data(1) == {}
@@ -445,3 +445,118 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_fast_loader_references():
+    """Test the fast loader adds the same references as the line loader."""
+    conf = "key:\n  - one\n  - sub: value\nother: text\n"
+    docs = []
+    for loader in (yaml_loader.FastSafeLoader, yaml_loader.SafeLineLoader):
+        with io.StringIO(conf) as file:
+            file.name = "configuration.yaml"
+            docs.append(yaml_loader.yaml.load(file, Loader=loader))
+
+    fast, line = docs
+    assert fast == line
+    for fast_obj, line_obj in (
+        (fast, line),
+        (fast["key"], line["key"]),
+        (fast["key"][1], line["key"][1]),
+    ):
+        assert fast_obj.__config_file__ == line_obj.__config_file__
+        assert fast_obj.__config_file__ == "configuration.yaml"
+        assert fast_obj.__line__ == line_obj.__line__
+
+
+def test_parsed_yaml_cache(tmp_path):
+    """Test parsed files are cached until they change."""
+    secrets = yaml_loader.Secrets(tmp_path)
+    automations = tmp_path / "automations.yaml"
+    automations.write_text("- alias: one\n  trigger: []\n")
+
+    assert yaml.load_yaml(str(automations), secrets) == [
+        {"alias": "one", "trigger": []}
+    ]
+    assert len(list((tmp_path / yaml.const.YAML_CACHE_DIR).iterdir())) == 1
+
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as parse_yaml:
+        doc = yaml.load_yaml(str(automations), secrets)
+        assert doc == [{"alias": "one", "trigger": []}]
+        assert doc.__config_file__ == str(automations)
+        assert doc[0].__line__ == 0
+        assert not parse_yaml.called
+
+        automations.write_text("- alias: changed\n  trigger: []\n")
+        assert yaml.load_yaml(str(automations), secrets) == [
+            {"alias": "changed", "trigger": []}
+        ]
+        assert parse_yaml.called
+
+    # Files loaded without secrets are not part of the configuration
+    services = tmp_path / "services.yaml"
+    services.write_text("reload:\n")
+    assert yaml.load_yaml(str(services)) == {"reload": None}
+    assert len(list((tmp_path / yaml.const.YAML_CACHE_DIR).iterdir())) == 1
+
+
+def test_parsed_yaml_cache_same_size_and_mtime(tmp_path):
+    """Test edits are seen when the size and modification time are unchanged."""
+    secrets = yaml_loader.Secrets(tmp_path)
+    automations = tmp_path / "automations.yaml"
+    automations.write_text("- alias: one\n")
+    stat = automations.stat()
+    assert yaml.load_yaml(str(automations), secrets) == [{"alias": "one"}]
+
+    automations.write_text("- alias: two\n")
+    os.utime(automations, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert yaml.load_yaml(str(automations), secrets) == [{"alias": "two"}]
+
+
+def test_parsed_yaml_cache_prune(tmp_path):
+    """Test entries of deleted files are pruned."""
+    secrets = yaml_loader.Secrets(tmp_path)
+    cache_dir = tmp_path / yaml.const.YAML_CACHE_DIR
+    kept = tmp_path / "kept.yaml"
+    kept.write_text("kept: true\n")
+    removed = tmp_path / "removed.yaml"
+    removed.write_text("removed: true\n")
+    yaml.load_yaml(str(kept), secrets)
+    yaml.load_yaml(str(removed), secrets)
+    (cache_dir / "corrupt.pickle").write_bytes(b"not a pickle")
+    assert len(list(cache_dir.iterdir())) == 3
+
+    removed.unlink()
+    yaml_loader.ParsedYamlCache(tmp_path).prune()
+    assert len(list(cache_dir.iterdir())) == 1
+
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as parse_yaml:
+        assert yaml.load_yaml(str(kept), secrets) == {"kept": True}
+        assert not parse_yaml.called
+
+
+def test_parsed_yaml_cache_skips_secrets(tmp_path):
+    """Test documents using secrets or includes are not cached."""
+    secrets = yaml_loader.Secrets(tmp_path)
+    (tmp_path / yaml.SECRET_YAML).write_text("password: old\n")
+    (tmp_path / "included.yaml").write_text("included: true\n")
+    configuration = tmp_path / "configuration.yaml"
+    configuration.write_text(
+        "password: !secret password\nsub: !include included.yaml\n"
+    )
+
+    assert yaml.load_yaml(str(configuration), secrets) == {
+        "password": "old",
+        "sub": {"included": True},
+    }
+    # Only the included file without secrets is cached
+    assert len(list((tmp_path / yaml.const.YAML_CACHE_DIR).iterdir())) == 1
+
+    (tmp_path / yaml.SECRET_YAML).write_text("password: new\n")
+    assert yaml.load_yaml(str(configuration), yaml_loader.Secrets(tmp_path)) == {
+        "password": "new",
+        "sub": {"included": True},
+    }